@@ -2,13 +2,14 @@
 """Example script demonstrating the content creation agent."""
 
 import os
-from src.orchestrator import ContentCreationOrchestrator
-from src.utils import Config, setup_logger
+
+from src.utils import Config, setup_logger, skip_unused_record_details
 
 
 def main():
     """Run an example content creation workflow."""
     # Setup logging
+    skip_unused_record_details()
     logger = setup_logger(level="INFO")
 
     print("=" * 60)
@@ -23,6 +24,10 @@ def main():
         print("\nOr create a .env file based on .env.example")
         return
 
+    # Deferred so the key check above does not pay for LangChain/OpenAI imports
+    from src.orchestrator import ContentCreationOrchestrator
+
+    orchestrator = None
     try:
         # Load configuration
         print("\n📋 Loading configuration...")
@@ -79,6 +84,9 @@ def main():
     except Exception as e:
         logger.exception("An error occurred")
         print(f"\n❌ Error: {str(e)}")
+    finally:
+        if orchestrator is not None:
+            orchestrator.close()
 
 
 if __name__ == "__main__":
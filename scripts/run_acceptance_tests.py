@@ -1,12 +1,19 @@
 """
 Script to run acceptance tests for Agentic Writer.
 Generates real articles using the OpenAI API to verify quality across different styles and audiences.
+
+Pass --batch to generate the reader personas for all tests through the
+OpenAI Batch API (half price, but results can take minutes to hours). A batch
+still running after --batch-timeout seconds is cancelled and the personas are
+generated with concurrent live calls instead.
 """
 
+import argparse
+import json
 import os
 import sys
-import logging
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,9 +22,23 @@ from src.orchestrator import ContentCreationOrchestrator
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 
+# Seconds between status checks of a submitted batch, and the default time to
+# wait for it before falling back to live calls
+BATCH_POLL_INTERVAL = 30
+DEFAULT_BATCH_TIMEOUT = 60 * 60
+
+# Map LangChain message types to OpenAI chat roles
+_MESSAGE_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+def run_acceptance_tests(use_batch_api=False, batch_timeout=DEFAULT_BATCH_TIMEOUT):
+    """Run a set of acceptance tests with real API calls.
 
-def run_acceptance_tests():
-    """Run a set of acceptance tests with real API calls."""
+    Args:
+        use_batch_api: Generate personas through the OpenAI Batch API
+        batch_timeout: Seconds to wait for the persona batch before cancelling
+            it and falling back to live calls
+    """
 
     # Setup
     logger = setup_logger(name="acceptance_tests", level="INFO")
@@ -54,37 +75,196 @@ def run_acceptance_tests():
 
     logger.info(f"Starting acceptance tests. Output directory: {output_base}")
 
-    for i, test in enumerate(tests, 1):
-        logger.info(f"\n--- Running Test {i}/{len(tests)} ---")
-        logger.info(f"Topic: {test['topic']}")
-        logger.info(f"Style: {test['style']}")
-        logger.info(f"Audience: {test['audience']}")
+    # Persona prompts are the only ones that do not depend on an earlier
+    # stage, so they are the part of the pipeline that can be batched.
+    orchestrator = ContentCreationOrchestrator(config)
+    try:
+        personas = _generate_personas(
+            config,
+            orchestrator.audience_strategist,
+            tests,
+            logger,
+            use_batch_api,
+            batch_timeout,
+        )
+    finally:
+        orchestrator.close()
+
+    # Tests share no state, so run them concurrently; each one builds its own
+    # orchestrator and the pipeline is dominated by network-bound API calls.
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {
+            executor.submit(_run_test, test, config, output_base, persona): (i, test)
+            for i, (test, persona) in enumerate(zip(tests, personas), 1)
+        }
+        for future in as_completed(futures):
+            i, test = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                results = {"status": "failed", "error": str(e)}
+            _log_result(logger, i, len(tests), test, results)
+
+    logger.info(f"\nAll tests completed. Check {output_base} for results.")
+
+
+def _generate_personas(config, strategist, tests, logger, use_batch_api, timeout):
+    """Generate the reader persona for every test before the tests run.
+
+    Personas the Batch API did not return, or all of them when it is not
+    used, come from one concurrent analyze_batch call. If that fails too, the
+    entries stay None and each test's orchestrator analyzes its own audience.
+
+    Returns:
+        List of personas in test order
+    """
+    personas = [None] * len(tests)
+    if use_batch_api:
+        try:
+            personas = _generate_personas_with_batch_api(
+                config, strategist, tests, logger, timeout
+            )
+        except Exception as e:
+            logger.error(f"Persona batch failed, falling back to live calls: {e}")
+
+    missing = [i for i, persona in enumerate(personas) if persona is None]
+    if missing:
+        try:
+            generated = strategist.analyze_batch(
+                [(tests[i]["topic"], tests[i]["audience"]) for i in missing]
+            )
+        except Exception as e:
+            logger.error(f"Persona generation failed, leaving it to each test: {e}")
+        else:
+            for i, persona in zip(missing, generated):
+                personas[i] = persona
+
+    return personas
 
-        orchestrator = ContentCreationOrchestrator(config)
 
-        # Create a specific subfolder for this test run to keep things organized
-        # or just use the base folder. Let's use the base folder but prefix filenames?
-        # The orchestrator handles filenames based on topic.
+def _generate_personas_with_batch_api(config, strategist, tests, logger, timeout):
+    """Generate the reader persona for every test in one OpenAI batch.
 
-        results = orchestrator.create_content(
+    Args:
+        config: Configuration with the OpenAI key and model settings
+        strategist: Audience strategist that builds and parses persona prompts
+        tests: Acceptance test specs
+        logger: Logger for progress messages
+        timeout: Seconds to wait for the batch before cancelling it
+
+    Returns:
+        List of personas in test order; entries are None when the batch did
+        not return a result for that test
+
+    Raises:
+        TimeoutError: If the batch has not finished within the timeout
+        RuntimeError: If the batch ends without completing
+    """
+    from openai import OpenAI
+
+    client = OpenAI(api_key=config.openai_api_key)
+
+    lines = []
+    for i, test in enumerate(tests):
+        messages = strategist.persona_messages(test["topic"], test["audience"])
+        request = {
+            "custom_id": f"persona-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": config.openai_model,
+                "temperature": config.temperature,
+                "response_format": {"type": "json_object"},
+                "messages": [
+                    {"role": _MESSAGE_ROLES[m.type], "content": m.content}
+                    for m in messages
+                ],
+            },
+        }
+        lines.append(json.dumps(request))
+
+    batch_input = client.files.create(
+        file=("personas.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted persona batch {batch.id}, waiting for results...")
+
+    deadline = time.monotonic() + timeout
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            client.batches.cancel(batch.id)
+            raise TimeoutError(f"Batch {batch.id} did not finish in {timeout}s")
+        time.sleep(min(BATCH_POLL_INTERVAL, remaining))
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    personas = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        record = json.loads(line)
+        if not record.get("response"):
+            continue
+        content = record["response"]["body"]["choices"][0]["message"]["content"]
+        personas[record["custom_id"]] = strategist.parse_persona(content)
+
+    return [personas.get(f"persona-{i}") for i in range(len(tests))]
+
+
+def _run_test(test, config, output_base, persona=None):
+    """Run a single acceptance test with its own orchestrator."""
+    orchestrator = ContentCreationOrchestrator(config)
+
+    # The orchestrator handles filenames based on topic, so all tests can
+    # share the base output folder.
+    try:
+        return orchestrator.create_content(
             topic=test["topic"],
             style=test["style"],
             target_audience=test["audience"],
             platforms=["file"],
             output_dir=output_base,
+            persona=persona,
         )
+    finally:
+        orchestrator.close()
 
-        if results["status"] == "completed":
-            logger.info(f"✅ Test {i} Passed")
-            article = results.get("article", {})
-            logger.info(f"Title: {article.get('title')}")
-            logger.info(f"Word Count: {article.get('word_count')}")
-        else:
-            logger.error(f"❌ Test {i} Failed")
-            logger.error(results.get("error"))
 
-    logger.info(f"\nAll tests completed. Check {output_base} for results.")
+def _log_result(logger, i, total, test, results):
+    """Log the outcome of a single acceptance test."""
+    logger.info(f"\n--- Test {i}/{total} ---")
+    logger.info(f"Topic: {test['topic']}")
+    logger.info(f"Style: {test['style']}")
+    logger.info(f"Audience: {test['audience']}")
+
+    if results["status"] == "completed":
+        logger.info(f"✅ Test {i} Passed")
+        article = results.get("article", {})
+        logger.info(f"Title: {article.get('title')}")
+        logger.info(f"Word Count: {article.get('word_count')}")
+    else:
+        logger.error(f"❌ Test {i} Failed")
+        logger.error(results.get("error"))
 
 
 if __name__ == "__main__":
-    run_acceptance_tests()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Generate personas through the OpenAI Batch API",
+    )
+    parser.add_argument(
+        "--batch-timeout",
+        type=float,
+        default=DEFAULT_BATCH_TIMEOUT,
+        help="Seconds to wait for the persona batch before cancelling it and "
+        f"using live calls (default: {DEFAULT_BATCH_TIMEOUT})",
+    )
+    args = parser.parse_args()
+    run_acceptance_tests(use_batch_api=args.batch, batch_timeout=args.batch_timeout)
@@ -32,7 +32,9 @@ setup(
         "langchain-community>=0.0.20",
         "langchain-core>=0.1.0",
         "openai>=1.10.0",
+        "httpx[http2]>=0.25.0",
         "requests>=2.31.0",
+        "orjson>=3.9.0",
         "beautifulsoup4>=4.12.0",
         "ddgs>=9.0.0",
         "pillow>=10.0.0",
@@ -47,6 +49,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.0.0",
             "ruff>=0.1.0",
         ],
@@ -1,15 +1,46 @@
-"""Agent modules for content creation."""
+"""Agent modules for content creation.
 
-from .audience_strategist import AudienceStrategist
-from .image_handler import ImageAgent
-from .publisher import PublisherAgent
-from .researcher import ResearchAgent
-from .writer import WriterAgent
+Agents are imported lazily on first attribute access so that importing a
+single agent module does not load the others and their dependencies.
+"""
 
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .audience_strategist import AudienceStrategist
+    from .image_handler import ImageAgent
+    from .publisher import PublisherAgent
+    from .researcher import ResearchAgent
+    from .writer import WriterAgent
+
+__all__ = (
     "AudienceStrategist",
     "ResearchAgent",
     "WriterAgent",
     "ImageAgent",
     "PublisherAgent",
-]
+)
+
+_AGENT_MODULES = {
+    "AudienceStrategist": "audience_strategist",
+    "ResearchAgent": "researcher",
+    "WriterAgent": "writer",
+    "ImageAgent": "image_handler",
+    "PublisherAgent": "publisher",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import agent classes on first access."""
+    if name in _AGENT_MODULES:
+        module = importlib.import_module(f".{_AGENT_MODULES[name]}", __name__)
+        agent_class = getattr(module, name)
+        globals()[name] = agent_class
+        return agent_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported agents in dir() output."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,126 @@
+"""Response cache for deterministic LLM prompt calls.
+
+Anything derived from model output, whether a single completion or a result
+assembled from several, is only reused when the model runs at temperature 0.
+A sampling model is expected to give a fresh answer on every call, so caching
+one of its answers would freeze a single sample for the whole cache lifetime.
+"""
+
+import hashlib
+from typing import TYPE_CHECKING, Any, List, Optional
+
+import orjson
+
+from ..utils.cache import DiskCache
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+
+# Cached completions are only reused for a day so prompt tweaks surface quickly
+LLM_CACHE_TTL = 24 * 60 * 60
+
+
+def is_deterministic(llm: Any) -> bool:
+    """Return True if the model is configured for repeatable output.
+
+    Args:
+        llm: Language model instance
+
+    Returns:
+        True when the model's temperature is exactly zero
+    """
+    temperature = getattr(llm, "temperature", None)
+    return isinstance(temperature, (int, float)) and temperature == 0
+
+
+def cache_key(llm: Any, messages: List["BaseMessage"]) -> str:
+    """Build a cache key from the model id, sampling settings and messages.
+
+    Args:
+        llm: Language model instance
+        messages: Prompt messages sent to the model
+
+    Returns:
+        SHA-256 hex digest identifying the request
+    """
+    payload = {
+        "model": getattr(llm, "model_name", None),
+        "temperature": getattr(llm, "temperature", None),
+        "messages": [[message.type, message.content] for message in messages],
+    }
+    raw = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(raw).hexdigest()
+
+
+def cached_invoke(
+    llm: Any,
+    messages: List["BaseMessage"],
+    cache: Optional[DiskCache],
+    expire: float = LLM_CACHE_TTL,
+) -> str:
+    """Invoke the model, reusing a cached completion for identical requests.
+
+    Caching is skipped when no cache is configured or the model samples with
+    a non-zero temperature, since repeated calls are then expected to differ.
+
+    Args:
+        llm: Language model instance
+        messages: Prompt messages sent to the model
+        cache: Optional cache for completions
+        expire: Lifetime of cached completions in seconds
+
+    Returns:
+        Response content
+    """
+    if cache is None or not is_deterministic(llm):
+        return llm.invoke(messages).content
+
+    key = cache_key(llm, messages)
+    cached_content = cache.get(key)
+    if cached_content is not None:
+        return cached_content
+
+    content = llm.invoke(messages).content
+    cache.set(key, content, expire=expire)
+    return content
+
+
+def cached_batch(
+    llm: Any,
+    messages_list: List[List["BaseMessage"]],
+    cache: Optional[DiskCache],
+    max_concurrency: int,
+    expire: float = LLM_CACHE_TTL,
+) -> List[str]:
+    """Batch-invoke the model, only sending requests without a cached completion.
+
+    Caching follows the same rules as cached_invoke.
+
+    Args:
+        llm: Language model instance
+        messages_list: Prompt messages for each request
+        cache: Optional cache for completions
+        max_concurrency: Maximum number of in-flight requests
+        expire: Lifetime of cached completions in seconds
+
+    Returns:
+        Response contents in the same order as messages_list
+    """
+    keys: List[Optional[str]] = [None] * len(messages_list)
+    contents: List[Optional[str]] = [None] * len(messages_list)
+    if cache is not None and is_deterministic(llm):
+        keys = [cache_key(llm, messages) for messages in messages_list]
+        contents = [cache.get(key) for key in keys]
+
+    pending = [i for i, content in enumerate(contents) if content is None]
+    if pending:
+        responses = llm.batch(
+            [messages_list[i] for i in pending],
+            config={"max_concurrency": min(len(pending), max_concurrency)},
+        )
+        for i, response in zip(pending, responses):
+            contents[i] = response.content
+            if keys[i]:
+                cache.set(keys[i], response.content, expire=expire)
+
+    return contents
@@ -1,12 +1,23 @@
 """Audience strategist agent for creating reader personas."""
 
-import json
 import logging
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+import orjson
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
+
+from ..utils.cache import DiskCache
+from ._llm_cache import cached_batch, cached_invoke
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+# Personas for the same topic and audience rarely change, so keep them for a week
+PERSONA_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Upper bound on concurrent requests issued by analyze_batch
+MAX_BATCH_CONCURRENCY = 8
 
 PERSONA_SYSTEM_PROMPT = """You are an audience research specialist. \
 Create a detailed reader persona for someone who would benefit most from \
@@ -50,17 +61,28 @@ Return your analysis as a JSON object with the following structure:
 Be specific and realistic. Base the persona on actual user behaviors, not stereotypes.
 Return ONLY the JSON object, no additional text."""
 
+# Built once at import time; only the human turn varies between calls
+_PERSONA_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=PERSONA_SYSTEM_PROMPT),
+        HumanMessagePromptTemplate.from_template("Topic: {topic}{audience_context}"),
+    ]
+)
+
 
 class AudienceStrategist:
     """Agent responsible for analyzing target audience and creating personas."""
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI", cache: Optional[DiskCache] = None):
         """Initialize the audience strategist.
 
         Args:
-            llm: Language model for persona generation
+            llm: Language model for persona generation, ideally configured
+                for JSON mode so responses always parse
+            cache: Optional cache for reusing deterministic personas across runs
         """
         self.llm = llm
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
 
     def _get_empty_persona(self) -> Dict[str, Any]:
@@ -99,35 +121,37 @@ class AudienceStrategist:
             },
         }
 
-    def analyze(
-        self, topic: str, audience_hint: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Create a detailed reader persona for the topic.
+    def persona_messages(self, topic: str, audience_hint: Optional[str]) -> list:
+        """Build the prompt messages for a persona request.
+
+        Callers that send the request themselves, such as a batch job, pass
+        the reply to parse_persona.
 
         Args:
             topic: The article topic
             audience_hint: Optional hint about target audience
 
         Returns:
-            Dictionary containing detailed persona information
+            List of chat messages
         """
-        self.logger.info(f"Creating audience persona for: {topic}")
-
         audience_context = (
             f"\nTarget Audience Hint: {audience_hint}" if audience_hint else ""
         )
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(content=PERSONA_SYSTEM_PROMPT),
-                HumanMessage(content=f"Topic: {topic}{audience_context}"),
-            ]
+        return _PERSONA_PROMPT.format_messages(
+            topic=topic, audience_context=audience_context
         )
 
-        response = self.llm.invoke(prompt.format_messages())
+    def parse_persona(self, content: str) -> Dict[str, Any]:
+        """Parse an LLM response into a persona.
 
+        Args:
+            content: Raw LLM response content
+
+        Returns:
+            Parsed persona, or an empty persona if parsing fails
+        """
         try:
-            persona = json.loads(response.content)
+            persona = orjson.loads(content)
             if not isinstance(persona, dict):
                 self.logger.error(
                     "Persona JSON is not an object, returning empty persona"
@@ -136,10 +160,59 @@ class AudienceStrategist:
             persona_name = persona.get("persona_name", "Unknown")
             self.logger.info(f"Created persona: {persona_name}")
             return persona
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             self.logger.error("Failed to parse persona JSON, returning empty persona")
             return self._get_empty_persona()
 
+    def analyze(
+        self, topic: str, audience_hint: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a detailed reader persona for the topic.
+
+        Args:
+            topic: The article topic
+            audience_hint: Optional hint about target audience
+
+        Returns:
+            Dictionary containing detailed persona information
+        """
+        self.logger.info(f"Creating audience persona for: {topic}")
+
+        content = cached_invoke(
+            self.llm,
+            self.persona_messages(topic, audience_hint),
+            self.cache,
+            expire=PERSONA_CACHE_TTL,
+        )
+
+        return self.parse_persona(content)
+
+    def analyze_batch(
+        self,
+        specs: List[Tuple[str, Optional[str]]],
+        max_concurrency: int = MAX_BATCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """Create personas for several topics with concurrent LLM calls.
+
+        Args:
+            specs: List of (topic, audience_hint) pairs
+            max_concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            List of personas in the same order as specs
+        """
+        self.logger.info(f"Creating {len(specs)} audience personas")
+
+        contents = cached_batch(
+            self.llm,
+            [self.persona_messages(topic, hint) for topic, hint in specs],
+            self.cache,
+            max_concurrency=max_concurrency,
+            expire=PERSONA_CACHE_TTL,
+        )
+
+        return [self.parse_persona(content) for content in contents]
+
     def validate_persona(self, persona: Dict[str, Any]) -> bool:
         """Validate that a persona has all required fields.
 
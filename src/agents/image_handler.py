@@ -1,28 +1,221 @@
 """Image handler agent for finding and managing images."""
 
+import atexit
 import logging
-from typing import Any, Dict, List, Optional
-
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+import orjson
 import requests
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+from urllib3.util.retry import Retry
+
+from ..utils.cache import DiskCache
+from ._llm_cache import cached_invoke
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 # Unsplash API constants
 UNSPLASH_MAX_PER_PAGE = 30
+VALID_ORDER_BY = frozenset({"relevant", "latest"})
+VALID_CONTENT_FILTERS = frozenset({"low", "high"})
+VALID_ORIENTATIONS = frozenset({"landscape", "portrait", "squarish"})
+
+# Cache lifetimes in seconds. Search results are kept briefly so new photos
+# still show up; generated queries only depend on the article itself.
+IMAGE_QUERY_CACHE_TTL = 7 * 24 * 60 * 60
+UNSPLASH_SEARCH_CACHE_TTL = 60 * 60
+
+# Worker threads, shared by all agents, used for fire-and-forget download
+# tracking pings
+DOWNLOAD_TRACKING_WORKERS = 4
+
+# Cheap quality signals checked before selection: the shorter side must be at
+# least MIN_IMAGE_DIMENSION pixels and width / height must fall in the range
+# for the requested orientation
+MIN_IMAGE_DIMENSION = 1080
+ASPECT_RATIO_RANGES = {
+    "landscape": (1.3, 2.0),
+    "portrait": (0.5, 0.77),
+    "squarish": (0.8, 1.25),
+}
+
+# Transient Unsplash failures that are worth retrying within a single call
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_WAIT = 10
+
+# Unsplash quotas are hourly; once a response reports none left, searches are
+# skipped for this long instead of collecting 429s
+RATE_LIMIT_WINDOW = 60 * 60
+
+_exponential_backoff = wait_exponential(multiplier=1, min=1, max=MAX_RETRY_WAIT)
+
+IMAGE_QUERY_SYSTEM_PROMPT = """You are an image curator. Generate 3-5 specific image search queries that would find relevant, high-quality images for this article.
+The queries should be:
+- Specific and descriptive
+- Relevant to the main topic
+- Suitable for professional content
+- Diverse (different aspects of the topic)
+
+Return only the queries, one per line."""
+
+IMAGE_SUGGESTION_SYSTEM_PROMPT = """You are an image curator. Suggest 3 specific images that would be ideal for this article.
+For each image, describe:
+- What the image should show
+- Why it's relevant
+- Suggested placement in the article
+
+Format each suggestion as:
+Image N: [Description]
+Why: [Relevance]
+Placement: [Where in article]"""
+
+# Built once at import time; only the human turn varies between calls
+_IMAGE_QUERY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=IMAGE_QUERY_SYSTEM_PROMPT),
+        HumanMessagePromptTemplate.from_template(
+            "Topic: {topic}\n\nArticle preview:\n{article_preview}"
+        ),
+    ]
+)
+
+_IMAGE_SUGGESTION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=IMAGE_SUGGESTION_SYSTEM_PROMPT),
+        HumanMessagePromptTemplate.from_template(
+            "Topic: {topic}\n\nArticle:\n{article_preview}"
+        ),
+    ]
+)
+
+
+def _content_preview(article_content: Union[str, List[str]], limit: int) -> str:
+    """Return the first characters of article content for use in prompts.
+
+    Args:
+        article_content: Article content as a string or a list of text chunks
+        limit: Maximum number of characters to return
+
+    Returns:
+        Content preview
+    """
+    if isinstance(article_content, str):
+        return article_content[:limit]
+
+    # Only copy as many chunks as are needed to fill the preview
+    parts = []
+    remaining = limit
+    for chunk in article_content:
+        if remaining <= 0:
+            break
+        part = chunk[:remaining]
+        parts.append(part)
+        remaining -= len(part)
+    return "".join(parts)
+
+
+def _quota_exhausted(response: requests.Response) -> bool:
+    """Return True if Unsplash reports no requests left in the current hour."""
+    return response.headers.get("X-Ratelimit-Remaining") == "0"
+
+
+def _is_retryable_http_error(exc: BaseException) -> bool:
+    """Return True for HTTP errors caused by rate limiting or server faults.
+
+    A 429 is not retried once the hourly quota is used up, since a retry a
+    few seconds later would be rejected too.
+    """
+    if not isinstance(exc, requests.exceptions.HTTPError):
+        return False
+    response = exc.response
+    if response is None or response.status_code not in RETRYABLE_STATUS_CODES:
+        return False
+    return not (response.status_code == 429 and _quota_exhausted(response))
+
+
+def _wait_for_retry(retry_state) -> float:
+    """Wait as long as the Retry-After header asks, else back off exponentially."""
+    exc = retry_state.outcome.exception()
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_WAIT)
+    return _exponential_backoff(retry_state)
+
+
+def _flatten_unsplash_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten an Unsplash search result into image metadata.
+
+    Args:
+        result: Photo object from the Unsplash search API
+
+    Returns:
+        Image metadata dictionary
+    """
+    urls = result["urls"]
+    links = result["links"]
+    user = result["user"]
+    return {
+        "id": result["id"],
+        "url": urls["regular"],
+        "thumb_url": urls["thumb"],
+        "full_url": urls["full"],
+        "description": result.get("description") or result.get("alt_description", ""),
+        "author": user["name"],
+        "author_url": user["links"]["html"],
+        "download_url": links["download"],
+        "download_location": links["download_location"],
+        "photo_link": links["html"],
+        "width": result["width"],
+        "height": result["height"],
+        "color": result.get("color", ""),
+        "likes": result.get("likes", 0),
+        "tags": [tag.get("title", "") for tag in result.get("tags") or ()],
+    }
 
 
 class ImageAgent:
     """Agent responsible for finding and selecting relevant images."""
 
+    # Shared by every agent so pooled Unsplash connections outlive any one instance
+    _shared_session: ClassVar[Optional[requests.Session]] = None
+    _shared_session_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Likewise one tracking pool serves every agent, so building agents never
+    # starts threads of its own
+    _shared_tracker: ClassVar[Optional[ThreadPoolExecutor]] = None
+    _shared_tracker_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
-        llm: ChatOpenAI,
+        llm: "ChatOpenAI",
         unsplash_key: Optional[str] = None,
         per_page: int = 10,
         order_by: str = "relevant",
         content_filter: str = "high",
         orientation: str = "landscape",
+        cache: Optional[DiskCache] = None,
     ):
         """Initialize the image agent.
 
@@ -33,21 +226,22 @@ class ImageAgent:
             order_by: Sort order - "relevant" or "latest" (default: "relevant")
             content_filter: Content filtering level - "low" or "high" (default: "high")
             orientation: Image orientation - "landscape", "portrait", or "squarish" (default: "landscape")
+            cache: Optional cache for reusing image queries and search results
         """
         # Validate parameters
         if not 1 <= per_page <= UNSPLASH_MAX_PER_PAGE:
             raise ValueError(
                 f"per_page must be between 1 and {UNSPLASH_MAX_PER_PAGE}, got {per_page}"
             )
-        if order_by not in ["relevant", "latest"]:
+        if order_by not in VALID_ORDER_BY:
             raise ValueError(
                 f"order_by must be 'relevant' or 'latest', got '{order_by}'"
             )
-        if content_filter not in ["low", "high"]:
+        if content_filter not in VALID_CONTENT_FILTERS:
             raise ValueError(
                 f"content_filter must be 'low' or 'high', got '{content_filter}'"
             )
-        if orientation not in ["landscape", "portrait", "squarish"]:
+        if orientation not in VALID_ORIENTATIONS:
             raise ValueError(
                 f"orientation must be 'landscape', 'portrait', or 'squarish', got '{orientation}'"
             )
@@ -58,42 +252,123 @@ class ImageAgent:
         self.order_by = order_by
         self.content_filter = content_filter
         self.orientation = orientation
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
+        # Monotonic time until which searches are skipped, set when a response
+        # shows the hourly Unsplash quota is used up
+        self._rate_limited_until = 0.0
+        # Tracking pings this agent has queued and close() still waits for
+        self._pending_tracking: Set[Future] = set()
+        self._pending_tracking_lock = threading.Lock()
+
+        # The session is shared between agents, so credentials go on each request
+        self._headers = (
+            {"Authorization": f"Client-ID {unsplash_key}"} if unsplash_key else {}
+        )
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the process-wide session used for Unsplash requests.
 
-    def generate_image_queries(self, topic: str, article_content: str) -> List[str]:
+        The session is created on first use and closed at interpreter exit.
+
+        Returns:
+            Session with pooled keep-alive connections
+        """
+        with cls._shared_session_lock:
+            if cls._shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=20,
+                    max_retries=Retry(total=3, backoff_factor=0.3),
+                )
+                session.mount("https://", adapter)
+                atexit.register(session.close)
+                cls._shared_session = session
+            return cls._shared_session
+
+    @classmethod
+    def _get_tracker(cls) -> ThreadPoolExecutor:
+        """Return the process-wide pool used for download tracking pings."""
+        with cls._shared_tracker_lock:
+            if cls._shared_tracker is None:
+                cls._shared_tracker = ThreadPoolExecutor(
+                    max_workers=DOWNLOAD_TRACKING_WORKERS,
+                    thread_name_prefix="unsplash-tracking",
+                )
+            return cls._shared_tracker
+
+    def _submit_tracking(self, download_location: str) -> None:
+        """Queue a download tracking ping without blocking the caller."""
+        future = self._get_tracker().submit(self.track_download, download_location)
+        with self._pending_tracking_lock:
+            self._pending_tracking.add(future)
+        future.add_done_callback(self._forget_tracking)
+
+    def _forget_tracking(self, future: Future) -> None:
+        """Drop a finished tracking ping from the pending set."""
+        with self._pending_tracking_lock:
+            self._pending_tracking.discard(future)
+
+    def close(self) -> None:
+        """Wait for this agent's pending download tracking pings.
+
+        The shared HTTP session and tracking pool stay open for other agents.
+        """
+        with self._pending_tracking_lock:
+            pending = list(self._pending_tracking)
+        wait(pending)
+
+    @retry(
+        retry=retry_if_exception(_is_retryable_http_error),
+        stop=stop_after_attempt(3),
+        wait=_wait_for_retry,
+        reraise=True,
+    )
+    def _get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request through the shared session.
+
+        Rate-limit and server errors are retried with backoff before the
+        HTTPError is raised to the caller.
+
+        Args:
+            url: Request URL
+            **kwargs: Extra arguments passed to requests
+
+        Returns:
+            Successful response
+        """
+        response = self._get_session().get(
+            url, headers=self._headers, timeout=10, **kwargs
+        )
+        if _quota_exhausted(response):
+            self.logger.warning("Unsplash rate limit reached, pausing image search")
+            self._rate_limited_until = time.monotonic() + RATE_LIMIT_WINDOW
+        response.raise_for_status()
+        return response
+
+    def generate_image_queries(
+        self, topic: str, article_content: Union[str, List[str]]
+    ) -> List[str]:
         """Generate search queries for finding relevant images.
 
         Args:
             topic: Article topic
-            article_content: Full article content
+            article_content: Full article content, as a string or text chunks
 
         Returns:
             List of image search queries
         """
         self.logger.info(f"Generating image queries for: {topic}")
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content="""You are an image curator. Generate 3-5 specific image search queries that would find relevant, high-quality images for this article.
-The queries should be:
-- Specific and descriptive
-- Relevant to the main topic
-- Suitable for professional content
-- Diverse (different aspects of the topic)
-
-Return only the queries, one per line."""
-                ),
-                HumanMessage(
-                    content=f"Topic: {topic}\n\nArticle preview:\n{article_content[:1000]}"
-                ),
-            ]
+        messages = _IMAGE_QUERY_PROMPT.format_messages(
+            topic=topic, article_preview=_content_preview(article_content, 1000)
         )
-
-        response = self.llm.invoke(prompt.format_messages())
-        queries = [q.strip() for q in response.content.split("\n") if q.strip()]
-
-        return queries[:5]
+        content = cached_invoke(
+            self.llm, messages, self.cache, expire=IMAGE_QUERY_CACHE_TTL
+        )
+        return [q.strip() for q in content.split("\n") if q.strip()][:5]
 
     def search_unsplash(
         self,
@@ -121,9 +396,28 @@ Return only the queries, one per line."""
             self.logger.warning("Unsplash API key not provided, skipping image search")
             return []
 
+        cache_key = None
+        if self.cache:
+            cache_key = DiskCache.make_key(
+                "unsplash",
+                query,
+                per_page,
+                order_by,
+                content_filter,
+                color,
+                orientation,
+            )
+            cached_images = self.cache.get(cache_key)
+            if cached_images is not None:
+                self.logger.info(f"Using cached images for query: {query}")
+                return cached_images
+
+        if time.monotonic() < self._rate_limited_until:
+            self.logger.warning(f"Unsplash rate limit reached, skipping query: {query}")
+            return []
+
         try:
             url = "https://api.unsplash.com/search/photos"
-            headers = {"Authorization": f"Client-ID {self.unsplash_key}"}
             params = {
                 "query": query,
                 "per_page": min(per_page, UNSPLASH_MAX_PER_PAGE),
@@ -136,37 +430,14 @@ Return only the queries, one per line."""
             if color:
                 params["color"] = color
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-
-            results = response.json().get("results", [])
-
-            images = []
-            for result in results:
-                images.append(
-                    {
-                        "id": result["id"],
-                        "url": result["urls"]["regular"],
-                        "thumb_url": result["urls"]["thumb"],
-                        "full_url": result["urls"]["full"],
-                        "description": result.get("description")
-                        or result.get("alt_description", ""),
-                        "author": result["user"]["name"],
-                        "author_url": result["user"]["links"]["html"],
-                        "download_url": result["links"]["download"],
-                        "download_location": result["links"]["download_location"],
-                        "photo_link": result["links"]["html"],
-                        "width": result["width"],
-                        "height": result["height"],
-                        "color": result.get("color", ""),
-                        "likes": result.get("likes", 0),
-                        "tags": [
-                            tag.get("title", "") for tag in result.get("tags", [])
-                        ],
-                    }
-                )
+            response = self._get(url, params=params)
+
+            payload = orjson.loads(response.content)
+            images = [_flatten_unsplash_result(r) for r in payload.get("results", ())]
 
             self.logger.info(f"Found {len(images)} images for query: {query}")
+            if cache_key:
+                self.cache.set(cache_key, images, expire=UNSPLASH_SEARCH_CACHE_TTL)
             return images
 
         except requests.exceptions.HTTPError as e:
@@ -192,9 +463,7 @@ Return only the queries, one per line."""
             return False
 
         try:
-            headers = {"Authorization": f"Client-ID {self.unsplash_key}"}
-            response = requests.get(download_location, headers=headers, timeout=10)
-            response.raise_for_status()
+            self._get(download_location)
             self.logger.debug(f"Download tracked successfully for: {download_location}")
             return True
         except requests.exceptions.HTTPError as e:
@@ -214,35 +483,97 @@ Return only the queries, one per line."""
             article_data: Article data including content
 
         Returns:
-            List of recommended images
+            List of recommended images, empty when no Unsplash key is set
         """
         self.logger.info(f"Finding images for: {topic}")
 
-        # Generate search queries
-        queries = self.generate_image_queries(topic, article_data.get("content", ""))
+        # Every search would be skipped without a key, so don't pay for queries
+        if not self.unsplash_key:
+            self.logger.warning("Unsplash API key not provided, skipping image search")
+            return []
 
-        # Search for images
-        all_images = []
+        # Generate search queries from the writer's preview when available so
+        # the full article body is not touched
+        article_preview = article_data.get("content_preview") or article_data.get(
+            "content", ""
+        )
+        queries = self.generate_image_queries(topic, article_preview)
+
+        # Drop duplicate queries so each distinct search is only sent once
+        seen_queries = set()
+        unique_queries = []
         for query in queries:
-            images = self.search_unsplash(
-                query,
-                per_page=self.per_page,
-                order_by=self.order_by,
-                content_filter=self.content_filter,
-                orientation=self.orientation,
-            )
-            all_images.extend(images)
+            normalized = query.lower().strip()
+            if normalized not in seen_queries:
+                seen_queries.add(normalized)
+                unique_queries.append(query)
+
+        # Search for images, issuing all queries concurrently since each one
+        # is an independent HTTP round-trip. Distinct queries often return the
+        # same photo, so keep only the first occurrence of each image id.
+        images_by_id = {}
+        if unique_queries:
+            with ThreadPoolExecutor(max_workers=len(unique_queries)) as executor:
+                for images in executor.map(self._search_query, unique_queries):
+                    for image in images:
+                        images_by_id.setdefault(image["id"], image)
+        all_images = self._prefilter_images(list(images_by_id.values()))
 
         # Select best images
         selected_images = self.select_best_images(topic, article_data, all_images)
 
-        # Track downloads for selected images (required by Unsplash API guidelines)
+        # Track downloads for selected images (required by Unsplash API guidelines).
+        # Tracking is fire-and-forget, so pings run in the background instead of
+        # blocking the pipeline.
         for image in selected_images:
             if "download_location" in image:
-                self.track_download(image["download_location"])
+                self._submit_tracking(image["download_location"])
 
         return selected_images
 
+    def _search_query(self, query: str) -> List[Dict[str, Any]]:
+        """Search Unsplash for a query using the instance search settings.
+
+        Args:
+            query: Search query
+
+        Returns:
+            List of image metadata
+        """
+        return self.search_unsplash(
+            query,
+            per_page=self.per_page,
+            order_by=self.order_by,
+            content_filter=self.content_filter,
+            orientation=self.orientation,
+        )
+
+    def _prefilter_images(self, images: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop small, oddly shaped, or undescribed images before selection.
+
+        Args:
+            images: Candidate images in relevance order
+
+        Returns:
+            Images passing the quality checks, or all images if none pass
+        """
+        min_ratio, max_ratio = ASPECT_RATIO_RANGES[self.orientation]
+        preferred = []
+        for image in images:
+            width = image.get("width") or 0
+            height = image.get("height") or 0
+            if (
+                min(width, height) >= MIN_IMAGE_DIMENSION
+                and min_ratio <= width / height <= max_ratio
+                and image.get("description")
+            ):
+                preferred.append(image)
+
+        if not preferred and images:
+            self.logger.info("No images passed the quality checks, keeping all")
+            return images
+        return preferred
+
     def select_best_images(
         self,
         topic: str,
@@ -265,60 +596,48 @@ Return only the queries, one per line."""
 
         # If we have API access, just return top 3 diverse images
         if self.unsplash_key:
-            # Take up to 3 images, ensuring diversity
-            selected = []
+            # Take up to 3 images, ensuring diversity. Keyed by id, the dict
+            # doubles as an insertion-ordered set of the selection
+            selected = {}
             seen_authors = set()
 
             for img in available_images:
                 if len(selected) >= 3:
                     break
                 if img["author"] not in seen_authors:
-                    selected.append(img)
+                    selected[img["id"]] = img
                     seen_authors.add(img["author"])
 
             # Fill remaining slots if needed
             for img in available_images:
                 if len(selected) >= 3:
                     break
-                if img not in selected:
-                    selected.append(img)
+                selected.setdefault(img["id"], img)
 
-            return selected
+            return list(selected.values())
 
         return []
 
-    def generate_image_suggestions(self, topic: str, article_content: str) -> List[str]:
+    def generate_image_suggestions(
+        self, topic: str, article_content: Union[str, List[str]]
+    ) -> List[str]:
         """Generate suggestions for images when API is not available.
 
         Args:
             topic: Article topic
-            article_content: Article content
+            article_content: Article content, as a string or text chunks
 
         Returns:
             List of image suggestions
         """
         self.logger.info(f"Generating image suggestions for: {topic}")
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content="""You are an image curator. Suggest 3 specific images that would be ideal for this article.
-For each image, describe:
-- What the image should show
-- Why it's relevant
-- Suggested placement in the article
-
-Format each suggestion as:
-Image N: [Description]
-Why: [Relevance]
-Placement: [Where in article]"""
-                ),
-                HumanMessage(
-                    content=f"Topic: {topic}\n\nArticle:\n{article_content[:1500]}"
-                ),
-            ]
+        content = cached_invoke(
+            self.llm,
+            _IMAGE_SUGGESTION_PROMPT.format_messages(
+                topic=topic, article_preview=_content_preview(article_content, 1500)
+            ),
+            self.cache,
         )
 
-        response = self.llm.invoke(prompt.format_messages())
-
-        return response.content.split("\n\n")
+        return content.split("\n\n")
@@ -1,9 +1,16 @@
 """Publisher agent for publishing content to various platforms."""
 
-import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+# Characters replaced with "_" in generated filenames. Letters and digits in
+# any script are kept, so titles in other alphabets still get distinct names.
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
 
 
 class PublisherAgent:
@@ -78,61 +85,66 @@ class PublisherAgent:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
+            # Look up each field once; the markdown and metadata share the values
+            title = article_data.get("title", "Untitled")
+            topic = article_data.get("topic", "N/A")
+            word_count = article_data.get("word_count", 0)
+            tags = article_data.get("tags", [])
+            meta_description = article_data.get("meta_description", "")
+            images = article_data.get("images", [])
+
             # Generate filename from title
-            title = article_data.get("title", "untitled")
-            filename = "".join(
-                c if c.isalnum() or c in (" ", "-") else "_" for c in title
-            )
+            filename = _UNSAFE_FILENAME_CHARS.sub("_", title)
             filename = filename.replace(" ", "_").lower()[:50]
 
-            # Save markdown file
+            # Build the markdown document in memory and write it in one call
+            parts = [
+                f"# {title}\n\n",
+                f"**Topic:** {topic}\n\n",
+                f"**Word Count:** {word_count}\n\n",
+                f"**Tags:** {', '.join(tags)}\n\n",
+                f"**Meta Description:** {meta_description}\n\n",
+                "---\n\n",
+                article_data.get("content", ""),
+            ]
+
+            # Add images if available
+            if images:
+                parts.append("\n\n## Visuals\n\n")
+                for img in images:
+                    alt = img.get("description", "Image")
+                    url = img.get("url", "")
+                    author = img.get("author", "Unknown")
+                    author_url = img.get("author_url", "")
+                    source = img.get("source", "Unsplash")
+
+                    parts.append(f"![{alt}]({url})\n")
+                    if author_url:
+                        parts.append(
+                            f"*Photo by [{author}]({author_url}) on {source}*\n\n"
+                        )
+                    else:
+                        parts.append(f"*Photo by {author} on {source}*\n\n")
+
             md_file = output_path / f"{filename}.md"
-            with open(md_file, "w", encoding="utf-8") as f:
-                f.write(f"# {article_data.get('title', 'Untitled')}\n\n")
-                f.write(f"**Topic:** {article_data.get('topic', 'N/A')}\n\n")
-                f.write(f"**Word Count:** {article_data.get('word_count', 0)}\n\n")
-                f.write(f"**Tags:** {', '.join(article_data.get('tags', []))}\n\n")
-                f.write(
-                    f"**Meta Description:** {article_data.get('meta_description', '')}\n\n"
-                )
-                f.write("---\n\n")
-                f.write(article_data.get("content", ""))
-
-                # Add images if available
-                images = article_data.get("images", [])
-                if images:
-                    f.write("\n\n## Visuals\n\n")
-                    for img in images:
-                        alt = img.get("description", "Image")
-                        url = img.get("url", "")
-                        author = img.get("author", "Unknown")
-                        author_url = img.get("author_url", "")
-                        source = img.get("source", "Unsplash")
-
-                        f.write(f"![{alt}]({url})\n")
-                        if author_url:
-                            f.write(
-                                f"*Photo by [{author}]({author_url}) on {source}*\n\n"
-                            )
-                        else:
-                            f.write(f"*Photo by {author} on {source}*\n\n")
+            md_file.write_text("".join(parts), encoding="utf-8")
 
             # Save metadata JSON
             json_file = output_path / f"{filename}_metadata.json"
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "title": article_data.get("title"),
-                        "topic": article_data.get("topic"),
-                        "word_count": article_data.get("word_count"),
-                        "tags": article_data.get("tags"),
-                        "meta_description": article_data.get("meta_description"),
-                        "images": article_data.get("images", []),
-                        "sources_count": article_data.get("sources_count", 0),
-                    },
-                    f,
-                    indent=2,
+            metadata = {
+                "title": title,
+                "topic": topic,
+                "word_count": word_count,
+                "tags": tags,
+                "meta_description": meta_description,
+                "images": images,
+                "sources_count": article_data.get("sources_count", 0),
+            }
+            json_file.write_bytes(
+                orjson.dumps(
+                    metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
                 )
+            )
 
             self.logger.info(f"Article saved to: {md_file}")
 
@@ -147,6 +159,31 @@ class PublisherAgent:
             self.logger.error(f"File save failed: {str(e)}")
             return {"success": False, "platform": "file", "error": str(e)}
 
+    def _dispatch(
+        self, platform: str, article_data: Dict[str, Any], output_dir: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Publish article to a single platform.
+
+        Args:
+            platform: Platform name
+            article_data: Article data
+            output_dir: Output directory for file-based publishing
+
+        Returns:
+            Tuple of the results key and the publication result
+        """
+        if platform.lower() == "medium":
+            return "medium", self.publish_to_medium(article_data)
+        if platform.lower() == "file":
+            return "file", self.save_to_file(article_data, output_dir)
+
+        self.logger.warning(f"Unknown platform: {platform}")
+        return platform, {
+            "success": False,
+            "platform": platform,
+            "error": f"Platform '{platform}' not supported",
+        }
+
     def publish(
         self,
         article_data: Dict[str, Any],
@@ -155,6 +192,9 @@ class PublisherAgent:
     ) -> Dict[str, Any]:
         """Publish article to specified platforms.
 
+        Platforms are published to concurrently, so network-bound targets
+        such as Medium do not wait on file writes.
+
         Args:
             article_data: Article data
             platforms: List of platforms to publish to (default: ["file"])
@@ -165,20 +205,13 @@ class PublisherAgent:
         """
         if platforms is None:
             platforms = ["file"]
-
-        results = {}
-
-        for platform in platforms:
-            if platform.lower() == "medium":
-                results["medium"] = self.publish_to_medium(article_data)
-            elif platform.lower() == "file":
-                results["file"] = self.save_to_file(article_data, output_dir)
-            else:
-                self.logger.warning(f"Unknown platform: {platform}")
-                results[platform] = {
-                    "success": False,
-                    "platform": platform,
-                    "error": f"Platform '{platform}' not supported",
-                }
-
-        return results
+        if not platforms:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+            futures = [
+                executor.submit(self._dispatch, platform, article_data, output_dir)
+                for platform in platforms
+            ]
+            # Collect in request order so the results keep the platform ordering
+            return dict(future.result() for future in futures)
@@ -1,29 +1,139 @@
 """Research agent for gathering information on a given topic."""
 
-import json
+import copy
 import logging
-from typing import Any, Dict, List
-
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice, zip_longest
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import orjson
 from ddgs import DDGS
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from ddgs.exceptions import TimeoutException
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from ..utils.cache import DiskCache
+from ._llm_cache import cached_invoke, is_deterministic
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+# Web results for a query go stale quickly, so only reuse them for a few hours
+SEARCH_CACHE_TTL = 6 * 60 * 60
+
+# Network hiccups worth retrying a search for. Rate limits and other DDGS
+# errors (e.g. no results) would fail the same way again, so they are not.
+RETRYABLE_SEARCH_ERRORS = (TimeoutException, TimeoutError, ConnectionError)
+
+# Research questions from the topic analysis that are searched as well as the
+# topic itself, and the most searches in flight at once. Concurrent searches
+# share the agent's one DDGS client, so the pool is kept small.
+MAX_RESEARCH_QUESTIONS = 3
+MAX_SEARCH_WORKERS = 4
+
+# A line of the analysis holding a question, with any list marker or bold
+# markup around it stripped
+_QUESTION_RE = re.compile(
+    r"^\s*(?:[-*•]|\d+[.)])?\s*\**\s*(.+?\?)\**\s*$", re.MULTILINE
+)
+
+# Completed research from a deterministic model is reused for an hour,
+# in-process for at most this many topics and on disk when a cache is
+# configured, so repeat runs skip the search and LLM round-trips
+RESEARCH_CACHE_TTL = 60 * 60
+RESEARCH_CACHE_MAX_ENTRIES = 256
+
+# Longest source snippet sent to the LLM, bounding research brief token cost
+MAX_SOURCE_BODY_LENGTH = 2000
+
+ANALYSIS_SYSTEM_PROMPT = """You are a research assistant. Given a topic, analyze it and:
+1. Identify key aspects to research
+2. Generate 3-5 specific research questions
+3. Suggest relevant subtopics
+4. Determine the target audience
+
+Return your analysis in a structured format."""
+
+# Each research brief field is extracted by its own small prompt so the
+# extractions can run concurrently and each generates fewer output tokens
+RESEARCH_BRIEF_FIELDS = {
+    "key_statistics": 'A list of 5-7 strings. Each string should state a verifiable statistic and include its source inline, e.g., "80% of companies use AI for automation (McKinsey, 2023)".',
+    "expert_quotes": 'A list of 3-5 strings. Each string should be a quote with attribution, e.g., "\\"AI will transform every industry.\\" — Sundar Pichai, Google CEO".',
+    "case_studies": 'A list of 2-3 strings. Each string should briefly describe a named company or project and its relevance, e.g., "Netflix uses machine learning to personalize recommendations, increasing user engagement."',
+    "key_definitions": 'A dictionary where each key is an important term and each value is its definition, e.g., {"Machine Learning": "A subset of AI focused on algorithms that improve through experience."}',
+    "counter_arguments": 'A list of strings, each describing a common counter-argument or alternative viewpoint, e.g., "AI adoption may lead to significant job displacement."',
+}
+
+RESEARCH_BRIEF_FIELD_SYSTEM_PROMPT = """You are a research analyst. From the provided text, extract the following information relevant to the research angle.
+
+- {field}: {description}
+
+Ensure all extracted data is directly relevant to the research angle.
+
+Return ONLY a JSON object with the single key "{field}", no additional text."""
+
+# Built once at import time; only the human turn varies between calls
+_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=ANALYSIS_SYSTEM_PROMPT),
+        HumanMessagePromptTemplate.from_template("Topic: {topic}"),
+    ]
+)
+
+_RESEARCH_BRIEF_FIELD_PROMPTS = {
+    field: ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(
+                content=RESEARCH_BRIEF_FIELD_SYSTEM_PROMPT.format(
+                    field=field, description=description
+                )
+            ),
+            HumanMessagePromptTemplate.from_template(
+                "Research Angle: {angle}\n\nSearch Results:\n{results_text}"
+            ),
+        ]
+    )
+    for field, description in RESEARCH_BRIEF_FIELDS.items()
+}
 
 
 class ResearchAgent:
     """Agent responsible for researching topics and gathering information."""
 
-    def __init__(self, llm: ChatOpenAI, max_sources: int = 5):
+    def __init__(
+        self,
+        llm: "ChatOpenAI",
+        max_sources: int = 5,
+        cache: Optional[DiskCache] = None,
+    ):
         """Initialize the research agent.
 
         Args:
             llm: Language model for processing research
             max_sources: Maximum number of sources to gather
+            cache: Optional cache for reusing search results and deterministic
+                LLM responses
         """
         self.llm = llm
         self.max_sources = max_sources
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
+        self._ddgs: Optional[DDGS] = None
+        self._ddgs_lock = threading.Lock()
+        self._research_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._research_cache_lock = threading.Lock()
 
     def _get_empty_research_brief(
         self, search_results: List[Dict[str, Any]] = None
@@ -45,9 +155,41 @@ class ResearchAgent:
             "raw_sources": search_results or [],
         }
 
+    def _get_ddgs(self) -> DDGS:
+        """Return the agent's search client, creating it on first use.
+
+        Reusing one client keeps its search engine sessions warm across
+        queries and retries.
+
+        Returns:
+            DDGS search client
+        """
+        with self._ddgs_lock:
+            if self._ddgs is None:
+                self._ddgs = DDGS()
+            return self._ddgs
+
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        retry=retry_if_exception_type(RETRYABLE_SEARCH_ERRORS),
+        stop=stop_after_attempt(3),
+        wait=wait_random_exponential(multiplier=0.5, max=4),
+        reraise=True,
     )
+    def _text_search(self, query: str) -> List[Dict[str, Any]]:
+        """Run a DDGS text search, retrying transient network failures.
+
+        Args:
+            query: Search query
+
+        Returns:
+            At most max_sources search results
+        """
+        ddgs = self._get_ddgs()
+        # DDGS treats max_results as a hint and can return a few extra hits
+        return list(
+            islice(ddgs.text(query, max_results=self.max_sources), self.max_sources)
+        )
+
     def search_web(self, query: str) -> List[Dict[str, Any]]:
         """Search the web for information on a topic.
 
@@ -59,15 +201,104 @@ class ResearchAgent:
         """
         self.logger.info(f"Searching web for: {query}")
 
+        cache_key = None
+        if self.cache:
+            cache_key = DiskCache.make_key("web_search", query, self.max_sources)
+            cached_results = self.cache.get(cache_key)
+            if cached_results is not None:
+                self.logger.info(f"Using cached search results for: {query}")
+                return cached_results
+
         try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=self.max_sources))
-                self.logger.info(f"Found {len(results)} search results")
-                return results
+            results = self._text_search(query)
+            self.logger.info(f"Found {len(results)} search results")
+            # Empty results are often transient, so leave them uncached
+            if cache_key and results:
+                self.cache.set(cache_key, results, expire=SEARCH_CACHE_TTL)
+            return results
         except Exception as e:
             self.logger.error(f"Web search failed: {str(e)}")
             return []
 
+    def _search_each(self, queries: List[str]) -> List[List[Dict[str, Any]]]:
+        """Search the web for several queries concurrently.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            Search results for each query, in query order
+        """
+        if not queries:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(queries), MAX_SEARCH_WORKERS)
+        ) as executor:
+            return list(executor.map(self.search_web, queries))
+
+    @staticmethod
+    def _merge_results(
+        result_lists: List[List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Interleave search results from several queries, dropping repeated URLs.
+
+        Taking results round-robin keeps every query represented among the
+        first sources. Results without a URL cannot be matched, so all of them
+        are kept.
+
+        Args:
+            result_lists: Search results for each query
+
+        Returns:
+            Combined search results
+        """
+        seen_urls = set()
+        merged = []
+        for result in chain.from_iterable(zip_longest(*result_lists)):
+            if result is None:
+                continue
+            url = result.get("href")
+            if url:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+            merged.append(result)
+        return merged
+
+    def search_web_many(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Search the web for several queries concurrently.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            Combined search results, taken from each query in turn and
+            without duplicate URLs
+        """
+        return self._merge_results(self._search_each(queries))
+
+    def _research_questions(self, topic: str, analysis: str) -> List[str]:
+        """Pick the research questions from a topic analysis to search for.
+
+        Args:
+            topic: Topic being researched
+            analysis: Topic analysis text
+
+        Returns:
+            At most MAX_RESEARCH_QUESTIONS distinct questions
+        """
+        questions = []
+        seen = {topic.lower()}
+        for match in _QUESTION_RE.finditer(analysis):
+            question = match.group(1).strip()
+            if question.lower() not in seen:
+                seen.add(question.lower())
+                questions.append(question)
+                if len(questions) == MAX_RESEARCH_QUESTIONS:
+                    break
+        return questions
+
     def analyze_topic(self, topic: str) -> Dict[str, Any]:
         """Analyze a topic and generate research questions.
 
@@ -79,24 +310,11 @@ class ResearchAgent:
         """
         self.logger.info(f"Analyzing topic: {topic}")
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content="""You are a research assistant. Given a topic, analyze it and:
-1. Identify key aspects to research
-2. Generate 3-5 specific research questions
-3. Suggest relevant subtopics
-4. Determine the target audience
-
-Return your analysis in a structured format."""
-                ),
-                HumanMessage(content=f"Topic: {topic}"),
-            ]
+        analysis = cached_invoke(
+            self.llm, _ANALYSIS_PROMPT.format_messages(topic=topic), self.cache
         )
 
-        response = self.llm.invoke(prompt.format_messages())
-
-        return {"topic": topic, "analysis": response.content}
+        return {"topic": topic, "analysis": analysis}
 
     def create_research_brief(
         self, angle: str, search_results: List[Dict[str, Any]]
@@ -114,72 +332,77 @@ Return your analysis in a structured format."""
 
         # Prepare search results text
         results_text = "\n\n".join(
-            [
-                f"Source {i + 1}: {result.get('title', 'Unknown')}\n{result.get('body', '')}"
-                for i, result in enumerate(search_results[: self.max_sources])
-            ]
+            f"Source {i + 1}: {result.get('title', 'Unknown')}\n"
+            f"{result.get('body', '')[:MAX_SOURCE_BODY_LENGTH]}"
+            for i, result in enumerate(islice(search_results, self.max_sources))
         )
 
-        prompt_template = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content="""You are a research analyst. From the provided text, extract the following information relevant to the research angle. Structure your output as a JSON object with the specified keys and formats.
+        def extract(prompt: ChatPromptTemplate) -> str:
+            return cached_invoke(
+                self.llm,
+                prompt.format_messages(angle=angle, results_text=results_text),
+                self.cache,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=len(_RESEARCH_BRIEF_FIELD_PROMPTS)
+        ) as executor:
+            contents = list(
+                executor.map(extract, _RESEARCH_BRIEF_FIELD_PROMPTS.values())
+            )
+
+        # Fields that fail to parse keep their empty default
+        brief = self._get_empty_research_brief(search_results)
+        for field, content in zip(_RESEARCH_BRIEF_FIELD_PROMPTS, contents):
+            value = self._parse_brief_field(field, content)
+            if isinstance(value, type(brief[field])):
+                brief[field] = value
+        return brief
+
+    def _parse_brief_field(self, field: str, content: str) -> Any:
+        """Extract one research brief field from an LLM response.
 
-- key_statistics: A list of 5-7 strings. Each string should state a verifiable statistic and include its source inline, e.g., "80% of companies use AI for automation (McKinsey, 2023)".
-- expert_quotes: A list of 3-5 strings. Each string should be a quote with attribution, e.g., "\"AI will transform every industry.\" — Sundar Pichai, Google CEO".
-- case_studies: A list of 2-3 strings. Each string should briefly describe a named company or project and its relevance.
-- key_definitions: A dictionary where each key is an important term and each value is its definition.
-- counter_arguments: A list of strings, each describing a common counter-argument or alternative viewpoint.
-
-Ensure all extracted data is directly relevant to the research angle.
-
-Output format example:
-{
-  "key_statistics": [
-    "80% of companies use AI for automation (McKinsey, 2023)",
-    "Global AI market expected to reach $190B by 2025 (Statista, 2022)"
-  ],
-  "expert_quotes": [
-    "\"AI will transform every industry.\" — Sundar Pichai, Google CEO",
-    "\"Ethical AI is essential for trust.\" — Fei-Fei Li, Stanford"
-  ],
-  "case_studies": [
-    "Netflix uses machine learning to personalize recommendations, increasing user engagement.",
-    "Siemens implemented AI-driven predictive maintenance, reducing downtime by 30%."
-  ],
-  "key_definitions": {
-    "Machine Learning": "A subset of AI focused on algorithms that improve through experience.",
-    "Neural Network": "A computational model inspired by the human brain's network of neurons."
-  },
-  "counter_arguments": [
-    "AI adoption may lead to significant job displacement.",
-    "Bias in AI systems can perpetuate social inequalities."
-  ]
-}
+        Args:
+            field: Research brief field name
+            content: Raw LLM response content
 
-Return ONLY the JSON object, no additional text."""
-                ),
-                HumanMessage(
-                    content=f"Research Angle: {angle}\n\nSearch Results:\n{results_text}"
-                ),
-            ]
+        Returns:
+            Field value, or None if the response could not be parsed
+        """
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            self.logger.error(f"Failed to parse research brief JSON for {field}")
+            return None
+
+        if not isinstance(parsed, dict):
+            self.logger.error(f"Research brief JSON for {field} is not an object")
+            return None
+
+        return parsed.get(field)
+
+    def _research_disk_key(self, topic_key: str) -> Optional[str]:
+        """Return the disk cache key for a normalized topic, if caching is enabled."""
+        if not self.cache:
+            return None
+        return DiskCache.make_key(
+            "research",
+            topic_key,
+            getattr(self.llm, "model_name", None),
+            self.max_sources,
         )
 
-        response = self.llm.invoke(prompt_template.format_messages())
-
-        # Parse the JSON output
-        try:
-            brief = json.loads(response.content)
-            if not isinstance(brief, dict):
-                self.logger.error(
-                    "Research brief JSON is not an object, falling back to empty brief"
-                )
-                return self._get_empty_research_brief(search_results)
-            brief["raw_sources"] = search_results  # Keep raw sources for citation
-            return brief
-        except json.JSONDecodeError:
-            self.logger.error("Failed to parse research brief JSON")
-            return self._get_empty_research_brief(search_results)
+    def _remember_research(self, topic_key: str, result: Dict[str, Any]) -> None:
+        """Keep a copy of research in the in-process cache, evicting the oldest topics."""
+        result = copy.deepcopy(result)
+        with self._research_cache_lock:
+            self._research_cache[topic_key] = (
+                time.monotonic() + RESEARCH_CACHE_TTL,
+                result,
+            )
+            self._research_cache.move_to_end(topic_key)
+            while len(self._research_cache) > RESEARCH_CACHE_MAX_ENTRIES:
+                self._research_cache.popitem(last=False)
 
     def research(self, topic: str) -> Dict[str, Any]:
         """Conduct full research on a topic.
@@ -192,11 +415,44 @@ Return ONLY the JSON object, no additional text."""
         """
         self.logger.info(f"Starting research on: {topic}")
 
-        # Analyze the topic
-        analysis = self.analyze_topic(topic)
-
-        # Search for information
-        search_results = self.search_web(topic)
+        # Research is built from model output, so it follows the same
+        # temperature rule as cached LLM responses
+        reusable = is_deterministic(self.llm)
+
+        # Topics differing only in case or whitespace share one cache entry
+        cache_key = " ".join(topic.lower().split())
+        with self._research_cache_lock:
+            entry = self._research_cache.get(cache_key) if reusable else None
+            if entry is not None and entry[0] > time.monotonic():
+                self._research_cache.move_to_end(cache_key)
+                self.logger.info(f"Using cached research for: {topic}")
+                # Callers get their own copy so changes never reach the cache
+                cached_result = copy.deepcopy(entry[1])
+                cached_result["topic"] = topic
+                return cached_result
+
+        disk_key = self._research_disk_key(cache_key) if reusable else None
+        if disk_key:
+            cached_result = self.cache.get(disk_key)
+            if cached_result is not None:
+                self.logger.info(f"Using cached research for: {topic}")
+                self._remember_research(cache_key, cached_result)
+                return {**cached_result, "topic": topic}
+
+        # The analysis and the web search are independent, so overlap the LLM
+        # call with the search instead of paying for both round-trips in turn
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            analysis_future = executor.submit(self.analyze_topic, topic)
+            search_results = self.search_web(topic)
+            analysis = analysis_future.result()
+
+        # Search the analysis' research questions too, so the brief draws on
+        # sources beyond those for the bare topic
+        questions = self._research_questions(topic, analysis["analysis"])
+        if questions:
+            search_results = self._merge_results(
+                [search_results, *self._search_each(questions)]
+            )
 
         # Create structured research brief
         if search_results:
@@ -204,10 +460,18 @@ Return ONLY the JSON object, no additional text."""
         else:
             research_brief = self._get_empty_research_brief()
 
-        return {
+        result = {
             "topic": topic,
             "analysis": analysis["analysis"],
             "search_results": search_results,
             "research_brief": research_brief,
             "sources_count": len(search_results),
         }
+
+        # Research without sources is likely a transient search failure
+        if reusable and search_results:
+            self._remember_research(cache_key, result)
+            if disk_key:
+                self.cache.set(disk_key, result, expire=RESEARCH_CACHE_TTL)
+
+        return result
@@ -1,87 +1,248 @@
 """Writer agent for creating content based on research."""
 
+import io
 import logging
-from typing import Any, Dict, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+# Length of the article preview handed to downstream agents (e.g. image search)
+CONTENT_PREVIEW_LENGTH = 1500
+
+# First non-empty level-one markdown heading, ignoring surrounding whitespace
+_TITLE_RE = re.compile(r"^[^\S\n]*# [^\S\n]*(\S.*)$", re.MULTILINE)
+
+# Whitespace-delimited words, counted without building a list of them
+_WORD_RE = re.compile(r"\S+")
+
+# Runs of text between the separators LLMs use when listing tags in one string
+_TAG_RE = re.compile(r"[^,\n;]+")
+
+# Outermost JSON object in a reply wrapped in a ```json fence or extra prose
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Characters of the article and research the metadata prompt is based on
+META_PREVIEW_LENGTH = 500
+
+# Research brief list fields rendered under a heading, with the key that holds
+# the text when an item is a dict instead of a plain string
+_RESEARCH_BRIEF_ITEM_SECTIONS = (
+    ("key_statistics", "Key Statistics:", "statistic"),
+    ("expert_quotes", "Expert Quotes:", "quote"),
+    ("case_studies", "Case Studies:", "summary"),
+)
+
+SECTION_SYSTEM_PROMPT = """You are a professional content writer. Write an engaging, informative section for an article.
+Requirements:
+- Use clear, accessible language
+- Include specific examples and details
+- Maintain a professional yet conversational tone
+- Use proper formatting with paragraphs
+- Aim for 200-400 words per section"""
+
+OUTLINE_SYSTEM_PROMPT = """You are a professional content writer. Create a detailed article outline with:
+1. An engaging title
+2. Introduction hook
+3. 3-5 main sections with subsections
+4. Conclusion
+5. Key points to cover in each section
+
+The outline should be logical, engaging, and comprehensive."""
+
+METADATA_SYSTEM_PROMPT = """Generate publishing metadata for this article. Structure your output as a JSON object with these keys:
+
+- meta_description: A compelling meta description (150-160 characters).
+- tags: A list of 5-8 relevant tags.
+
+Return ONLY the JSON object, no additional text."""
+
+ARTICLE_SYSTEM_PROMPT = """You are a professional content writer. Write a comprehensive, engaging article based on the provided research and outline.
+
+Requirements:
+- Follow the outline structure
+- Write 1200-1500 words
+- Use clear, engaging language
+- Include an introduction, body sections, and conclusion
+- Add smooth transitions between sections
+- Cite key facts and statistics when relevant
+- Use markdown formatting (headers, bold, italics, lists)
+- Make it informative yet accessible"""
+
+# Built once at import time; only the human turn varies between calls
+_SECTION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=SECTION_SYSTEM_PROMPT),
+        HumanMessagePromptTemplate.from_template(
+            "Section Title: {section_title}\n\nSection Context:\n{section_context}"
+            "\n\nFull Context:\n{full_context}"
+        ),
+    ]
+)
+
+_METADATA_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=METADATA_SYSTEM_PROMPT),
+        HumanMessagePromptTemplate.from_template(
+            "Topic: {topic}\n\nContent preview:\n{content_preview}"
+            "\n\nResearch: {research_text}"
+        ),
+    ]
+)
+
+
+# Persona fields rendered into prompts, in prompt order, with their label in
+# the outline prompt (None when the outline leaves the field out) and in the
+# article prompt
+_PERSONA_CONTEXT_LINES = (
+    ("persona_name", "Target Audience", "Target Reader"),
+    ("tone", None, "Preferred Tone"),
+    ("depth", None, "Depth Level"),
+    ("primary_goal", "Audience Goal", "Reader's Goal"),
+    ("what_they_need", "Information Needs", "What Reader Needs"),
+    ("pain_points", "Address Pain Points", "Address Pain Points"),
+    ("attention_span", None, "Reader Time Available"),
+)
+
+
+@lru_cache(maxsize=64)
+def _article_system_template(
+    has_style: bool, has_audience: bool, persona_fields: Tuple[str, ...]
+) -> str:
+    """Return the article system prompt for one combination of instructions.
+
+    Only the shape of the instructions decides which lines the prompt has, so
+    the template is built once per shape and each call just fills in values.
+
+    Args:
+        has_style: Whether a writing style is given
+        has_audience: Whether a target audience is given
+        persona_fields: Persona fields with a value, in prompt order
+
+    Returns:
+        Prompt with {style}, {target_audience} and persona field placeholders
+    """
+    parts = [ARTICLE_SYSTEM_PROMPT]
+    if has_style:
+        parts.append("\nWriting Style: {style}")
+    if has_audience:
+        parts.append("\nTarget Audience: {target_audience}")
+    parts.extend(
+        f"\n{label}: {{{name}}}"
+        for name, _, label in _PERSONA_CONTEXT_LINES
+        if name in persona_fields
+    )
+    return "".join(parts)
+
+
+def _nested(mapping: Dict[str, Any], section: str, key: str) -> Any:
+    """Look up ``mapping[section][key]``, tolerating missing or non-dict sections."""
+    value = mapping.get(section)
+    return value.get(key) if isinstance(value, dict) else None
+
+
+@dataclass(frozen=True)
+class PersonaView:
+    """Flattened view of the persona fields the writer uses in its prompts."""
+
+    persona_name: Any = ""
+    primary_goal: Any = None
+    pain_points: List[Any] = field(default_factory=list)
+    what_they_need: Any = None
+    tone: Any = None
+    depth: Any = None
+    attention_span: Any = None
+
+    @classmethod
+    def from_dict(cls, persona: Dict[str, Any]) -> "PersonaView":
+        """Extract the writer's persona fields in a single pass.
+
+        Args:
+            persona: Detailed reader persona from audience strategist
+
+        Returns:
+            Persona view with missing fields left empty
+        """
+        return cls(
+            persona_name=persona.get("persona_name", ""),
+            primary_goal=_nested(persona, "goals", "primary_goal"),
+            pain_points=persona.get("pain_points") or [],
+            what_they_need=_nested(persona, "knowledge_state", "what_they_need"),
+            tone=_nested(persona, "content_preferences", "tone"),
+            depth=_nested(persona, "content_preferences", "depth"),
+            attention_span=_nested(persona, "reading_context", "attention_span"),
+        )
+
+    def prompt_values(self) -> Dict[str, Any]:
+        """Return the fields to render into prompts, skipping empty ones.
+
+        Returns:
+            Field values in prompt order, with the first three pain points
+            joined into one string
+        """
+        values = {}
+        for name, _, _ in _PERSONA_CONTEXT_LINES:
+            value = getattr(self, name)
+            if value:
+                values[name] = value
+        if self.pain_points:
+            values["pain_points"] = ", ".join(str(p) for p in self.pain_points[:3])
+        return values
 
 
 class WriterAgent:
     """Agent responsible for writing articles based on research."""
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: "ChatOpenAI", json_llm: Optional["ChatOpenAI"] = None):
         """Initialize the writer agent.
 
         Args:
             llm: Language model for content generation
+            json_llm: Optional JSON-mode model for article metadata; defaults
+                to llm
         """
         self.llm = llm
+        self.json_llm = json_llm or llm
         self.logger = logging.getLogger(__name__)
 
     def _build_persona_context(
-        self, persona: Optional[Dict[str, Any]], include_content_prefs: bool = False
+        self,
+        persona: Union[Dict[str, Any], PersonaView, None],
+        include_content_prefs: bool = False,
     ) -> str:
         """Build persona context string from persona dictionary.
 
         Args:
-            persona: Detailed reader persona from audience strategist
+            persona: Detailed reader persona from audience strategist, or a
+                PersonaView already extracted from one
             include_content_prefs: Whether to include content preferences
                 and reading context (used for full article writing)
 
         Returns:
             Formatted persona context string
         """
-        if not persona or not isinstance(persona, dict):
+        if isinstance(persona, dict) and persona:
+            persona = PersonaView.from_dict(persona)
+        if not isinstance(persona, PersonaView):
             return ""
 
-        context_parts = []
-
-        # Extract persona fields
-        persona_name = persona.get("persona_name", "")
-        goals = persona.get("goals", {})
-        pain_points = persona.get("pain_points", [])
-        knowledge_state = persona.get("knowledge_state", {})
-        content_prefs = persona.get("content_preferences", {})
-        reading_context = persona.get("reading_context", {})
-
-        if persona_name:
-            label = "Target Reader" if include_content_prefs else "Target Audience"
-            context_parts.append(f"\n{label}: {persona_name}")
-
-        # Include content preferences for full article writing
-        if include_content_prefs:
-            tone = content_prefs.get("tone")
-            if tone:
-                context_parts.append(f"\nPreferred Tone: {tone}")
-            depth = content_prefs.get("depth")
-            if depth:
-                context_parts.append(f"\nDepth Level: {depth}")
-
-        primary_goal = goals.get("primary_goal")
-        if primary_goal:
-            label = "Reader's Goal" if include_content_prefs else "Audience Goal"
-            context_parts.append(f"\n{label}: {primary_goal}")
-
-        what_they_need = knowledge_state.get("what_they_need")
-        if what_they_need:
-            label = (
-                "What Reader Needs" if include_content_prefs else "Information Needs"
-            )
-            context_parts.append(f"\n{label}: {what_they_need}")
-
-        if pain_points:
-            pain_points_str = ", ".join(str(p) for p in pain_points[:3])
-            context_parts.append(f"\nAddress Pain Points: {pain_points_str}")
-
-        # Include reading context for full article writing
-        if include_content_prefs:
-            attention_span = reading_context.get("attention_span")
-            if attention_span:
-                context_parts.append(f"\nReader Time Available: {attention_span}")
-
-        return "".join(context_parts)
+        # Content preferences and reading context are only used for full
+        # article writing
+        column = 2 if include_content_prefs else 1
+        values = persona.prompt_values()
+        return "".join(
+            f"\n{line[column]}: {values[line[0]]}"
+            for line in _PERSONA_CONTEXT_LINES
+            if line[column] and line[0] in values
+        )
 
     def _format_research_brief(self, research_brief: Dict[str, Any]) -> str:
         """Format structured research brief into text for article writing.
@@ -92,63 +253,57 @@ class WriterAgent:
         Returns:
             Formatted text representation of the research brief
         """
-        sections = []
-
-        # Key Statistics
-        key_statistics = research_brief.get("key_statistics", [])
-        if key_statistics:
-            sections.append("Key Statistics:")
-            for stat in key_statistics:
-                if isinstance(stat, dict):
-                    sections.append(f"- {stat.get('statistic', str(stat))}")
-                else:
-                    sections.append(f"- {stat}")
-
-        # Expert Quotes
-        expert_quotes = research_brief.get("expert_quotes", [])
-        if expert_quotes:
-            sections.append("\nExpert Quotes:")
-            for quote in expert_quotes:
-                if isinstance(quote, dict):
-                    sections.append(f"- {quote.get('quote', str(quote))}")
-                else:
-                    sections.append(f"- {quote}")
-
-        # Case Studies
-        case_studies = research_brief.get("case_studies", [])
-        if case_studies:
-            sections.append("\nCase Studies:")
-            for study in case_studies:
-                if isinstance(study, dict):
-                    sections.append(f"- {study.get('summary', str(study))}")
-                else:
-                    sections.append(f"- {study}")
+        buf = io.StringIO()
+
+        def start_section(heading: str) -> None:
+            # Sections are separated by a blank line, with none before the first
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write(heading)
+
+        def write_item(item: Any) -> None:
+            buf.write("\n- ")
+            buf.write(str(item))
+
+        for field_name, heading, item_key in _RESEARCH_BRIEF_ITEM_SECTIONS:
+            items = research_brief.get(field_name, [])
+            if items:
+                start_section(heading)
+                for item in items:
+                    if isinstance(item, dict):
+                        write_item(item.get(item_key, str(item)))
+                    else:
+                        write_item(item)
 
         # Key Definitions
         key_definitions = research_brief.get("key_definitions", {})
         if key_definitions:
-            sections.append("\nKey Definitions:")
+            start_section("Key Definitions:")
             for term, definition in key_definitions.items():
-                sections.append(f"- {term}: {definition}")
+                write_item(f"{term}: {definition}")
 
         # Counter Arguments
         counter_arguments = research_brief.get("counter_arguments", [])
         if counter_arguments:
-            sections.append("\nCounter Arguments:")
+            start_section("Counter Arguments:")
             for arg in counter_arguments:
-                sections.append(f"- {arg}")
+                write_item(arg)
 
-        return "\n".join(sections) if sections else ""
+        return buf.getvalue()
 
     def create_outline(
-        self, topic: str, research: str, persona: Optional[Dict[str, Any]] = None
+        self,
+        topic: str,
+        research: str,
+        persona: Union[Dict[str, Any], PersonaView, None] = None,
     ) -> str:
         """Create an article outline based on research.
 
         Args:
             topic: Article topic
             research: Formatted research text
-            persona: Detailed reader persona from audience strategist
+            persona: Detailed reader persona from audience strategist, or a
+                PersonaView already extracted from one
 
         Returns:
             Article outline
@@ -160,32 +315,20 @@ class WriterAgent:
             persona, include_content_prefs=False
         )
 
-        base_instructions = (
-            """The outline should be logical, engaging, and comprehensive."""
-        )
+        system_prompt = OUTLINE_SYSTEM_PROMPT
         if persona_context:
-            base_instructions += (
+            system_prompt += (
                 f"\nTailor the structure to the target audience: {persona_context}"
             )
 
-        prompt = ChatPromptTemplate.from_messages(
+        # The messages are complete, so they go to the model without a template
+        response = self.llm.invoke(
             [
-                SystemMessage(
-                    content=f"""You are a professional content writer. Create a detailed article outline with:
-1. An engaging title
-2. Introduction hook
-3. 3-5 main sections with subsections
-4. Conclusion
-5. Key points to cover in each section
-
-{base_instructions}"""
-                ),
+                SystemMessage(content=system_prompt),
                 HumanMessage(content=f"Topic: {topic}\n\nResearch:\n{research}"),
             ]
         )
 
-        response = self.llm.invoke(prompt.format_messages())
-
         return response.content
 
     def write_section(
@@ -203,25 +346,14 @@ class WriterAgent:
         """
         self.logger.info(f"Writing section: {section_title}")
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content="""You are a professional content writer. Write an engaging, informative section for an article.
-Requirements:
-- Use clear, accessible language
-- Include specific examples and details
-- Maintain a professional yet conversational tone
-- Use proper formatting with paragraphs
-- Aim for 200-400 words per section"""
-                ),
-                HumanMessage(
-                    content=f"Section Title: {section_title}\n\nSection Context:\n{section_context}\n\nFull Context:\n{full_context}"
-                ),
-            ]
+        response = self.llm.invoke(
+            _SECTION_PROMPT.format_messages(
+                section_title=section_title,
+                section_context=section_context,
+                full_context=full_context,
+            )
         )
 
-        response = self.llm.invoke(prompt.format_messages())
-
         return response.content
 
     def write_article(
@@ -231,6 +363,7 @@ Requirements:
         style: Optional[str] = None,
         target_audience: Optional[str] = None,
         persona: Optional[Dict[str, Any]] = None,
+        on_preview: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Write a complete article based on research.
 
@@ -240,6 +373,8 @@ Requirements:
             style: Writing style (e.g., "professional", "casual", "technical")
             target_audience: Target audience description
             persona: Detailed reader persona from audience strategist
+            on_preview: Optional callback invoked once with the article's
+                content preview as soon as it has been streamed
 
         Returns:
             Dictionary containing the article and metadata
@@ -251,64 +386,81 @@ Requirements:
         research_synthesis = self._format_research_brief(research_brief)
         research_analysis = research_data.get("analysis", "")
 
-        # Create style instructions
-        style_instruction = ""
-        if style:
-            style_instruction += f"\nWriting Style: {style}"
-        if target_audience:
-            style_instruction += f"\nTarget Audience: {target_audience}"
-
-        # Add persona-based instructions if available
-        persona_instruction = self._build_persona_context(
-            persona, include_content_prefs=True
+        # Extract the persona once; both the outline and article prompts use it
+        if isinstance(persona, dict) and persona:
+            persona = PersonaView.from_dict(persona)
+        persona_values = (
+            persona.prompt_values() if isinstance(persona, PersonaView) else {}
         )
 
+        # Fill the prompt template for this combination of style and persona
+        system_prompt = _article_system_template(
+            bool(style), bool(target_audience), tuple(persona_values)
+        ).format(style=style, target_audience=target_audience, **persona_values)
+
         # Create outline
         outline = self.create_outline(topic, research_synthesis, persona)
 
         # Generate full article
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content=f"""You are a professional content writer. Write a comprehensive, engaging article based on the provided research and outline.
-
-Requirements:
-- Follow the outline structure
-- Write 1200-1500 words
-- Use clear, engaging language
-- Include an introduction, body sections, and conclusion
-- Add smooth transitions between sections
-- Cite key facts and statistics when relevant
-- Use markdown formatting (headers, bold, italics, lists)
-- Make it informative yet accessible{style_instruction}{persona_instruction}"""
-                ),
-                HumanMessage(
-                    content=f"Topic: {topic}\n\nOutline:\n{outline}\n\nResearch:\n{research_synthesis}\n\nAnalysis:\n{research_analysis}"
-                ),
-            ]
-        )
-
-        response = self.llm.invoke(prompt.format_messages())
-        article_content = response.content
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(
+                content=f"Topic: {topic}\n\nOutline:\n{outline}\n\nResearch:\n{research_synthesis}\n\nAnalysis:\n{research_analysis}"
+            ),
+        ]
+
+        # Stream the article so the metadata, which only needs the opening, is
+        # generated while the rest of the article is decoded
+        research_text = research_synthesis[:META_PREVIEW_LENGTH]
+        background = ThreadPoolExecutor(max_workers=1)
+        parts = []
+        streamed_length = 0
+        metadata_future = None
+        preview_sent = False
+        try:
+            for chunk in self.llm.stream(messages):
+                parts.append(chunk.content)
+                streamed_length += len(chunk.content)
+                if metadata_future is None and streamed_length >= META_PREVIEW_LENGTH:
+                    metadata_future = background.submit(
+                        self._generate_metadata, topic, "".join(parts), research_text
+                    )
+                if (
+                    on_preview is not None
+                    and not preview_sent
+                    and streamed_length >= CONTENT_PREVIEW_LENGTH
+                ):
+                    on_preview("".join(parts)[:CONTENT_PREVIEW_LENGTH])
+                    preview_sent = True
+            article_content = "".join(parts)
+            if on_preview is not None and not preview_sent:
+                on_preview(article_content[:CONTENT_PREVIEW_LENGTH])
+        finally:
+            # Submitted tasks still run to completion after shutdown(wait=False),
+            # and a failed stream must not leave the executor behind
+            background.shutdown(wait=False)
 
         # Generate title
         title = (
             self._extract_title(article_content) or f"A Comprehensive Guide to {topic}"
         )
 
-        # Generate meta description
-        meta_description = self._generate_meta_description(topic, article_content)
-
-        # Generate tags
-        tags = self._generate_tags(topic, research_data)
+        # Generate metadata unless the article was too short to start it early
+        if metadata_future is not None:
+            meta_description, tags = metadata_future.result()
+        else:
+            meta_description, tags = self._generate_metadata(
+                topic, article_content, research_text
+            )
 
         return {
             "title": title,
             "content": article_content,
+            "content_preview": article_content[:CONTENT_PREVIEW_LENGTH],
             "outline": outline,
             "meta_description": meta_description,
             "tags": tags,
-            "word_count": len(article_content.split()),
+            "word_count": sum(1 for _ in _WORD_RE.finditer(article_content)),
             "topic": topic,
         }
 
@@ -321,62 +473,59 @@ Requirements:
         Returns:
             Extracted title or None
         """
-        lines = content.split("\n")
-        for line in lines:
-            line = line.strip()
-            if line.startswith("# "):
-                return line[2:].strip()
-        return None
+        match = _TITLE_RE.search(content)
+        return match.group(1).strip() if match else None
 
-    def _generate_meta_description(self, topic: str, content: str) -> str:
-        """Generate a meta description for the article.
+    def _generate_metadata(
+        self, topic: str, content: str, research_text: str
+    ) -> Tuple[str, List[str]]:
+        """Generate the meta description and tags with a single LLM call.
 
         Args:
             topic: Article topic
-            content: Article content
+            content: Article content, or at least its opening
+            research_text: Formatted research brief excerpt
 
         Returns:
-            Meta description
+            Tuple of the meta description and up to 8 tags
         """
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content="Generate a compelling meta description (150-160 characters) for this article."
-                ),
-                HumanMessage(
-                    content=f"Topic: {topic}\n\nContent preview:\n{content[:500]}"
-                ),
-            ]
-        )
-
-        response = self.llm.invoke(prompt.format_messages())
-
-        return response.content.strip()
-
-    def _generate_tags(self, topic: str, research_data: Dict[str, Any]) -> list:
-        """Generate relevant tags for the article.
-
-        Args:
-            topic: Article topic
-            research_data: Research data
-
-        Returns:
-            List of tags
-        """
-        # Format research brief for tag generation
-        research_brief = research_data.get("research_brief", {})
-        research_text = self._format_research_brief(research_brief)[:500]
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content="Generate 5-8 relevant tags for this article. Return only the tags, comma-separated."
-                ),
-                HumanMessage(content=f"Topic: {topic}\n\nResearch: {research_text}"),
-            ]
+        response = self.json_llm.invoke(
+            _METADATA_PROMPT.format_messages(
+                topic=topic,
+                content_preview=content[:META_PREVIEW_LENGTH],
+                research_text=research_text,
+            )
         )
 
-        response = self.llm.invoke(prompt.format_messages())
-        tags = [tag.strip() for tag in response.content.split(",")]
-
-        return tags[:8]  # Limit to 8 tags
+        content = response.content
+        try:
+            metadata = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            match = _JSON_OBJECT_RE.search(content)
+            if match is None:
+                self.logger.error("Failed to parse article metadata JSON")
+                return "", []
+            self.logger.warning("Article metadata JSON was wrapped in extra text")
+            try:
+                metadata = orjson.loads(match.group(0))
+            except orjson.JSONDecodeError:
+                self.logger.error("Failed to parse article metadata JSON")
+                return "", []
+
+        if not isinstance(metadata, dict):
+            self.logger.error("Article metadata JSON is not an object")
+            return "", []
+
+        meta_description = metadata.get("meta_description")
+        if not isinstance(meta_description, str):
+            meta_description = ""
+
+        tags = metadata.get("tags")
+        if isinstance(tags, str):
+            # Some responses list the tags in one string, e.g. "a, b; c\n- d"
+            tags = _TAG_RE.findall(tags)
+        elif not isinstance(tags, list):
+            tags = []
+        tags = [tag for tag in (str(t).strip(" -#\t") for t in tags) if tag]
+
+        return meta_description.strip(), tags[:8]  # Limit to 8 tags
@@ -1,15 +1,73 @@
 """Command-line interface for the content creation agent."""
 
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .orchestrator import ContentCreationOrchestrator
-from .utils import Config, setup_logger
+from .utils import Config, setup_logger, skip_unused_record_details
+from .utils.logger import LOG_LEVELS
 
 console = Console()
 
+# The spinner only conveys that work is ongoing, so a few frames per second is
+# plenty and saves terminal writes during minutes-long LLM calls
+SPINNER_REFRESH_PER_SECOND = 4
+
+# Platforms the publisher knows how to publish to
+PLATFORMS = ("file", "medium")
+
+
+@contextmanager
+def _spinner(description: str) -> Iterator[None]:
+    """Show a spinner while the block runs.
+
+    Nothing is drawn when output is not a terminal (e.g. CI logs or pipes).
+
+    Args:
+        description: Text shown next to the spinner
+    """
+    if not console.is_terminal:
+        yield
+        return
+
+    # Imported here so commands that never show a spinner don't load it
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=SPINNER_REFRESH_PER_SECOND,
+        transient=True,
+    ) as progress:
+        progress.add_task(description, total=None)
+        yield
+
+
+def _print_stage(stage: str, result: Dict[str, Any]) -> None:
+    """Report a completed pipeline stage as soon as it finishes.
+
+    Args:
+        stage: Pipeline stage name
+        result: Stage result from the orchestrator
+    """
+    if stage == "audience":
+        message = f"Audience persona: {result.get('persona_name')}"
+    elif stage == "research":
+        message = f"Research found {result.get('sources_count', 0)} sources"
+    elif stage == "writing":
+        message = (
+            f"Article written: {result.get('title')} ({result.get('word_count')} words)"
+        )
+    elif stage == "images":
+        message = f"Found {result.get('images_found', 0)} images"
+    else:
+        message = f"{stage.capitalize()} completed"
+    console.print(f"[green]✓[/green] {message}")
+
 
 @click.group()
 def cli():
@@ -30,17 +88,30 @@ def cli():
 )
 @click.option("--audience", default=None, help="Target audience description")
 @click.option(
-    "--platform", multiple=True, default=["file"], help="Publishing platform(s)"
+    "--platform",
+    type=click.Choice(PLATFORMS, case_sensitive=False),
+    multiple=True,
+    default=["file"],
+    help="Publishing platform(s)",
 )
 @click.option("--output-dir", default="output", help="Output directory for files")
-@click.option("--log-level", default="INFO", help="Logging level")
+@click.option(
+    "--log-level",
+    type=click.Choice(list(LOG_LEVELS), case_sensitive=False),
+    default="INFO",
+    help="Logging level",
+)
 def create(topic, style, audience, platform, output_dir, log_level):
     """Create and publish content on a given TOPIC.
 
     Example:
         content-agent create "Artificial Intelligence in Healthcare" --style professional
     """
+    # Imported here so the other commands don't pay for loading LangChain
+    from .orchestrator import ContentCreationOrchestrator
+
     # Setup
+    skip_unused_record_details()
     logger = setup_logger(level=log_level)
 
     console.print(
@@ -51,17 +122,12 @@ def create(topic, style, audience, platform, output_dir, log_level):
         )
     )
 
+    orchestrator = None
     try:
         # Load configuration
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("[cyan]Loading configuration...", total=None)
+        with _spinner("[cyan]Loading configuration..."):
             config = Config.from_env()
             config.validate_required()
-            progress.update(task, completed=True)
 
         console.print("[green]✓[/green] Configuration loaded")
 
@@ -70,25 +136,16 @@ def create(topic, style, audience, platform, output_dir, log_level):
         console.print("[green]✓[/green] Agents initialized")
 
         # Run content creation pipeline
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            # Research
-            task1 = progress.add_task("[cyan]Researching topic...", total=None)
-
-            # Execute pipeline
+        with _spinner("[cyan]Creating content..."):
             results = orchestrator.create_content(
                 topic=topic,
                 style=style,
                 target_audience=audience,
                 platforms=list(platform),
                 output_dir=output_dir,
+                on_stage=_print_stage,
             )
 
-            progress.update(task1, completed=True)
-
         # Display results
         if results.get("status") == "completed":
             console.print(
@@ -126,6 +183,9 @@ def create(topic, style, audience, platform, output_dir, log_level):
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
         logger.exception("Content creation failed")
+    finally:
+        if orchestrator is not None:
+            orchestrator.close()
 
 
 @cli.command()
@@ -1,8 +1,11 @@
 """Main orchestrator for the content creation pipeline."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from typing import Any, Callable, Dict, List, Optional
 
+import httpx
 from langchain_openai import ChatOpenAI
 
 from .agents import (
@@ -12,7 +15,35 @@ from .agents import (
     ResearchAgent,
     WriterAgent,
 )
-from .utils import Config
+from .utils import Config, DiskCache
+
+# Fixed layout of the report returned by get_summary, parsed once at import
+_SUMMARY_TEMPLATE = Template(
+    """
+Content Creation Summary
+========================
+
+Topic: $topic
+Status: $status
+
+Article Details:
+- Title: $title
+- Word Count: $word_count
+- Tags: $tags
+
+Pipeline Stages:
+- Audience: $persona_name
+- Research: $sources_count sources found
+- Writing: Completed
+- Images: $images_found images found
+- Publishing: Completed
+
+Publication Results:
+"""
+)
+_PUBLISHED_LINE = Template("- $platform: Success\n")
+_SAVED_LINE = Template("- $platform: Success (saved to $path)\n")
+_FAILED_LINE = Template("- $platform: Failed ($error)\n")
 
 
 class ContentCreationOrchestrator:
@@ -27,19 +58,43 @@ class ContentCreationOrchestrator:
         self.config = config
         self.logger = logging.getLogger(__name__)
 
-        # Initialize LLM
+        # One pooled HTTP/2 client shared by every model instance, so all agents
+        # reuse the same connections to the OpenAI API
+        self.http_client = httpx.Client(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+
+        # Initialize LLMs. Agents that parse the response as a JSON object get
+        # a JSON-mode model so the API guarantees syntactically valid output.
         self.llm = ChatOpenAI(
             model=config.openai_model,
             temperature=config.temperature,
             api_key=config.openai_api_key,
+            max_retries=config.max_retries,
+            http_client=self.http_client,
         )
+        self.json_llm = ChatOpenAI(
+            model=config.openai_model,
+            temperature=config.temperature,
+            api_key=config.openai_api_key,
+            max_retries=config.max_retries,
+            http_client=self.http_client,
+            model_kwargs={"response_format": {"type": "json_object"}},
+        )
+
+        # Optional on-disk cache for repeated LLM and API results
+        self.cache = DiskCache(config.cache_dir) if config.cache_dir else None
 
         # Initialize agents
-        self.audience_strategist = AudienceStrategist(llm=self.llm)
+        self.audience_strategist = AudienceStrategist(
+            llm=self.json_llm, cache=self.cache
+        )
         self.research_agent = ResearchAgent(
-            llm=self.llm, max_sources=config.max_research_sources
+            llm=self.llm, max_sources=config.max_research_sources, cache=self.cache
         )
-        self.writer_agent = WriterAgent(llm=self.llm)
+        self.writer_agent = WriterAgent(llm=self.llm, json_llm=self.json_llm)
         self.image_agent = ImageAgent(
             llm=self.llm,
             unsplash_key=config.unsplash_access_key,
@@ -47,11 +102,17 @@ class ContentCreationOrchestrator:
             order_by=config.unsplash_order_by,
             content_filter=config.unsplash_content_filter,
             orientation=config.unsplash_orientation,
+            cache=self.cache,
         )
         self.publisher_agent = PublisherAgent(medium_token=config.medium_access_token)
 
         self.logger.info("Content creation orchestrator initialized")
 
+    def close(self) -> None:
+        """Release network resources held by the orchestrator and its agents."""
+        self.image_agent.close()
+        self.http_client.close()
+
     def create_content(
         self,
         topic: str,
@@ -59,6 +120,8 @@ class ContentCreationOrchestrator:
         target_audience: Optional[str] = None,
         platforms: Optional[List[str]] = None,
         output_dir: str = "output",
+        persona: Optional[Dict[str, Any]] = None,
+        on_stage: Optional[Callable[[str, Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """Execute the full content creation pipeline.
 
@@ -68,6 +131,9 @@ class ContentCreationOrchestrator:
             target_audience: Target audience description
             platforms: List of platforms to publish to
             output_dir: Output directory for saving files
+            persona: Optional precomputed reader persona; skips audience analysis
+            on_stage: Optional callback invoked with each stage's name and
+                result as soon as that stage completes
 
         Returns:
             Dictionary containing all results from the pipeline
@@ -75,73 +141,130 @@ class ContentCreationOrchestrator:
         if platforms is None:
             platforms = ["file"]
 
-        self.logger.info(f"Starting content creation pipeline for topic: {topic}")
+        self.logger.info("Starting content creation pipeline for topic: %s", topic)
 
         results = {"topic": topic, "status": "in_progress", "stages": {}}
 
-        try:
-            # Stage 1: Audience Analysis
-            self.logger.info("Stage 1/5: Analyzing target audience...")
-            persona = self.audience_strategist.analyze(
-                topic, audience_hint=target_audience
-            )
-            results["stages"]["audience"] = {
-                "status": "completed",
-                "persona_name": persona.get("persona_name", "Unknown"),
-            }
-            self.logger.info(
-                f"Audience persona created: {persona.get('persona_name', 'Unknown')}"
-            )
+        def complete_stage(name: str, stage_result: Dict[str, Any]) -> None:
+            results["stages"][name] = stage_result
+            if on_stage is not None:
+                on_stage(name, stage_result)
 
-            # Stage 2: Research
-            self.logger.info("Stage 2/5: Researching topic...")
-            research_data = self.research_agent.research(topic)
-            results["stages"]["research"] = {
-                "status": "completed",
-                "sources_count": research_data.get("sources_count", 0),
-            }
-            self.logger.info(
-                f"Research completed with {research_data.get('sources_count', 0)} sources"
-            )
-
-            # Stage 3: Writing
-            self.logger.info("Stage 3/5: Writing article...")
-            article_data = self.writer_agent.write_article(
-                topic=topic,
-                research_data=research_data,
-                style=style,
-                target_audience=target_audience,
-                persona=persona,
-            )
-            results["stages"]["writing"] = {
-                "status": "completed",
-                "title": article_data.get("title"),
-                "word_count": article_data.get("word_count"),
-            }
-            self.logger.info(
-                f"Article completed: {article_data.get('title')} ({article_data.get('word_count')} words)"
-            )
+        try:
+            # Audience analysis and research both only need the topic, and image
+            # search only needs the article's opening, so each runs in the
+            # background while the next stage proceeds on this thread
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Stage 1: Audience Analysis
+                self.logger.info("Stage 1/5: Analyzing target audience...")
+                persona_future = None
+                if persona is None:
+                    persona_future = executor.submit(
+                        self.audience_strategist.analyze,
+                        topic,
+                        audience_hint=target_audience,
+                    )
+
+                # Stage 2: Research
+                self.logger.info("Stage 2/5: Researching topic...")
+                research_data = self.research_agent.research(topic)
+
+                if persona_future is not None:
+                    persona = persona_future.result()
+                complete_stage(
+                    "audience",
+                    {
+                        "status": "completed",
+                        "persona_name": persona.get("persona_name", "Unknown"),
+                    },
+                )
+                self.logger.info(
+                    "Audience persona created: %s",
+                    persona.get("persona_name", "Unknown"),
+                )
+
+                complete_stage(
+                    "research",
+                    {
+                        "status": "completed",
+                        "sources_count": research_data.get("sources_count", 0),
+                    },
+                )
+                self.logger.info(
+                    "Research completed with %s sources",
+                    research_data.get("sources_count", 0),
+                )
+
+                # Stage 4 starts early: as soon as the writer has streamed the
+                # article's opening, image queries are generated from it and the
+                # Unsplash searches overlap the rest of the writing
+                images_futures = []
+
+                def start_image_search(content_preview: str) -> None:
+                    self.logger.info("Stage 4/5: Finding relevant images...")
+                    images_futures.append(
+                        executor.submit(
+                            self.image_agent.find_images,
+                            topic,
+                            {"content_preview": content_preview},
+                        )
+                    )
+
+                # Stage 3: Writing
+                self.logger.info("Stage 3/5: Writing article...")
+                article_data = self.writer_agent.write_article(
+                    topic=topic,
+                    research_data=research_data,
+                    style=style,
+                    target_audience=target_audience,
+                    persona=persona,
+                    on_preview=start_image_search,
+                )
+                complete_stage(
+                    "writing",
+                    {
+                        "status": "completed",
+                        "title": article_data.get("title"),
+                        "word_count": article_data.get("word_count"),
+                    },
+                )
+                self.logger.info(
+                    "Article completed: %s (%s words)",
+                    article_data.get("title"),
+                    article_data.get("word_count"),
+                )
+
+                # Writers that never report a preview search from the result
+                if not images_futures:
+                    start_image_search(
+                        article_data.get("content_preview")
+                        or article_data.get("content", "")
+                    )
+                images = images_futures[0].result()
 
-            # Stage 4: Finding images
-            self.logger.info("Stage 4/5: Finding relevant images...")
-            images = self.image_agent.find_images(topic, article_data)
             article_data["images"] = images
             article_data["sources_count"] = research_data.get("sources_count", 0)
-            results["stages"]["images"] = {
-                "status": "completed",
-                "images_found": len(images),
-            }
-            self.logger.info(f"Found {len(images)} relevant images")
+            complete_stage(
+                "images",
+                {
+                    "status": "completed",
+                    "images_found": len(images),
+                },
+            )
+            self.logger.info("Found %d relevant images", len(images))
 
             # Stage 5: Publishing
             self.logger.info("Stage 5/5: Publishing content...")
             publish_results = self.publisher_agent.publish(
                 article_data=article_data, platforms=platforms, output_dir=output_dir
             )
-            results["stages"]["publishing"] = {
-                "status": "completed",
-                "results": publish_results,
-            }
+            complete_stage(
+                "publishing",
+                {
+                    "status": "completed",
+                    "results": publish_results,
+                },
+            )
             self.logger.info("Publishing completed")
 
             # Final results
@@ -156,11 +279,11 @@ class ContentCreationOrchestrator:
             results["publication"] = publish_results
 
             self.logger.info(
-                f"Content creation pipeline completed successfully for: {topic}"
+                "Content creation pipeline completed successfully for: %s", topic
             )
 
         except Exception as e:
-            self.logger.error(f"Content creation pipeline failed: {str(e)}")
+            self.logger.error("Content creation pipeline failed: %s", e)
             results["status"] = "failed"
             results["error"] = str(e)
             raise
@@ -179,38 +302,35 @@ class ContentCreationOrchestrator:
         if results.get("status") != "completed":
             return f"Pipeline status: {results.get('status')}"
 
-        article = results.get("article", {})
-        stages = results.get("stages", {})
-
-        summary = f"""
-Content Creation Summary
-========================
-
-Topic: {results.get("topic")}
-Status: {results.get("status")}
-
-Article Details:
-- Title: {article.get("title")}
-- Word Count: {article.get("word_count")}
-- Tags: {", ".join(article.get("tags", []))}
-
-Pipeline Stages:
-- Audience: {stages.get("audience", {}).get("persona_name", "N/A")}
-- Research: {stages.get("research", {}).get("sources_count", 0)} sources found
-- Writing: Completed
-- Images: {stages.get("images", {}).get("images_found", 0)} images found
-- Publishing: Completed
-
-Publication Results:
-"""
+        article = results.get("article") or {}
+        stages = results.get("stages") or {}
+
+        parts = [
+            _SUMMARY_TEMPLATE.substitute(
+                topic=results.get("topic"),
+                status=results.get("status"),
+                title=article.get("title"),
+                word_count=article.get("word_count"),
+                tags=", ".join(article.get("tags", [])),
+                persona_name=stages.get("audience", {}).get("persona_name", "N/A"),
+                sources_count=stages.get("research", {}).get("sources_count", 0),
+                images_found=stages.get("images", {}).get("images_found", 0),
+            )
+        ]
 
         for platform, result in results.get("publication", {}).items():
-            if result.get("success"):
-                summary += f"- {platform.capitalize()}: Success"
-                if "markdown_file" in result:
-                    summary += f" (saved to {result['markdown_file']})"
-                summary += "\n"
+            name = platform.capitalize()
+            if not result.get("success"):
+                parts.append(
+                    _FAILED_LINE.substitute(
+                        platform=name, error=result.get("error", "Unknown error")
+                    )
+                )
+            elif "markdown_file" in result:
+                parts.append(
+                    _SAVED_LINE.substitute(platform=name, path=result["markdown_file"])
+                )
             else:
-                summary += f"- {platform.capitalize()}: Failed ({result.get('error', 'Unknown error')})\n"
+                parts.append(_PUBLISHED_LINE.substitute(platform=name))
 
-        return summary
+        return "".join(parts)
@@ -1,6 +1,7 @@
 """Utility modules."""
 
+from .cache import DiskCache
 from .config import Config
-from .logger import setup_logger
+from .logger import setup_logger, skip_unused_record_details
 
-__all__ = ["Config", "setup_logger"]
+__all__ = ["Config", "DiskCache", "setup_logger", "skip_unused_record_details"]
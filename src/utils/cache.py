@@ -0,0 +1,93 @@
+"""Disk-backed cache for reusing expensive LLM and API results."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+
+class DiskCache:
+    """JSON file cache with optional per-entry expiry.
+
+    Each entry is stored in its own file named after its key, so concurrent
+    writers never contend on a shared index file.
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory where cache entries are stored
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from the given parts.
+
+        Args:
+            *parts: Values identifying the cached result
+
+        Returns:
+            SHA-256 hex digest of the joined parts
+        """
+        raw = "|".join(str(part) for part in parts)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing, expired, or unreadable
+        """
+        try:
+            entry = orjson.loads(self._entry_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {key}: {str(e)}")
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < time.time():
+            return None
+
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+            expire: Optional lifetime of the entry in seconds
+        """
+        entry = {
+            "expires_at": time.time() + expire if expire else None,
+            "value": value,
+        }
+
+        # Write to a temporary file first so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, self._entry_path(key))
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to write cache entry {key}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
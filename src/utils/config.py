@@ -1,100 +1,143 @@
 """Configuration management for the content creation agent."""
 
 import os
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal, Optional, Tuple, get_args
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator
-
-
-class Config(BaseModel):
-    """Configuration settings for the content creation agent."""
-
-    openai_api_key: str = Field(default="")
-    medium_access_token: Optional[str] = Field(default=None)
-    unsplash_access_key: Optional[str] = Field(default=None)
-    openai_model: str = Field(default="gpt-4-turbo-preview")
-    temperature: float = Field(default=0.7)
-    log_level: str = Field(default="INFO")
-    max_research_sources: int = Field(default=5)
-    max_retries: int = Field(default=3)
-    unsplash_per_page: int = Field(default=10)
-    unsplash_order_by: str = Field(default="relevant")
-    unsplash_content_filter: str = Field(default="high")
-    unsplash_orientation: str = Field(default="landscape")
-
-    @field_validator("unsplash_per_page")
-    @classmethod
-    def validate_per_page(cls, v: int) -> int:
-        """Validate unsplash_per_page is within valid range."""
-        if not 1 <= v <= 30:
-            raise ValueError("unsplash_per_page must be between 1 and 30")
-        return v
 
-    @field_validator("unsplash_order_by")
-    @classmethod
-    def validate_order_by(cls, v: str) -> str:
-        """Validate unsplash_order_by has valid value."""
-        if v not in ["relevant", "latest"]:
-            raise ValueError("unsplash_order_by must be 'relevant' or 'latest'")
-        return v
+# Environment variables read by Config.from_env; their current values key the
+# cache of parsed configurations
+_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "MEDIUM_ACCESS_TOKEN",
+    "UNSPLASH_ACCESS_KEY",
+    "OPENAI_MODEL",
+    "TEMPERATURE",
+    "LOG_LEVEL",
+    "MAX_RESEARCH_SOURCES",
+    "MAX_RETRIES",
+    "UNSPLASH_PER_PAGE",
+    "UNSPLASH_ORDER_BY",
+    "UNSPLASH_CONTENT_FILTER",
+    "UNSPLASH_ORIENTATION",
+    "CACHE_DIR",
+)
 
-    @field_validator("unsplash_content_filter")
-    @classmethod
-    def validate_content_filter(cls, v: str) -> str:
-        """Validate unsplash_content_filter has valid value."""
-        if v not in ["low", "high"]:
-            raise ValueError("unsplash_content_filter must be 'low' or 'high'")
-        return v
+# Accepted values for the Unsplash search settings
+UnsplashOrderBy = Literal["relevant", "latest"]
+UnsplashContentFilter = Literal["low", "high"]
+UnsplashOrientation = Literal["landscape", "portrait", "squarish"]
 
-    @field_validator("unsplash_orientation")
-    @classmethod
-    def validate_orientation(cls, v: str) -> str:
-        """Validate unsplash_orientation has valid value."""
-        if v not in ["landscape", "portrait", "squarish"]:
+# The .env file only needs to be read into the environment once per process
+_dotenv_loaded = False
+
+
+@dataclass(frozen=True)
+class Config:
+    """Configuration settings for the content creation agent.
+
+    Instances returned by from_env are shared, so the dataclass is frozen.
+    """
+
+    openai_api_key: str = ""
+    medium_access_token: Optional[str] = None
+    unsplash_access_key: Optional[str] = None
+    openai_model: str = "gpt-4-turbo-preview"
+    temperature: float = 0.7
+    log_level: str = "INFO"
+    max_research_sources: int = 5
+    max_retries: int = 3
+    unsplash_per_page: int = 10
+    unsplash_order_by: UnsplashOrderBy = "relevant"
+    unsplash_content_filter: UnsplashContentFilter = "high"
+    unsplash_orientation: UnsplashOrientation = "landscape"
+    cache_dir: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate the Unsplash search settings."""
+        if not 1 <= self.unsplash_per_page <= 30:
+            raise ValueError("unsplash_per_page must be between 1 and 30")
+        if self.unsplash_order_by not in get_args(UnsplashOrderBy):
+            raise ValueError("unsplash_order_by must be 'relevant' or 'latest'")
+        if self.unsplash_content_filter not in get_args(UnsplashContentFilter):
+            raise ValueError("unsplash_content_filter must be 'low' or 'high'")
+        if self.unsplash_orientation not in get_args(UnsplashOrientation):
             raise ValueError(
                 "unsplash_orientation must be 'landscape', 'portrait', or 'squarish'"
             )
-        return v
 
     @classmethod
     def from_env(cls) -> "Config":
-        """Load configuration from environment variables."""
-        load_dotenv()
+        """Load configuration from environment variables.
+
+        The .env file is read on the first call only, and the parsed
+        configuration is reused for as long as the variables are unchanged.
+        """
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            load_dotenv()
+            _dotenv_loaded = True
+
+        return cls._from_env_values(tuple(os.environ.get(name) for name in _ENV_VARS))
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Forget configurations parsed by from_env."""
+        cls._from_env_values.cache_clear()
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _from_env_values(cls, values: Tuple[Optional[str], ...]) -> "Config":
+        """Parse a configuration from a snapshot of the environment variables.
+
+        Args:
+            values: Values of _ENV_VARS, in order, with None for unset ones
+
+        Returns:
+            Parsed configuration
+        """
+        env = dict(zip(_ENV_VARS, values))
+
+        def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+            value = env[name]
+            return default if value is None else value
 
         # Parse integer values with better error handling
         try:
-            max_research_sources = int(os.getenv("MAX_RESEARCH_SOURCES", "5"))
+            max_research_sources = int(getenv("MAX_RESEARCH_SOURCES", "5"))
         except ValueError as e:
             raise ValueError(
                 "Invalid value for MAX_RESEARCH_SOURCES: must be an integer"
             ) from e
 
         try:
-            max_retries = int(os.getenv("MAX_RETRIES", "3"))
+            max_retries = int(getenv("MAX_RETRIES", "3"))
         except ValueError as e:
             raise ValueError("Invalid value for MAX_RETRIES: must be an integer") from e
 
         try:
-            unsplash_per_page = int(os.getenv("UNSPLASH_PER_PAGE", "10"))
+            unsplash_per_page = int(getenv("UNSPLASH_PER_PAGE", "10"))
         except ValueError as e:
             raise ValueError(
                 "Invalid value for UNSPLASH_PER_PAGE: must be an integer"
             ) from e
 
         return cls(
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-            medium_access_token=os.getenv("MEDIUM_ACCESS_TOKEN"),
-            unsplash_access_key=os.getenv("UNSPLASH_ACCESS_KEY"),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
-            temperature=float(os.getenv("TEMPERATURE", "0.7")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            openai_api_key=getenv("OPENAI_API_KEY", ""),
+            medium_access_token=getenv("MEDIUM_ACCESS_TOKEN"),
+            unsplash_access_key=getenv("UNSPLASH_ACCESS_KEY"),
+            openai_model=getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
+            temperature=float(getenv("TEMPERATURE", "0.7")),
+            log_level=getenv("LOG_LEVEL", "INFO"),
             max_research_sources=max_research_sources,
             max_retries=max_retries,
             unsplash_per_page=unsplash_per_page,
-            unsplash_order_by=os.getenv("UNSPLASH_ORDER_BY", "relevant"),
-            unsplash_content_filter=os.getenv("UNSPLASH_CONTENT_FILTER", "high"),
-            unsplash_orientation=os.getenv("UNSPLASH_ORIENTATION", "landscape"),
+            unsplash_order_by=getenv("UNSPLASH_ORDER_BY", "relevant"),
+            unsplash_content_filter=getenv("UNSPLASH_CONTENT_FILTER", "high"),
+            unsplash_orientation=getenv("UNSPLASH_ORIENTATION", "landscape"),
+            cache_dir=getenv("CACHE_DIR") or None,
         )
 
     def validate_required(self) -> None:
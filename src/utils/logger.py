@@ -2,7 +2,28 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional
+
+# Level names accepted by setup_logger and the CLI's --log-level option
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Second-resolution timestamps skip formatting milliseconds into every record
+DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Built once; setup_logger only creates a formatter for custom format strings
+_default_formatter = logging.Formatter(DEFAULT_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
+
+# Console handler installed by setup_logger for each logger name, reused by
+# later calls instead of being torn down and recreated
+_console_handlers: Dict[str, logging.StreamHandler] = {}
 
 
 def setup_logger(
@@ -20,23 +41,47 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
+    log_level = LOG_LEVELS[level.upper()]
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
 
-    # Remove existing handlers
-    logger.handlers.clear()
+    handler = _console_handlers.get(name)
+    if handler is None or handler not in logger.handlers:
+        # Remove existing handlers
+        logger.handlers.clear()
 
-    # Console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, level.upper()))
+        # Console handler
+        handler = logging.StreamHandler(sys.stdout)
+        logger.addHandler(handler)
+        _console_handlers[name] = handler
+    elif handler.stream is not sys.stdout:
+        # sys.stdout may have been replaced since the handler was created
+        handler.setStream(sys.stdout)
 
-    # Formatter
-    formatter = logging.Formatter(format_string)
-    handler.setFormatter(formatter)
+    handler.setLevel(log_level)
 
-    logger.addHandler(handler)
+    # Formatter
+    if format_string is None:
+        handler.setFormatter(_default_formatter)
+    else:
+        handler.setFormatter(
+            logging.Formatter(format_string, datefmt=DEFAULT_DATE_FORMAT)
+        )
 
     return logger
+
+
+def skip_unused_record_details(format_string: str = DEFAULT_FORMAT) -> None:
+    """Stop collecting thread and process details the log format never prints.
+
+    This changes process-wide logging settings that affect every library, so
+    it is meant to be called once by an application entry point.
+
+    Args:
+        format_string: Format string the application logs with
+    """
+    if "%(thread" not in format_string:
+        logging.logThreads = False
+    if "%(process" not in format_string:
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
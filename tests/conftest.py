@@ -23,9 +23,14 @@ def mock_llm():
 
     Returns a mock ChatOpenAI instance with a default response.
     Tests can override the return value by setting mock_llm.invoke.return_value.
+    Streaming calls yield the invoke response as a single chunk, so they follow
+    the same overrides.
     """
     mock = Mock()
     mock_response = Mock()
     mock_response.content = "Test response content"
     mock.invoke.return_value = mock_response
+    mock.stream.side_effect = lambda messages, *args, **kwargs: iter(
+        [mock.invoke(messages, *args, **kwargs)]
+    )
     return mock
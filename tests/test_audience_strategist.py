@@ -1,10 +1,12 @@
 """Tests for the AudienceStrategist."""
 
 import json
+from unittest.mock import Mock
 
 import pytest
 
 from src.agents.audience_strategist import AudienceStrategist
+from src.utils.cache import DiskCache
 
 
 @pytest.fixture
@@ -74,8 +76,12 @@ def test_analyze_with_audience_hint(audience_strategist, mock_llm):
     )
 
     assert result["persona_name"] == "Test Persona"
-    # Verify the LLM was called
+    # Verify the LLM was called with the hint in the human turn
     mock_llm.invoke.assert_called_once()
+    messages = mock_llm.invoke.call_args[0][0]
+    assert messages[-1].content == (
+        "Topic: Remote Work\nTarget Audience Hint: Enterprise executives"
+    )
 
 
 def test_analyze_returns_empty_persona_on_invalid_json(audience_strategist, mock_llm):
@@ -112,6 +118,94 @@ def test_analyze_returns_empty_persona_on_string_json(audience_strategist, mock_
     assert result["persona_name"] == "General Reader"
 
 
+def test_analyze_reuses_cached_persona(mock_llm, tmp_path):
+    """Test analyze returns a cached persona without calling the LLM again."""
+    mock_llm.temperature = 0
+    strategist = AudienceStrategist(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+    mock_llm.invoke.return_value.content = json.dumps({"persona_name": "Cached"})
+
+    first = strategist.analyze("Remote Work", audience_hint="Managers")
+    second = strategist.analyze("Remote Work", audience_hint="Managers")
+
+    assert first == second == {"persona_name": "Cached"}
+    mock_llm.invoke.assert_called_once()
+
+
+def test_analyze_cache_is_keyed_on_model(mock_llm, tmp_path):
+    """Test a persona cached for one model is not served for another."""
+    mock_llm.temperature = 0
+    mock_llm.model_name = "gpt-old"
+    cache = DiskCache(str(tmp_path))
+    mock_llm.invoke.return_value.content = json.dumps({"persona_name": "Old"})
+    AudienceStrategist(llm=mock_llm, cache=cache).analyze("Remote Work")
+
+    mock_llm.model_name = "gpt-new"
+    mock_llm.invoke.return_value.content = json.dumps({"persona_name": "New"})
+    persona = AudienceStrategist(llm=mock_llm, cache=cache).analyze("Remote Work")
+
+    assert persona == {"persona_name": "New"}
+    assert mock_llm.invoke.call_count == 2
+
+
+def test_analyze_skips_cache_when_sampling(mock_llm, tmp_path):
+    """Test personas from a model with non-zero temperature are not cached."""
+    mock_llm.temperature = 0.7
+    strategist = AudienceStrategist(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+    mock_llm.invoke.return_value.content = json.dumps({"persona_name": "Fresh"})
+
+    strategist.analyze("Test Topic")
+    strategist.analyze("Test Topic")
+
+    assert mock_llm.invoke.call_count == 2
+
+
+def test_analyze_batch_returns_personas_in_order(audience_strategist, mock_llm):
+    """Test analyze_batch issues one batched call and keeps spec order."""
+    responses = [
+        Mock(content=json.dumps({"persona_name": "First"})),
+        Mock(content="This is not valid JSON"),
+    ]
+    mock_llm.batch.return_value = responses
+
+    personas = audience_strategist.analyze_batch(
+        [("Remote Work", "Managers"), ("Neural Networks", None)]
+    )
+
+    assert personas[0]["persona_name"] == "First"
+    assert personas[1]["persona_name"] == "General Reader"
+    mock_llm.batch.assert_called_once()
+    prompts = mock_llm.batch.call_args[0][0]
+    assert len(prompts) == 2
+    assert mock_llm.batch.call_args[1]["config"] == {"max_concurrency": 2}
+
+
+def test_analyze_batch_skips_cached_specs(mock_llm, tmp_path):
+    """Test analyze_batch only sends specs that are not cached."""
+    mock_llm.temperature = 0
+    strategist = AudienceStrategist(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+    mock_llm.invoke.return_value.content = json.dumps({"persona_name": "Cached"})
+    strategist.analyze("Remote Work")
+    mock_llm.batch.return_value = [Mock(content=json.dumps({"persona_name": "New"}))]
+
+    personas = strategist.analyze_batch([("Remote Work", None), ("AI Ethics", None)])
+
+    assert [p["persona_name"] for p in personas] == ["Cached", "New"]
+    assert len(mock_llm.batch.call_args[0][0]) == 1
+
+
+def test_analyze_batch_skips_cache_when_sampling(mock_llm, tmp_path):
+    """Test batched personas are not cached at a non-zero temperature."""
+    mock_llm.temperature = 0.7
+    strategist = AudienceStrategist(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+    mock_llm.batch.return_value = [Mock(content=json.dumps({"persona_name": "A"}))]
+
+    strategist.analyze_batch([("Remote Work", None)])
+    strategist.analyze_batch([("Remote Work", None)])
+
+    assert mock_llm.batch.call_count == 2
+    assert not list(tmp_path.iterdir())
+
+
 def test_validate_persona_with_valid_persona(audience_strategist):
     """Test validate_persona returns True for valid persona."""
     valid_persona = {
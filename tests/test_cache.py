@@ -0,0 +1,46 @@
+"""Tests for the disk cache utility."""
+
+import time
+
+from src.utils.cache import DiskCache
+
+
+def test_cache_set_and_get(tmp_path):
+    """Test values round-trip through the cache."""
+    cache = DiskCache(str(tmp_path))
+    cache.set("key", {"queries": ["a", "b"]})
+
+    assert cache.get("key") == {"queries": ["a", "b"]}
+
+
+def test_cache_get_missing_key(tmp_path):
+    """Test missing keys return None."""
+    cache = DiskCache(str(tmp_path))
+
+    assert cache.get("missing") is None
+
+
+def test_cache_expired_entry(tmp_path, monkeypatch):
+    """Test expired entries are treated as misses."""
+    cache = DiskCache(str(tmp_path))
+    cache.set("key", "value", expire=60)
+
+    monkeypatch.setattr(time, "time", lambda: 10**12)
+
+    assert cache.get("key") is None
+
+
+def test_cache_ignores_corrupt_entry(tmp_path):
+    """Test unreadable entries are treated as misses."""
+    cache = DiskCache(str(tmp_path))
+    (tmp_path / "key.json").write_text("not json", encoding="utf-8")
+
+    assert cache.get("key") is None
+
+
+def test_cache_make_key_is_deterministic():
+    """Test make_key returns the same digest for the same parts."""
+    assert DiskCache.make_key("persona", "AI", "") == DiskCache.make_key(
+        "persona", "AI", ""
+    )
+    assert DiskCache.make_key("persona", "AI") != DiskCache.make_key("persona", "ML")
@@ -1,18 +1,61 @@
 """Tests for CLI commands."""
 
+import io
+import logging
+import re
+import subprocess
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 from click.testing import CliRunner
+from rich.console import Console
 
 from src import __version__
-from src.cli import cli
+from src.cli import SPINNER_REFRESH_PER_SECOND, _print_stage, _spinner, cli
 from src.utils.config import Config
 
-
-@pytest.fixture
+# Command lines shared by several tests
+_ARGS_CREATE = ("create", "Test Topic")
+_ARGS_CREATE_FULL = (
+    "create",
+    "Test Topic",
+    "--style",
+    "professional",
+    "--audience",
+    "developers",
+    "--platform",
+    "file",
+    "--output-dir",
+    "output",
+)
+_ARGS_CONFIG = ("config",)
+
+
+# Expected help and version output, compiled once
+_CREATE_HELP_OPTIONS = re.compile(r"--(style|audience|platform|output-dir|log-level)\b")
+_VERSION_EXPECT = re.compile(
+    rf"Content Creation Agent version {re.escape(__version__)}"
+)
+
+# Logger handed to create by default; it discards everything it is given
+_NULL_LOGGER = logging.getLogger("tests.cli.null")
+_NULL_LOGGER.addHandler(logging.NullHandler())
+_NULL_LOGGER.propagate = False
+_NULL_LOGGER.disabled = True
+
+
+def _lines(result):
+    """Return the stripped lines of a CLI result's output."""
+    return {line.strip() for line in result.output.splitlines()}
+
+
+@pytest.fixture(scope="session")
 def runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared by all tests."""
     return CliRunner()
 
 
@@ -62,105 +105,82 @@ def mock_orchestrator():
     return mock
 
 
+@pytest.fixture
+def cli_mocks():
+    """Patch the configuration, logger and orchestrator used by create.
+
+    setup_logger returns a disabled logger; tests that check logging calls
+    set their own return value.
+    """
+    with ExitStack() as stack:
+        config_class = stack.enter_context(patch("src.cli.Config"))
+        setup_logger = stack.enter_context(
+            patch("src.cli.setup_logger", return_value=_NULL_LOGGER)
+        )
+        stack.enter_context(patch("src.cli.skip_unused_record_details"))
+        orchestrator_class = stack.enter_context(
+            patch("src.orchestrator.ContentCreationOrchestrator")
+        )
+        yield SimpleNamespace(
+            config_class=config_class,
+            config=config_class.from_env.return_value,
+            setup_logger=setup_logger,
+            orchestrator_class=orchestrator_class,
+        )
+
+
 def test_cli_group_exists(runner):
     """Test that the main CLI group exists and shows help."""
-    result = runner.invoke(cli, ["--help"])
+    result = runner.invoke(cli, ("--help",))
     assert result.exit_code == 0
-    assert "Automated Content Creation & Management Agent" in result.output
+    assert "Automated Content Creation & Management Agent." in _lines(result)
 
 
 def test_create_command_help(runner):
     """Test that the create command shows help."""
-    result = runner.invoke(cli, ["create", "--help"])
+    result = runner.invoke(cli, ("create", "--help"))
     assert result.exit_code == 0
-    assert "Create and publish content on a given TOPIC" in result.output
-    assert "--style" in result.output
-    assert "--audience" in result.output
-    assert "--platform" in result.output
-    assert "--output-dir" in result.output
-    assert "--log-level" in result.output
+    assert "Create and publish content on a given TOPIC." in _lines(result)
+    assert set(_CREATE_HELP_OPTIONS.findall(result.output)) == {
+        "style",
+        "audience",
+        "platform",
+        "output-dir",
+        "log-level",
+    }
 
 
-@patch("src.cli.ContentCreationOrchestrator")
-@patch("src.cli.Config")
-@patch("src.cli.setup_logger")
-def test_create_command_success(
-    mock_setup_logger,
-    mock_config_class,
-    mock_orchestrator_class,
-    runner,
-    mock_orchestrator,
-):
+def test_create_command_success(cli_mocks, runner, mock_orchestrator):
     """Test successful execution of the create command."""
-    # Setup mocks
-    mock_config = Mock()
-    mock_config_class.from_env.return_value = mock_config
-    mock_orchestrator_class.return_value = mock_orchestrator
-    mock_logger = Mock()
-    mock_setup_logger.return_value = mock_logger
+    cli_mocks.orchestrator_class.return_value = mock_orchestrator
 
     # Run command
-    result = runner.invoke(
-        cli,
-        [
-            "create",
-            "Test Topic",
-            "--style",
-            "professional",
-            "--audience",
-            "developers",
-            "--platform",
-            "file",
-            "--output-dir",
-            "output",
-        ],
-    )
+    result = runner.invoke(cli, _ARGS_CREATE_FULL)
 
     # Assertions
     assert result.exit_code == 0
-    assert "Content creation completed successfully" in result.output
-    mock_config_class.from_env.assert_called_once()
-    mock_config.validate_required.assert_called_once()
-    mock_setup_logger.assert_called_once_with(level="INFO")
-    mock_orchestrator_class.assert_called_once_with(mock_config)
+    assert "✓ Content creation completed successfully!" in _lines(result)
+    cli_mocks.config_class.from_env.assert_called_once()
+    cli_mocks.config.validate_required.assert_called_once()
+    cli_mocks.setup_logger.assert_called_once_with(level="INFO")
+    cli_mocks.orchestrator_class.assert_called_once_with(cli_mocks.config)
     mock_orchestrator.create_content.assert_called_once_with(
         topic="Test Topic",
         style="professional",
         target_audience="developers",
         platforms=["file"],
         output_dir="output",
+        on_stage=_print_stage,
     )
 
 
-@patch("src.cli.ContentCreationOrchestrator")
-@patch("src.cli.Config")
-@patch("src.cli.setup_logger")
-def test_create_command_with_multiple_platforms(
-    mock_setup_logger,
-    mock_config_class,
-    mock_orchestrator_class,
-    runner,
-    mock_orchestrator,
-):
+def test_create_command_with_multiple_platforms(cli_mocks, runner, mock_orchestrator):
     """Test create command with multiple platforms."""
-    # Setup mocks
-    mock_config = Mock()
-    mock_config_class.from_env.return_value = mock_config
-    mock_orchestrator_class.return_value = mock_orchestrator
-    mock_logger = Mock()
-    mock_setup_logger.return_value = mock_logger
+    cli_mocks.orchestrator_class.return_value = mock_orchestrator
 
     # Run command with multiple platforms
     result = runner.invoke(
-        cli,
-        [
-            "create",
-            "AI Testing",
-            "--platform",
-            "file",
-            "--platform",
-            "medium",
-        ],
+        cli, ("create", "AI Testing", "--platform", "file", "--platform", "medium")
     )
 
     # Assertions
@@ -170,26 +190,12 @@ def test_create_command_with_multiple_platforms(
     assert call_kwargs["platforms"] == ["file", "medium"]
 
 
-@patch("src.cli.ContentCreationOrchestrator")
-@patch("src.cli.Config")
-@patch("src.cli.setup_logger")
-def test_create_command_default_values(
-    mock_setup_logger,
-    mock_config_class,
-    mock_orchestrator_class,
-    runner,
-    mock_orchestrator,
-):
+def test_create_command_default_values(cli_mocks, runner, mock_orchestrator):
     """Test create command uses default values when options are not specified."""
-    # Setup mocks
-    mock_config = Mock()
-    mock_config_class.from_env.return_value = mock_config
-    mock_orchestrator_class.return_value = mock_orchestrator
-    mock_logger = Mock()
-    mock_setup_logger.return_value = mock_logger
+    cli_mocks.orchestrator_class.return_value = mock_orchestrator
 
     # Run command with minimal arguments
-    result = runner.invoke(cli, ["create", "Test Topic"])
+    result = runner.invoke(cli, _ARGS_CREATE)
 
     # Assertions
     assert result.exit_code == 0
@@ -200,91 +206,62 @@ def test_create_command_default_values(
     assert call_kwargs["target_audience"] is None
     assert call_kwargs["platforms"] == ["file"]
     assert call_kwargs["output_dir"] == "output"
-    mock_setup_logger.assert_called_once_with(level="INFO")
+    cli_mocks.setup_logger.assert_called_once_with(level="INFO")
 
 
-@patch("src.cli.Config")
-@patch("src.cli.setup_logger")
-def test_create_command_config_validation_error(
-    mock_setup_logger, mock_config_class, runner
-):
+def test_create_command_config_validation_error(cli_mocks, runner):
     """Test create command handles configuration validation errors."""
-    # Setup mocks
-    mock_config = Mock()
-    mock_config.validate_required.side_effect = ValueError("OPENAI_API_KEY is required")
-    mock_config_class.from_env.return_value = mock_config
-    mock_logger = Mock()
-    mock_setup_logger.return_value = mock_logger
+    cli_mocks.config.validate_required.side_effect = ValueError(
+        "OPENAI_API_KEY is required"
+    )
 
     # Run command
-    result = runner.invoke(cli, ["create", "Test Topic"])
+    result = runner.invoke(cli, _ARGS_CREATE)
 
     # Assertions
     # CLI handles the exception and prints an error message without exiting with an error code
     assert result.exit_code == 0
-    assert "Configuration Error" in result.output
-    assert "OPENAI_API_KEY is required" in result.output
+    assert "Configuration Error: OPENAI_API_KEY is required" in _lines(result)
+    cli_mocks.orchestrator_class.assert_not_called()
 
 
-@patch("src.cli.ContentCreationOrchestrator")
-@patch("src.cli.Config")
-@patch("src.cli.setup_logger")
-def test_create_command_general_exception(
-    mock_setup_logger, mock_config_class, mock_orchestrator_class, runner
-):
+def test_create_command_general_exception(cli_mocks, runner):
     """Test create command handles general exceptions."""
-    # Setup mocks
-    mock_config = Mock()
-    mock_config_class.from_env.return_value = mock_config
-    mock_orchestrator = Mock()
+    mock_logger = Mock(spec=logging.Logger)
+    cli_mocks.setup_logger.return_value = mock_logger
+    mock_orchestrator = cli_mocks.orchestrator_class.return_value
     mock_orchestrator.create_content.side_effect = Exception("Test error")
-    mock_orchestrator_class.return_value = mock_orchestrator
-    mock_logger = Mock()
-    mock_setup_logger.return_value = mock_logger
 
     # Run command
-    result = runner.invoke(cli, ["create", "Test Topic"])
+    result = runner.invoke(cli, _ARGS_CREATE)
 
     # Assertions
     assert result.exit_code == 0
-    assert "Error:" in result.output
-    assert "Test error" in result.output
+    assert "Error: Test error" in _lines(result)
     mock_logger.exception.assert_called_once_with("Content creation failed")
 
 
-@patch("src.cli.ContentCreationOrchestrator")
-@patch("src.cli.Config")
-@patch("src.cli.setup_logger")
-def test_create_command_failed_status(
-    mock_setup_logger, mock_config_class, mock_orchestrator_class, runner
-):
+def test_create_command_failed_status(cli_mocks, runner):
     """Test create command handles failed status from orchestrator."""
-    # Setup mocks
-    mock_config = Mock()
-    mock_config_class.from_env.return_value = mock_config
-    mock_orchestrator = Mock()
+    mock_orchestrator = cli_mocks.orchestrator_class.return_value
     mock_orchestrator.create_content.return_value = {
         "status": "failed",
         "error": "Pipeline failed",
     }
-    mock_orchestrator_class.return_value = mock_orchestrator
-    mock_logger = Mock()
-    mock_setup_logger.return_value = mock_logger
 
     # Run command
-    result = runner.invoke(cli, ["create", "Test Topic"])
+    result = runner.invoke(cli, _ARGS_CREATE)
 
     # Assertions
     assert result.exit_code == 0
-    assert "Content creation failed" in result.output
-    assert "Pipeline failed" in result.output
+    assert "✗ Content creation failed: Pipeline failed" in _lines(result)
 
 
 def test_config_command_help(runner):
     """Test that the config command shows help."""
-    result = runner.invoke(cli, ["config", "--help"])
+    result = runner.invoke(cli, ("config", "--help"))
     assert result.exit_code == 0
-    assert "Display current configuration" in result.output
+    assert "Display current configuration." in _lines(result)
 
 
 @patch("src.cli.Config")
@@ -294,18 +271,18 @@ def test_config_command_success(mock_config_class, runner, mock_config):
     mock_config_class.from_env.return_value = mock_config
 
     # Run command
-    result = runner.invoke(cli, ["config"])
+    result = runner.invoke(cli, _ARGS_CONFIG)
 
     # Assertions
     assert result.exit_code == 0
-    assert "Current Configuration" in result.output
-    assert "OpenAI Model:" in result.output
-    assert mock_config.openai_model in result.output
-    assert "Temperature:" in result.output
-    assert str(mock_config.temperature) in result.output
-    assert "Max Research Sources:" in result.output
-    assert "Log Level:" in result.output
-    assert "API Keys Status:" in result.output
+    assert {
+        "│ Current Configuration │",
+        f"OpenAI Model: {mock_config.openai_model}",
+        f"Temperature: {mock_config.temperature}",
+        f"Max Research Sources: {mock_config.max_research_sources}",
+        f"Log Level: {mock_config.log_level}",
+        "API Keys Status:",
+    } <= _lines(result)
 
 
 @patch("src.cli.Config")
@@ -320,13 +297,11 @@ def test_config_command_shows_api_key_status(mock_config_class, runner):
     mock_config_class.from_env.return_value = mock_config
 
     # Run command
-    result = runner.invoke(cli, ["config"])
+    result = runner.invoke(cli, _ARGS_CONFIG)
 
     # Assertions
     assert result.exit_code == 0
-    assert "OpenAI:" in result.output
-    assert "Medium:" in result.output
-    assert "Unsplash:" in result.output
+    assert {"OpenAI: ✓ Set", "Medium: ✓ Set", "Unsplash: ✓ Set"} <= _lines(result)
 
 
 @patch("src.cli.Config")
@@ -336,48 +311,117 @@ def test_config_command_error_handling(mock_config_class, runner):
     mock_config_class.from_env.side_effect = Exception("Config error")
 
     # Run command
-    result = runner.invoke(cli, ["config"])
+    result = runner.invoke(cli, _ARGS_CONFIG)
 
     # Assertions
     assert result.exit_code == 0
-    assert "Error:" in result.output
-    assert "Config error" in result.output
+    assert "Error: Config error" in _lines(result)
 
 
 def test_version_command_help(runner):
     """Test that the version command shows help."""
-    result = runner.invoke(cli, ["version", "--help"])
+    result = runner.invoke(cli, ("version", "--help"))
     assert result.exit_code == 0
-    assert "Display version information" in result.output
+    assert "Display version information." in _lines(result)
 
 
 def test_version_command_success(runner):
     """Test successful execution of the version command."""
-    result = runner.invoke(cli, ["version"])
+    result = runner.invoke(cli, ("version",))
 
     # Assertions
     assert result.exit_code == 0
-    assert "Content Creation Agent" in result.output
-    assert "version" in result.output
-    assert __version__ in result.output
+    assert _VERSION_EXPECT.search(result.output)
 
 
-@patch("src.cli.setup_logger")
-def test_create_command_custom_log_level(mock_setup_logger, runner):
+def test_create_command_custom_log_level(cli_mocks, runner):
     """Test create command respects custom log level."""
-    mock_logger = Mock()
-    mock_setup_logger.return_value = mock_logger
-
-    # Mock Config to prevent actual API validation
-    with patch("src.cli.Config") as mock_config_class:
-        mock_config = Mock()
-        mock_config.validate_required.side_effect = ValueError("Test early exit")
-        mock_config_class.from_env.return_value = mock_config
-
-        runner.invoke(
-            cli,
-            ["create", "Test Topic", "--log-level", "DEBUG"],
-        )
+    # Stop before the orchestrator is created
+    cli_mocks.config.validate_required.side_effect = ValueError("Test early exit")
+
+    runner.invoke(cli, (*_ARGS_CREATE, "--log-level", "DEBUG"))
+
+    # Verify logger was setup with correct level
+    cli_mocks.setup_logger.assert_called_once_with(level="DEBUG")
+
+
+@pytest.mark.parametrize(
+    ("args", "option"),
+    [
+        pytest.param(
+            (*_ARGS_CREATE, "--log-level", "VERBOSE"), "--log-level", id="log-level"
+        ),
+        pytest.param(
+            (*_ARGS_CREATE, "--platform", "twitter"), "--platform", id="platform"
+        ),
+    ],
+)
+def test_create_command_rejects_unknown_choices(cli_mocks, runner, args, option):
+    """Test invalid log levels and platforms are rejected before any work."""
+    result = runner.invoke(cli, args)
+
+    assert result.exit_code == 2
+    # The rest of the line lists the choices, worded differently across click versions
+    error = f"Error: Invalid value for '{option}'"
+    assert any(line.startswith(error) for line in _lines(result))
+    cli_mocks.config_class.from_env.assert_not_called()
+
+
+def test_create_command_reports_stages_as_they_complete(cli_mocks, runner):
+    """Test each stage is printed when the orchestrator reports it."""
+
+    def create_content(**kwargs):
+        kwargs["on_stage"]("research", {"status": "completed", "sources_count": 3})
+        kwargs["on_stage"]("writing", {"title": "Streamed", "word_count": 42})
+        raise RuntimeError("stopped after writing")
+
+    cli_mocks.orchestrator_class.return_value.create_content.side_effect = (
+        create_content
+    )
+
+    result = runner.invoke(cli, _ARGS_CREATE)
+
+    assert {
+        "✓ Research found 3 sources",
+        "✓ Article written: Streamed (42 words)",
+        "Error: stopped after writing",
+    } <= _lines(result)
+
+
+@patch("rich.progress.Progress")
+def test_spinner_is_silent_without_terminal(mock_progress):
+    """Test no spinner is drawn when output is not a terminal."""
+    with patch("src.cli.console", Console(file=io.StringIO())):
+        with _spinner("Working..."):
+            pass
+
+    mock_progress.assert_not_called()
+
+
+@patch("rich.progress.Progress")
+def test_spinner_throttles_refresh_on_terminal(mock_progress):
+    """Test the terminal spinner refreshes slowly and clears itself."""
+    with patch("src.cli.console", Console(file=io.StringIO(), force_terminal=True)):
+        with _spinner("Working..."):
+            pass
+
+    kwargs = mock_progress.call_args[1]
+    assert kwargs["refresh_per_second"] == SPINNER_REFRESH_PER_SECOND
+    assert kwargs["transient"] is True
+    mock_progress.return_value.__enter__.return_value.add_task.assert_called_once_with(
+        "Working...", total=None
+    )
+
+
+def test_cli_import_does_not_load_langchain():
+    """Test importing the CLI leaves the pipeline dependencies unloaded."""
+    code = "import sys, src.cli; print('langchain_openai' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+    )
 
-        # Verify logger was setup with correct level
-        mock_setup_logger.assert_called_once_with(level="DEBUG")
+    assert result.stdout.strip() == "False"
@@ -1,5 +1,7 @@
 """Tests for configuration management."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from src.utils.config import Config
@@ -26,110 +28,110 @@ def test_config_from_env(monkeypatch):
     assert config.temperature == 0.5
 
 
-def test_config_validation_missing_key():
-    """Test validation fails when API key is missing."""
-    config = Config(openai_api_key="")
+def test_config_cache_dir_from_env(monkeypatch):
+    """Test cache directory is read from the environment and disabled by default."""
+    assert Config().cache_dir is None
 
-    with pytest.raises(ValueError, match="OPENAI_API_KEY is required"):
-        config.validate_required()
+    monkeypatch.setenv("CACHE_DIR", "/tmp/agentic-writer-cache")
 
+    config = Config.from_env()
+    assert config.cache_dir == "/tmp/agentic-writer-cache"
 
-def test_config_validation_with_key():
-    """Test validation passes when API key is present."""
-    config = Config(openai_api_key="test-key")
-    config.validate_required()  # Should not raise
-
-
-def test_unsplash_per_page_validation():
-    """Test unsplash_per_page validation."""
-    # Valid values
-    config = Config(unsplash_per_page=1)
-    assert config.unsplash_per_page == 1
-
-    config = Config(unsplash_per_page=30)
-    assert config.unsplash_per_page == 30
-
-    # Invalid values
-    with pytest.raises(ValueError, match="unsplash_per_page must be between 1 and 30"):
-        Config(unsplash_per_page=0)
 
-    with pytest.raises(ValueError, match="unsplash_per_page must be between 1 and 30"):
-        Config(unsplash_per_page=31)
+def test_config_from_env_reuses_parsed_config(monkeypatch):
+    """Test from_env is only re-parsed when the environment changes."""
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-3.5-turbo")
 
+    first = Config.from_env()
+    assert Config.from_env() is first
 
-def test_unsplash_order_by_validation():
-    """Test unsplash_order_by validation."""
-    # Valid values
-    config = Config(unsplash_order_by="relevant")
-    assert config.unsplash_order_by == "relevant"
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o")
 
-    config = Config(unsplash_order_by="latest")
-    assert config.unsplash_order_by == "latest"
+    second = Config.from_env()
+    assert second is not first
+    assert second.openai_model == "gpt-4o"
 
-    # Invalid value
-    with pytest.raises(
-        ValueError, match="unsplash_order_by must be 'relevant' or 'latest'"
-    ):
-        Config(unsplash_order_by="invalid")
+    Config.reset_cache()
+    assert Config.from_env() is not second
 
 
-def test_unsplash_content_filter_validation():
-    """Test unsplash_content_filter validation."""
-    # Valid values
-    config = Config(unsplash_content_filter="low")
-    assert config.unsplash_content_filter == "low"
+def test_config_is_immutable():
+    """Test configs cannot be modified or given unknown settings."""
+    config = Config()
 
-    config = Config(unsplash_content_filter="high")
-    assert config.unsplash_content_filter == "high"
+    with pytest.raises(FrozenInstanceError):
+        config.openai_model = "gpt-4o"
 
-    # Invalid value
-    with pytest.raises(
-        ValueError, match="unsplash_content_filter must be 'low' or 'high'"
-    ):
-        Config(unsplash_content_filter="medium")
+    with pytest.raises(TypeError):
+        Config(unknown_setting=True)
 
 
-def test_unsplash_orientation_validation():
-    """Test unsplash_orientation validation."""
-    # Valid values
-    config = Config(unsplash_orientation="landscape")
-    assert config.unsplash_orientation == "landscape"
+def test_config_validation_missing_key():
+    """Test validation fails when API key is missing."""
+    config = Config(openai_api_key="")
 
-    config = Config(unsplash_orientation="portrait")
-    assert config.unsplash_orientation == "portrait"
+    with pytest.raises(ValueError, match="OPENAI_API_KEY is required"):
+        config.validate_required()
 
-    config = Config(unsplash_orientation="squarish")
-    assert config.unsplash_orientation == "squarish"
 
-    # Invalid value
-    with pytest.raises(
-        ValueError,
-        match="unsplash_orientation must be 'landscape', 'portrait', or 'squarish'",
-    ):
-        Config(unsplash_orientation="diagonal")
+def test_config_validation_with_key():
+    """Test validation passes when API key is present."""
+    config = Config(openai_api_key="test-key")
+    config.validate_required()  # Should not raise
 
 
-def test_config_from_env_invalid_integers(monkeypatch):
+@pytest.mark.parametrize(
+    "field, valid, invalid, message",
+    [
+        (
+            "unsplash_per_page",
+            (1, 30),
+            (0, 31),
+            "unsplash_per_page must be between 1 and 30",
+        ),
+        (
+            "unsplash_order_by",
+            ("relevant", "latest"),
+            ("invalid",),
+            "unsplash_order_by must be 'relevant' or 'latest'",
+        ),
+        (
+            "unsplash_content_filter",
+            ("low", "high"),
+            ("medium",),
+            "unsplash_content_filter must be 'low' or 'high'",
+        ),
+        (
+            "unsplash_orientation",
+            ("landscape", "portrait", "squarish"),
+            ("diagonal",),
+            "unsplash_orientation must be 'landscape', 'portrait', or 'squarish'",
+        ),
+    ],
+)
+def test_unsplash_field_validation(field, valid, invalid, message):
+    """Test Unsplash settings accept their valid values and reject others."""
+    for value in valid:
+        assert getattr(Config(**{field: value}), field) == value
+
+    for value in invalid:
+        with pytest.raises(ValueError, match=message):
+            Config(**{field: value})
+
+
+_INVALID_INT_CASES = [
+    ("UNSPLASH_PER_PAGE", "abc"),
+    ("MAX_RETRIES", "xyz"),
+    ("MAX_RESEARCH_SOURCES", "invalid"),
+]
+
+
+@pytest.mark.parametrize("var, bad_value", _INVALID_INT_CASES)
+def test_config_from_env_invalid_integers(monkeypatch, var, bad_value):
     """Test that invalid integer environment variables raise meaningful errors."""
-    monkeypatch.setenv("UNSPLASH_PER_PAGE", "abc")
-
-    with pytest.raises(
-        ValueError, match="Invalid value for UNSPLASH_PER_PAGE: must be an integer"
-    ):
-        Config.from_env()
-
-    monkeypatch.setenv("UNSPLASH_PER_PAGE", "10")
-    monkeypatch.setenv("MAX_RETRIES", "xyz")
-
-    with pytest.raises(
-        ValueError, match="Invalid value for MAX_RETRIES: must be an integer"
-    ):
-        Config.from_env()
-
-    monkeypatch.setenv("MAX_RETRIES", "3")
-    monkeypatch.setenv("MAX_RESEARCH_SOURCES", "invalid")
+    monkeypatch.setenv(var, bad_value)
 
     with pytest.raises(
-        ValueError, match="Invalid value for MAX_RESEARCH_SOURCES: must be an integer"
+        ValueError, match=f"Invalid value for {var}: must be an integer"
     ):
         Config.from_env()
@@ -1,29 +1,33 @@
 """Functional tests for article generation with parameter matrix."""
 
+import itertools
 import os
-import shutil
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
-from src.orchestrator import ContentCreationOrchestrator
 from src.utils.config import Config
 
 # Test Matrix
 TOPICS = ["Remote Work", "AI Ethics"]
 STYLES = ["Professional", "Casual"]
 AUDIENCES = ["Experts", "Beginners"]
+MATRIX = list(itertools.product(TOPICS, STYLES, AUDIENCES))
+
+# Response returned for every LLM call (research, outline, writing, etc.)
+_LLM_TEMPLATE = (
+    "# {topic}\n\nStyle: {style}\nAudience: {audience}\n\nContent goes here."
+)
 
 
 @pytest.fixture
-def output_dir():
-    """Create and clean up a temporary output directory."""
-    dir_path = "tests/output/functional"
-    os.makedirs(dir_path, exist_ok=True)
-    yield dir_path
-    # Cleanup after tests
-    if os.path.exists(dir_path):
-        shutil.rmtree(dir_path)
+def output_dir(tmp_path):
+    """Create an output directory private to the test.
+
+    Each test gets its own directory so the matrix can run in parallel.
+    """
+    return str(tmp_path / "functional")
 
 
 @pytest.fixture
@@ -36,44 +40,54 @@ def mock_config():
     )
 
 
+@pytest.fixture
+def mocked_pipeline():
+    """Patch web search and the LLM used by the orchestrator."""
+    with patch("src.orchestrator.ChatOpenAI") as mock_chat_openai, patch(
+        "src.agents.researcher.DDGS"
+    ) as mock_ddgs:
+        llm = Mock()
+        llm.stream.side_effect = lambda messages: iter([llm.invoke.return_value])
+        mock_chat_openai.return_value = llm
+        yield SimpleNamespace(search=mock_ddgs.return_value, llm=llm)
+
+
 @pytest.mark.functional
-@pytest.mark.parametrize("topic", TOPICS)
-@pytest.mark.parametrize("style", STYLES)
-@pytest.mark.parametrize("audience", AUDIENCES)
-@patch("src.orchestrator.ChatOpenAI")
-@patch("src.agents.researcher.DDGS")
+@pytest.mark.parametrize(
+    "topic, style, audience",
+    MATRIX,
+    ids=[f"{topic}-{style}-{audience}" for topic, style, audience in MATRIX],
+)
 def test_article_generation_matrix(
-    mock_ddgs, mock_llm, topic, style, audience, mock_config, output_dir
+    mocked_pipeline, topic, style, audience, mock_config, output_dir
 ):
     """Test article generation with various combinations of parameters."""
 
     # --- Mock Setup ---
-    # Mock Search
-    mock_search = Mock()
-    mock_search.text.return_value = [
+    mocked_pipeline.search.text.return_value = [
         {"title": f"Source for {topic}", "body": "Content", "href": "http://test.com"}
     ]
-    mock_ddgs.return_value.__enter__.return_value = mock_search
-
-    # Mock LLM
-    mock_llm_instance = Mock()
-    # We need to handle multiple calls (research, outline, writing, etc.)
-    # A simple way is to return a generic response that works for all
-    mock_llm_instance.invoke.return_value = Mock(
-        content=f"# {topic}\n\nStyle: {style}\nAudience: {audience}\n\nContent goes here."
+    mocked_pipeline.llm.invoke.return_value.content = _LLM_TEMPLATE.format(
+        topic=topic, style=style, audience=audience
     )
-    mock_llm.return_value = mock_llm_instance
 
     # --- Execution ---
+    # Imported here so collecting the matrix doesn't load LangChain
+    from src.orchestrator import ContentCreationOrchestrator
+
     orchestrator = ContentCreationOrchestrator(mock_config)
 
-    results = orchestrator.create_content(
-        topic=topic,
-        style=style,
-        target_audience=audience,
-        platforms=["file"],
-        output_dir=output_dir,
-    )
+    # The orchestrator owns a pooled HTTP client, so release it every run
+    try:
+        results = orchestrator.create_content(
+            topic=topic,
+            style=style,
+            target_audience=audience,
+            platforms=["file"],
+            output_dir=output_dir,
+        )
+    finally:
+        orchestrator.close()
 
     # --- Verification ---
     assert results["status"] == "completed"
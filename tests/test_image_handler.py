@@ -1,10 +1,12 @@
 """Tests for the ImageAgent with Unsplash API improvements."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
 
 from src.agents.image_handler import ImageAgent
+from src.utils.cache import DiskCache
 
 
 @pytest.fixture
@@ -114,13 +116,13 @@ def test_image_agent_initialization_with_custom_params(mock_llm):
     assert agent.orientation == "portrait"
 
 
-@patch("src.agents.image_handler.requests.get")
+@patch("src.agents.image_handler.requests.Session.get")
 def test_search_unsplash_with_all_params(
     mock_get, image_agent_with_key, mock_unsplash_response
 ):
     """Test search_unsplash with all parameters."""
     mock_response = Mock()
-    mock_response.json.return_value = mock_unsplash_response
+    mock_response.content = json.dumps(mock_unsplash_response)
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -157,13 +159,13 @@ def test_search_unsplash_with_all_params(
     assert results[0]["full_url"] == "https://images.unsplash.com/photo1?full"
 
 
-@patch("src.agents.image_handler.requests.get")
+@patch("src.agents.image_handler.requests.Session.get")
 def test_search_unsplash_without_color(
     mock_get, image_agent_with_key, mock_unsplash_response
 ):
     """Test search_unsplash without color parameter."""
     mock_response = Mock()
-    mock_response.json.return_value = mock_unsplash_response
+    mock_response.content = json.dumps(mock_unsplash_response)
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -174,13 +176,13 @@ def test_search_unsplash_without_color(
     assert "color" not in call_args[1]["params"]
 
 
-@patch("src.agents.image_handler.requests.get")
+@patch("src.agents.image_handler.requests.Session.get")
 def test_search_unsplash_respects_max_per_page(
     mock_get, image_agent_with_key, mock_unsplash_response
 ):
     """Test search_unsplash enforces max per_page of 30."""
     mock_response = Mock()
-    mock_response.json.return_value = mock_unsplash_response
+    mock_response.content = json.dumps(mock_unsplash_response)
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -191,6 +193,41 @@ def test_search_unsplash_respects_max_per_page(
     assert call_args[1]["params"]["per_page"] == 30
 
 
+@patch("src.agents.image_handler.requests.Session.get")
+def test_image_agent_requests_send_authorization_header(
+    mock_get, image_agent_with_key, mock_unsplash_response
+):
+    """Test Unsplash requests carry the agent's authorization header."""
+    mock_response = Mock()
+    mock_response.content = json.dumps(mock_unsplash_response)
+    mock_get.return_value = mock_response
+
+    image_agent_with_key.search_unsplash(query="test")
+
+    assert mock_get.call_args[1]["headers"] == {"Authorization": "Client-ID test_key"}
+
+
+def test_image_agents_share_http_session(mock_llm):
+    """Test agents reuse one pooled session that outlives each agent."""
+    first = ImageAgent(llm=mock_llm, unsplash_key="first_key")
+    second = ImageAgent(llm=mock_llm, unsplash_key="second_key")
+    session = first._get_session()
+    first.close()
+
+    assert second._get_session() is session
+
+
+def test_image_agents_share_tracking_pool(mock_llm):
+    """Test agents queue tracking pings on one pool that closing leaves running."""
+    first = ImageAgent(llm=mock_llm, unsplash_key="first_key")
+    second = ImageAgent(llm=mock_llm, unsplash_key="second_key")
+    tracker = first._get_tracker()
+    first.close()
+
+    assert second._get_tracker() is tracker
+    assert tracker.submit(lambda: "still running").result(timeout=5) == "still running"
+
+
 def test_search_unsplash_without_api_key(image_agent_without_key):
     """Test search_unsplash returns empty list without API key."""
     results = image_agent_without_key.search_unsplash(query="test")
@@ -198,7 +235,7 @@ def test_search_unsplash_without_api_key(image_agent_without_key):
     assert results == []
 
 
-@patch("src.agents.image_handler.requests.get")
+@patch("src.agents.image_handler.requests.Session.get")
 def test_search_unsplash_handles_http_error(mock_get, image_agent_with_key):
     """Test search_unsplash handles HTTP errors gracefully."""
     import requests
@@ -210,7 +247,7 @@ def test_search_unsplash_handles_http_error(mock_get, image_agent_with_key):
     assert results == []
 
 
-@patch("src.agents.image_handler.requests.get")
+@patch("src.agents.image_handler.requests.Session.get")
 def test_search_unsplash_handles_general_exception(mock_get, image_agent_with_key):
     """Test search_unsplash handles general exceptions gracefully."""
     mock_get.side_effect = Exception("Network Error")
@@ -220,7 +257,69 @@ def test_search_unsplash_handles_general_exception(mock_get, image_agent_with_ke
     assert results == []
 
 
-@patch("src.agents.image_handler.requests.get")
+def _http_error(status_code, headers=None):
+    """Build an HTTPError carrying a response with the given status."""
+    import requests
+
+    response = Mock(status_code=status_code, headers=headers or {})
+    return requests.exceptions.HTTPError(f"{status_code} Error", response=response)
+
+
+@patch("tenacity.nap.time.sleep")
+@patch("src.agents.image_handler.requests.Session.get")
+def test_search_unsplash_retries_rate_limit(
+    mock_get, mock_sleep, image_agent_with_key, mock_unsplash_response
+):
+    """Test search_unsplash retries a 429 and honors the Retry-After header."""
+    rate_limited = Mock()
+    rate_limited.raise_for_status.side_effect = _http_error(429, {"Retry-After": "2"})
+    success = Mock()
+    success.content = json.dumps(mock_unsplash_response)
+    mock_get.side_effect = [rate_limited, success]
+
+    results = image_agent_with_key.search_unsplash(query="test")
+
+    assert len(results) == 2
+    assert mock_get.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("tenacity.nap.time.sleep")
+@patch("src.agents.image_handler.requests.Session.get")
+def test_search_unsplash_does_not_retry_client_errors(
+    mock_get, mock_sleep, image_agent_with_key
+):
+    """Test search_unsplash gives up immediately on non-transient HTTP errors."""
+    response = Mock()
+    response.raise_for_status.side_effect = _http_error(401)
+    mock_get.return_value = response
+
+    results = image_agent_with_key.search_unsplash(query="test")
+
+    assert results == []
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch("tenacity.nap.time.sleep")
+@patch("src.agents.image_handler.requests.Session.get")
+def test_search_unsplash_pauses_when_quota_exhausted(
+    mock_get, mock_sleep, image_agent_with_key
+):
+    """Test an exhausted hourly quota is not retried and skips later searches."""
+    headers = {"X-Ratelimit-Remaining": "0"}
+    response = Mock(headers=headers)
+    response.raise_for_status.side_effect = _http_error(429, headers)
+    mock_get.return_value = response
+
+    assert image_agent_with_key.search_unsplash(query="first") == []
+    assert image_agent_with_key.search_unsplash(query="second") == []
+
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch("src.agents.image_handler.requests.Session.get")
 def test_track_download_success(mock_get, image_agent_with_key):
     """Test track_download successfully tracks download."""
     mock_response = Mock()
@@ -235,7 +334,7 @@ def test_track_download_success(mock_get, image_agent_with_key):
     mock_get.assert_called_once()
 
 
-@patch("src.agents.image_handler.requests.get")
+@patch("src.agents.image_handler.requests.Session.get")
 def test_track_download_failure(mock_get, image_agent_with_key):
     """Test track_download handles failures gracefully."""
     mock_get.side_effect = Exception("Network Error")
@@ -279,6 +378,8 @@ def test_find_images_tracks_downloads(
 
     article_data = {"content": "Test article about technology"}
     image_agent_with_key.find_images("Technology", article_data)
+    # Tracking runs in the background; wait for pending pings
+    image_agent_with_key.close()
 
     # Verify downloads were tracked
     assert mock_track.call_count >= 1
@@ -304,6 +405,64 @@ def test_find_images_uses_instance_params(mock_search, image_agent_with_key, moc
     assert call_args[1]["orientation"] == image_agent_with_key.orientation
 
 
+@patch("src.agents.image_handler.ImageAgent.search_unsplash")
+def test_find_images_searches_all_queries_in_order(
+    mock_search, image_agent_with_key, mock_llm
+):
+    """Test find_images searches every query and keeps results in query order."""
+    mock_llm.invoke.return_value.content = "query one\nquery two\nquery three"
+    mock_search.side_effect = lambda query, **kwargs: [
+        {"id": query, "author": f"Author {query}", "url": query}
+    ]
+
+    selected = image_agent_with_key.find_images("Test", {"content": "Test article"})
+
+    searched = sorted(call[0][0] for call in mock_search.call_args_list)
+    assert searched == ["query one", "query three", "query two"]
+    assert [img["id"] for img in selected] == ["query one", "query two", "query three"]
+
+
+@patch("src.agents.image_handler.ImageAgent.search_unsplash")
+def test_find_images_deduplicates_queries_and_images(
+    mock_search, image_agent_with_key, mock_llm
+):
+    """Test find_images skips duplicate queries and duplicate photos."""
+    mock_llm.invoke.return_value.content = "AI Classroom\nai classroom \nrobots"
+    mock_search.side_effect = lambda query, **kwargs: [
+        {"id": "shared", "author": "Author A", "url": "shared"},
+        {"id": query, "author": f"Author {query}", "url": query},
+    ]
+
+    selected = image_agent_with_key.find_images("AI", {"content": "Test article"})
+
+    searched = sorted(call[0][0] for call in mock_search.call_args_list)
+    assert searched == ["AI Classroom", "robots"]
+    ids = [img["id"] for img in selected]
+    assert len(ids) == len(set(ids))
+    assert ids.count("shared") == 1
+
+
+def test_prefilter_images_drops_low_quality_candidates(image_agent_with_key):
+    """Test small, mis-shaped and undescribed images are filtered out."""
+    images = [
+        {"id": "good", "width": 1920, "height": 1080, "description": "Desk"},
+        {"id": "small", "width": 800, "height": 450, "description": "Desk"},
+        {"id": "portrait", "width": 1080, "height": 1920, "description": "Desk"},
+        {"id": "undescribed", "width": 1920, "height": 1080, "description": ""},
+    ]
+
+    assert [img["id"] for img in image_agent_with_key._prefilter_images(images)] == [
+        "good"
+    ]
+
+
+def test_prefilter_images_keeps_all_when_none_pass(image_agent_with_key):
+    """Test the pre-filter never leaves selection without candidates."""
+    images = [{"id": "small", "width": 640, "height": 480, "description": "Desk"}]
+
+    assert image_agent_with_key._prefilter_images(images) == images
+
+
 def test_generate_image_queries(image_agent_with_key):
     """Test generate_image_queries creates appropriate queries."""
     topic = "Artificial Intelligence"
@@ -316,6 +475,60 @@ def test_generate_image_queries(image_agent_with_key):
     assert all(isinstance(q, str) for q in queries)
 
 
+def test_generate_image_queries_uses_cache(mock_llm, tmp_path):
+    """Test generate_image_queries reuses cached queries for the same article."""
+    agent = ImageAgent(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+    mock_llm.temperature = 0
+    mock_llm.invoke.return_value.content = "query one\nquery two"
+
+    first = agent.generate_image_queries("AI", "Article about AI")
+    second = agent.generate_image_queries("AI", "Article about AI")
+
+    assert first == second == ["query one", "query two"]
+    mock_llm.invoke.assert_called_once()
+
+
+def test_find_images_without_api_key_skips_llm(image_agent_without_key, mock_llm):
+    """Test find_images does not generate queries when search is unavailable."""
+    images = image_agent_without_key.find_images("AI", {"content": "Article"})
+
+    assert images == []
+    mock_llm.invoke.assert_not_called()
+
+
+@patch("src.agents.image_handler.requests.Session.get")
+def test_search_unsplash_uses_cache(
+    mock_get, mock_llm, mock_unsplash_response, tmp_path
+):
+    """Test search_unsplash reuses cached results for identical searches."""
+    agent = ImageAgent(
+        llm=mock_llm, unsplash_key="test_key", cache=DiskCache(str(tmp_path))
+    )
+    mock_response = Mock()
+    mock_response.content = json.dumps(mock_unsplash_response)
+    mock_get.return_value = mock_response
+
+    first = agent.search_unsplash(query="technology")
+    second = agent.search_unsplash(query="technology")
+
+    assert first == second
+    assert len(second) == 2
+    mock_get.assert_called_once()
+
+
+def test_generate_image_queries_accepts_content_chunks(image_agent_with_key, mock_llm):
+    """Test generate_image_queries previews content passed as text chunks."""
+    chunks = ["a" * 600, "b" * 600, "c" * 600]
+
+    image_agent_with_key.generate_image_queries("Topic", chunks)
+
+    messages = mock_llm.invoke.call_args[0][0]
+    expected_preview = "a" * 600 + "b" * 400
+    assert (
+        messages[-1].content == f"Topic: Topic\n\nArticle preview:\n{expected_preview}"
+    )
+
+
 def test_select_best_images_diversity(image_agent_with_key):
     """Test select_best_images prefers diversity of authors."""
     available_images = [
@@ -393,7 +606,7 @@ def test_track_download_http_error_handling(mock_llm):
 
     agent = ImageAgent(llm=mock_llm, unsplash_key="test_key")
 
-    with patch("src.agents.image_handler.requests.get") as mock_get:
+    with patch("src.agents.image_handler.requests.Session.get") as mock_get:
         mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
         result = agent.track_download("https://test.com/download")
 
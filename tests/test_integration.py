@@ -39,7 +39,7 @@ def test_orchestrator_initialization(mock_config):
     assert orchestrator.publisher_agent is not None
 
 
-@patch("src.agents.researcher.ChatOpenAI")
+@patch("src.orchestrator.ChatOpenAI")
 @patch("src.agents.researcher.DDGS")
 def test_pipeline_with_mocked_apis(mock_ddgs, mock_llm, mock_config):
     """Test full pipeline with mocked external APIs."""
@@ -48,7 +48,7 @@ def test_pipeline_with_mocked_apis(mock_ddgs, mock_llm, mock_config):
     mock_search.text.return_value = [
         {"title": "Test Article", "body": "Test content", "href": "https://test.com"}
     ]
-    mock_ddgs.return_value.__enter__.return_value = mock_search
+    mock_ddgs.return_value = mock_search
 
     # Mock LLM responses
     mock_llm_instance = Mock()
@@ -1,8 +1,11 @@
 """Tests for logging utilities."""
 
 import logging
+import re
 
-from src.utils.logger import setup_logger
+import pytest
+
+from src.utils.logger import setup_logger, skip_unused_record_details
 
 
 def test_setup_logger_default():
@@ -24,3 +27,59 @@ def test_setup_logger_custom_format():
     custom_format = "%(levelname)s - %(message)s"
     logger = setup_logger(format_string=custom_format)
     assert len(logger.handlers) > 0
+
+
+def test_setup_logger_reuses_handler():
+    """Test repeated setup keeps one handler and applies the new settings."""
+    first = setup_logger(name="reused", level="INFO")
+    handler = first.handlers[0]
+
+    second = setup_logger(
+        name="reused", level="DEBUG", format_string="%(levelname)s - %(message)s"
+    )
+
+    assert second.handlers == [handler]
+    assert handler.level == logging.DEBUG
+    assert handler.formatter._fmt == "%(levelname)s - %(message)s"
+
+
+def test_setup_logger_formats_timestamps_to_the_second():
+    """Test the default format omits milliseconds from timestamps."""
+    logger = setup_logger(name="timestamps")
+    record = logging.LogRecord("timestamps", logging.INFO, __file__, 1, "msg", (), None)
+
+    formatted = logger.handlers[0].format(record)
+
+    assert re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - timestamps", formatted)
+
+
+def test_setup_logger_leaves_global_record_settings(monkeypatch):
+    """Test configuring a logger does not change process-wide logging flags."""
+    monkeypatch.setattr(logging, "logThreads", True)
+    monkeypatch.setattr(logging, "logProcesses", True)
+
+    setup_logger(name="globals")
+
+    assert logging.logThreads and logging.logProcesses
+
+
+@pytest.mark.parametrize(
+    "format_string, log_threads, log_processes",
+    [
+        ("%(message)s", False, False),
+        ("%(threadName)s %(processName)s %(message)s", True, True),
+    ],
+)
+def test_skip_unused_record_details(
+    monkeypatch, format_string, log_threads, log_processes
+):
+    """Test only details the format never prints stop being collected."""
+    monkeypatch.setattr(logging, "logThreads", True)
+    monkeypatch.setattr(logging, "logProcesses", True)
+    monkeypatch.setattr(logging, "logMultiprocessing", True)
+
+    skip_unused_record_details(format_string)
+
+    assert logging.logThreads is log_threads
+    assert logging.logProcesses is log_processes
+    assert logging.logMultiprocessing is log_processes
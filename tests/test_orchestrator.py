@@ -1,6 +1,7 @@
 """Tests for the ContentCreationOrchestrator."""
 
 import tempfile
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -182,3 +183,162 @@ def test_get_summary_with_failed_publication(mock_config):
     # Should mention the failure
     assert "Failed" in summary or "failed" in summary
     assert "Failed to write file" in summary
+
+
+@patch("src.orchestrator.AudienceStrategist")
+@patch("src.orchestrator.ChatOpenAI")
+def test_audience_strategist_uses_json_mode_llm(mock_llm, mock_audience, mock_config):
+    """Test the audience strategist receives an LLM configured for JSON mode."""
+    orchestrator = ContentCreationOrchestrator(mock_config)
+
+    json_mode_calls = [
+        call
+        for call in mock_llm.call_args_list
+        if call[1].get("model_kwargs") == {"response_format": {"type": "json_object"}}
+    ]
+    assert len(json_mode_calls) == 1
+    mock_audience.assert_called_once_with(
+        llm=orchestrator.json_llm, cache=orchestrator.cache
+    )
+
+
+@patch("src.orchestrator.AudienceStrategist")
+@patch("src.orchestrator.ImageAgent")
+@patch("src.orchestrator.WriterAgent")
+@patch("src.orchestrator.ResearchAgent")
+@patch("src.orchestrator.PublisherAgent")
+@patch("src.orchestrator.ChatOpenAI")
+def test_create_content_uses_precomputed_persona(
+    mock_llm,
+    mock_publisher,
+    mock_researcher,
+    mock_writer,
+    mock_image,
+    mock_audience,
+    mock_config,
+):
+    """Test create_content skips audience analysis when a persona is given."""
+    persona = {"persona_name": "Batch Persona"}
+    mock_researcher.return_value.research.return_value = {"sources_count": 0}
+    mock_writer.return_value.write_article.return_value = {"title": "Test"}
+    mock_image.return_value.find_images.return_value = []
+    mock_publisher.return_value.publish.return_value = {}
+
+    orchestrator = ContentCreationOrchestrator(mock_config)
+    results = orchestrator.create_content(topic="Test Topic", persona=persona)
+
+    mock_audience.return_value.analyze.assert_not_called()
+    assert results["stages"]["audience"]["persona_name"] == "Batch Persona"
+    assert mock_writer.return_value.write_article.call_args[1]["persona"] == persona
+
+
+@patch("src.orchestrator.AudienceStrategist")
+@patch("src.orchestrator.ImageAgent")
+@patch("src.orchestrator.WriterAgent")
+@patch("src.orchestrator.ResearchAgent")
+@patch("src.orchestrator.PublisherAgent")
+@patch("src.orchestrator.ChatOpenAI")
+def test_create_content_overlaps_independent_stages(
+    mock_llm,
+    mock_publisher,
+    mock_researcher,
+    mock_writer,
+    mock_image,
+    mock_audience,
+    mock_config,
+):
+    """Test audience runs alongside research, and images alongside writing."""
+    audience_started = threading.Event()
+    images_started = threading.Event()
+
+    def analyze(topic, audience_hint=None):
+        audience_started.set()
+        return {"persona_name": "Concurrent Persona"}
+
+    def research(topic):
+        # Research only finishes once audience analysis is already in flight
+        assert audience_started.wait(timeout=5)
+        return {"analysis": "Research analysis", "sources_count": 1}
+
+    def find_images(topic, article_data):
+        images_started.set()
+        return [{"id": "img"}]
+
+    def write_article(**kwargs):
+        kwargs["on_preview"]("Article opening")
+        # Writing only finishes once the image search is already in flight
+        assert images_started.wait(timeout=5)
+        return {"title": "Test", "word_count": 100}
+
+    mock_audience.return_value.analyze.side_effect = analyze
+    mock_researcher.return_value.research.side_effect = research
+    mock_image.return_value.find_images.side_effect = find_images
+    mock_writer.return_value.write_article.side_effect = write_article
+    mock_publisher.return_value.publish.return_value = {}
+
+    orchestrator = ContentCreationOrchestrator(mock_config)
+    results = orchestrator.create_content(topic="Test Topic")
+
+    assert results["persona"] == {"persona_name": "Concurrent Persona"}
+    assert results["stages"]["images"]["images_found"] == 1
+    mock_image.return_value.find_images.assert_called_once_with(
+        "Test Topic", {"content_preview": "Article opening"}
+    )
+    assert (
+        mock_writer.return_value.write_article.call_args[1]["persona"]
+        == results["persona"]
+    )
+
+
+@patch("src.orchestrator.AudienceStrategist")
+@patch("src.orchestrator.ImageAgent")
+@patch("src.orchestrator.WriterAgent")
+@patch("src.orchestrator.ResearchAgent")
+@patch("src.orchestrator.PublisherAgent")
+@patch("src.orchestrator.ChatOpenAI")
+def test_create_content_reports_each_stage(
+    mock_llm,
+    mock_publisher,
+    mock_researcher,
+    mock_writer,
+    mock_image,
+    mock_audience,
+    mock_config,
+):
+    """Test on_stage receives every stage result as it completes."""
+    mock_audience.return_value.analyze.return_value = {"persona_name": "Reader"}
+    mock_researcher.return_value.research.return_value = {"sources_count": 2}
+    mock_writer.return_value.write_article.return_value = {"title": "Test"}
+    mock_image.return_value.find_images.return_value = []
+    mock_publisher.return_value.publish.return_value = {}
+    reported = []
+
+    orchestrator = ContentCreationOrchestrator(mock_config)
+    results = orchestrator.create_content(
+        topic="Test Topic",
+        on_stage=lambda stage, result: reported.append((stage, result)),
+    )
+
+    assert [stage for stage, _ in reported] == [
+        "audience",
+        "research",
+        "writing",
+        "images",
+        "publishing",
+    ]
+    assert dict(reported) == results["stages"]
+
+
+@patch("src.orchestrator.ImageAgent")
+@patch("src.orchestrator.ChatOpenAI")
+def test_llms_share_one_http_client(mock_llm, mock_image, mock_config):
+    """Test all model instances share the orchestrator's HTTP client."""
+    orchestrator = ContentCreationOrchestrator(mock_config)
+
+    http_clients = [call[1]["http_client"] for call in mock_llm.call_args_list]
+    assert http_clients == [orchestrator.http_client] * len(http_clients)
+
+    orchestrator.close()
+
+    assert orchestrator.http_client.is_closed
+    mock_image.return_value.close.assert_called_once()
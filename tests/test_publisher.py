@@ -54,6 +54,29 @@ def test_save_to_file(sample_article):
             assert metadata["word_count"] == 100
 
 
+def test_save_to_file_sanitizes_filename(sample_article):
+    """Test save_to_file replaces unsafe title characters in the filename."""
+    sample_article["title"] = "Café: AI/ML — What's Next?"
+    with tempfile.TemporaryDirectory() as temp_dir:
+        publisher = PublisherAgent()
+        result = publisher.save_to_file(sample_article, output_dir=temp_dir)
+
+        assert Path(result["markdown_file"]).name == "café__ai_ml___what_s_next_.md"
+
+
+def test_save_to_file_keeps_non_latin_titles_distinct(sample_article):
+    """Test titles in other scripts do not collapse into the same filename."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        publisher = PublisherAgent()
+        names = set()
+        for title in ("人工智能", "机器学习"):
+            sample_article["title"] = title
+            result = publisher.save_to_file(sample_article, output_dir=temp_dir)
+            names.add(Path(result["markdown_file"]).name)
+
+        assert names == {"人工智能.md", "机器学习.md"}
+
+
 def test_publish_file_platform(sample_article):
     """Test publishing to file platform."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -186,3 +209,40 @@ def test_publish_to_medium_exception_handling(sample_article):
     assert result["success"] is False
     assert result["platform"] == "medium"
     assert "API Error" in result["error"]
+
+
+def test_publish_multiple_platforms_preserves_order(sample_article):
+    """Test publishing to several platforms returns results in request order."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        publisher = PublisherAgent(medium_token="test_token")
+        results = publisher.publish(
+            sample_article, platforms=["medium", "unknown", "file"], output_dir=temp_dir
+        )
+
+    assert list(results) == ["medium", "unknown", "file"]
+    assert results["medium"]["success"] is True
+    assert results["unknown"]["success"] is False
+    assert results["file"]["success"] is True
+
+
+def test_publish_empty_platforms(sample_article):
+    """Test publishing with an empty platform list returns no results."""
+    publisher = PublisherAgent()
+
+    assert publisher.publish(sample_article, platforms=[]) == {}
+
+
+def test_save_to_file_metadata_defaults_match_markdown():
+    """Test missing fields use the same defaults in markdown and metadata."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        publisher = PublisherAgent()
+        result = publisher.save_to_file({"content": "Body"}, output_dir=temp_dir)
+
+        assert Path(result["markdown_file"]).name == "untitled.md"
+        raw_metadata = Path(result["metadata_file"]).read_text(encoding="utf-8")
+        metadata = json.loads(raw_metadata)
+
+    assert raw_metadata.endswith("}\n")
+    assert metadata["title"] == "Untitled"
+    assert metadata["tags"] == []
+    assert metadata["word_count"] == 0
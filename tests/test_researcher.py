@@ -1,11 +1,20 @@
 """Tests for the ResearchAgent."""
 
 import json
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
+from ddgs.exceptions import RatelimitException, TimeoutException
 
-from src.agents.researcher import ResearchAgent
+from src.agents.researcher import (
+    ANALYSIS_SYSTEM_PROMPT,
+    MAX_SOURCE_BODY_LENGTH,
+    RESEARCH_BRIEF_FIELDS,
+    RESEARCH_CACHE_TTL,
+    ResearchAgent,
+)
+from src.utils.cache import DiskCache
 
 
 @pytest.fixture
@@ -18,7 +27,7 @@ def research_agent(mock_llm):
 def test_search_web_exception_handling(mock_ddgs, research_agent):
     """Test search_web handles exceptions gracefully."""
     # Mock DDGS to raise an exception
-    mock_ddgs.return_value.__enter__.side_effect = Exception("Network error")
+    mock_ddgs.return_value.text.side_effect = Exception("Network error")
 
     # Should return empty list on exception
     results = research_agent.search_web("test query")
@@ -32,7 +41,7 @@ def test_research_with_empty_search_results(mock_ddgs, research_agent, mock_llm)
     # Mock empty search results
     mock_search = Mock()
     mock_search.text.return_value = []
-    mock_ddgs.return_value.__enter__.return_value = mock_search
+    mock_ddgs.return_value = mock_search
 
     # analyze_topic method returns a plain string
     mock_llm.invoke.return_value.content = "Test analysis"
@@ -60,7 +69,7 @@ def test_research_with_successful_search(mock_ddgs, research_agent, mock_llm):
         {"title": "Article 1", "body": "Content 1", "href": "https://test1.com"},
         {"title": "Article 2", "body": "Content 2", "href": "https://test2.com"},
     ]
-    mock_ddgs.return_value.__enter__.return_value = mock_search
+    mock_ddgs.return_value = mock_search
 
     # Mock analysis response
     analysis_response = Mock()
@@ -78,7 +87,13 @@ def test_research_with_successful_search(mock_ddgs, research_agent, mock_llm):
         }
     )
 
-    mock_llm.invoke.side_effect = [analysis_response, research_brief_response]
+    # Each brief field is extracted separately; answer everything but the analysis
+    # with the full brief so every field finds its key
+    mock_llm.invoke.side_effect = lambda messages: (
+        analysis_response
+        if messages[0].content == ANALYSIS_SYSTEM_PROMPT
+        else research_brief_response
+    )
 
     # Conduct research
     result = research_agent.research("test topic")
@@ -159,3 +174,356 @@ def test_create_research_brief_string_json(mock_ddgs, research_agent, mock_llm):
     assert result["key_definitions"] == {}
     assert result["counter_arguments"] == []
     assert result["raw_sources"] == search_results
+
+
+def test_analyze_topic_caches_deterministic_responses(mock_llm, tmp_path):
+    """Test analyze_topic reuses cached analyses when temperature is zero."""
+    mock_llm.model_name = "gpt-test"
+    mock_llm.temperature = 0
+    mock_llm.invoke.return_value.content = "Cached analysis"
+    agent = ResearchAgent(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+
+    first = agent.analyze_topic("Test Topic")
+    second = agent.analyze_topic("Test Topic")
+
+    assert first["analysis"] == second["analysis"] == "Cached analysis"
+    assert mock_llm.invoke.call_count == 1
+
+
+def test_analyze_topic_skips_cache_when_sampling(mock_llm, tmp_path):
+    """Test analyze_topic always calls the LLM when temperature is non-zero."""
+    mock_llm.model_name = "gpt-test"
+    mock_llm.temperature = 0.7
+    mock_llm.invoke.return_value.content = "Fresh analysis"
+    agent = ResearchAgent(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+
+    agent.analyze_topic("Test Topic")
+    agent.analyze_topic("Test Topic")
+
+    assert mock_llm.invoke.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("src.agents.researcher.DDGS")
+def test_research_overlaps_analysis_and_search(mock_ddgs, research_agent, mock_llm):
+    """Test research runs the topic analysis while the web search is in flight."""
+    search_started = threading.Event()
+    analysis_started = threading.Event()
+
+    def slow_search(query, max_results):
+        search_started.set()
+        assert analysis_started.wait(timeout=5)
+        return []
+
+    def analyze(messages):
+        analysis_started.set()
+        assert search_started.wait(timeout=5)
+        return Mock(content="Concurrent analysis")
+
+    mock_search = Mock()
+    mock_search.text.side_effect = slow_search
+    mock_ddgs.return_value = mock_search
+    mock_llm.invoke.side_effect = analyze
+
+    result = research_agent.research("Test Topic")
+
+    assert result["analysis"] == "Concurrent analysis"
+    assert result["search_results"] == []
+
+
+@patch("src.agents.researcher.DDGS")
+def test_search_web_uses_cache(mock_ddgs, mock_llm, tmp_path):
+    """Test search_web reuses cached results for the same query."""
+    mock_search = Mock()
+    mock_search.text.return_value = [{"title": "Result", "body": "Body", "href": "u"}]
+    mock_ddgs.return_value = mock_search
+    agent = ResearchAgent(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+
+    first = agent.search_web("test query")
+    second = agent.search_web("test query")
+
+    assert first == second == [{"title": "Result", "body": "Body", "href": "u"}]
+    assert mock_search.text.call_count == 1
+
+
+@patch("src.agents.researcher.DDGS")
+def test_search_web_does_not_cache_empty_results(mock_ddgs, mock_llm, tmp_path):
+    """Test search_web retries the search when the previous one found nothing."""
+    mock_search = Mock()
+    mock_search.text.return_value = []
+    mock_ddgs.return_value = mock_search
+    agent = ResearchAgent(llm=mock_llm, cache=DiskCache(str(tmp_path)))
+
+    agent.search_web("test query")
+    agent.search_web("test query")
+
+    assert mock_search.text.call_count == 2
+
+
+@patch("src.agents.researcher.DDGS")
+def test_search_web_reuses_search_client(mock_ddgs, research_agent):
+    """Test search_web creates one DDGS client and reuses it across searches."""
+    mock_ddgs.return_value.text.return_value = []
+
+    research_agent.search_web("first query")
+    research_agent.search_web("second query")
+
+    assert mock_ddgs.call_count == 1
+    assert mock_ddgs.return_value.text.call_count == 2
+
+
+@patch("src.agents.researcher.DDGS")
+def test_search_web_caps_results_at_max_sources(mock_ddgs, research_agent):
+    """Test search_web never returns more results than max_sources."""
+    mock_ddgs.return_value.text.return_value = iter(
+        {"title": f"Result {i}", "href": f"https://{i}.com"} for i in range(20)
+    )
+
+    results = research_agent.search_web("test query")
+
+    assert len(results) == research_agent.max_sources
+
+
+@patch("tenacity.nap.time.sleep")
+@patch("src.agents.researcher.DDGS")
+def test_search_web_retries_timeouts(mock_ddgs, mock_sleep, research_agent):
+    """Test search_web retries a timed-out search with a short jittered wait."""
+    mock_ddgs.return_value.text.side_effect = [
+        TimeoutException("timed out"),
+        [{"title": "Result", "body": "Body", "href": "u"}],
+    ]
+
+    results = research_agent.search_web("test query")
+
+    assert results == [{"title": "Result", "body": "Body", "href": "u"}]
+    assert mock_ddgs.return_value.text.call_count == 2
+    assert 0 <= mock_sleep.call_args[0][0] <= 4
+
+
+@patch("tenacity.nap.time.sleep")
+@patch("src.agents.researcher.DDGS")
+def test_search_web_does_not_retry_permanent_errors(
+    mock_ddgs, mock_sleep, research_agent
+):
+    """Test search_web gives up immediately on rate limits."""
+    mock_ddgs.return_value.text.side_effect = RatelimitException("rate limited")
+
+    assert research_agent.search_web("test query") == []
+    assert mock_ddgs.return_value.text.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_create_research_brief_bounds_sources_sent_to_llm(research_agent, mock_llm):
+    """Test create_research_brief caps both the source count and body length."""
+    mock_llm.invoke.return_value.content = "{}"
+    search_results = [
+        {"title": f"Title {i}", "body": "x" * (MAX_SOURCE_BODY_LENGTH + 500)}
+        for i in range(research_agent.max_sources + 2)
+    ]
+
+    research_agent.create_research_brief("test angle", search_results)
+
+    human_message = mock_llm.invoke.call_args[0][0][-1].content
+    assert human_message.count("Title ") == research_agent.max_sources
+    assert "x" * (MAX_SOURCE_BODY_LENGTH + 1) not in human_message
+
+
+def test_create_research_brief_extracts_fields_separately(research_agent, mock_llm):
+    """Test create_research_brief issues one prompt per field and merges them."""
+    responses = {
+        "key_statistics": '{"key_statistics": ["Stat 1"]}',
+        "expert_quotes": "not valid JSON",
+        "case_studies": '{"case_studies": "not a list"}',
+        "key_definitions": '{"key_definitions": {"term": "definition"}}',
+        "counter_arguments": '{"counter_arguments": ["Counter 1"]}',
+    }
+
+    def respond(messages):
+        field = next(f for f in responses if f'single key "{f}"' in messages[0].content)
+        return Mock(content=responses[field])
+
+    mock_llm.invoke.side_effect = respond
+    search_results = [{"title": "Article 1", "body": "Content 1"}]
+
+    brief = research_agent.create_research_brief("test angle", search_results)
+
+    assert mock_llm.invoke.call_count == len(RESEARCH_BRIEF_FIELDS)
+    assert brief == {
+        "key_statistics": ["Stat 1"],
+        "expert_quotes": [],
+        "case_studies": [],
+        "key_definitions": {"term": "definition"},
+        "counter_arguments": ["Counter 1"],
+        "raw_sources": search_results,
+    }
+
+
+@patch("src.agents.researcher.DDGS")
+def test_search_web_many_merges_results(mock_ddgs, research_agent):
+    """Test search_web_many searches every query and drops duplicate URLs."""
+    mock_search = Mock()
+    mock_search.text.side_effect = lambda query, max_results: [
+        {"title": "Shared", "body": "Body", "href": "https://shared.com"},
+        {"title": query, "body": "Body", "href": f"https://{query}.com"},
+    ]
+    mock_ddgs.return_value = mock_search
+
+    results = research_agent.search_web_many(["alpha", "beta"])
+
+    assert [r["href"] for r in results] == [
+        "https://shared.com",
+        "https://alpha.com",
+        "https://beta.com",
+    ]
+    assert mock_search.text.call_count == 2
+
+
+def test_search_web_many_without_queries(research_agent):
+    """Test search_web_many returns nothing for an empty query list."""
+    assert research_agent.search_web_many([]) == []
+
+
+def test_merge_results_keeps_results_without_urls():
+    """Test merging interleaves queries and only drops results with a seen URL."""
+    merged = ResearchAgent._merge_results(
+        [
+            [{"title": "A1", "href": "a"}, {"title": "A2"}],
+            [{"title": "B1", "href": "a"}, {"title": "B2"}, {"title": "B3"}],
+        ]
+    )
+
+    assert [r["title"] for r in merged] == ["A1", "A2", "B2", "B3"]
+
+
+@patch("src.agents.researcher.DDGS")
+def test_research_searches_analysis_questions(mock_ddgs, research_agent, mock_llm):
+    """Test research also searches the questions raised by the topic analysis."""
+    mock_search = Mock()
+    mock_search.text.side_effect = lambda query, max_results: [
+        {"title": query, "body": "Body", "href": f"https://{query}"}
+    ]
+    mock_ddgs.return_value = mock_search
+    analysis = (
+        "Research questions:\n"
+        "1. **How is AI used in hospitals?**\n"
+        "- Who regulates medical AI?\n"
+        "Subtopics: diagnostics, triage"
+    )
+    mock_llm.invoke.side_effect = lambda messages: Mock(
+        content=analysis if messages[0].content == ANALYSIS_SYSTEM_PROMPT else "{}"
+    )
+
+    result = research_agent.research("AI in healthcare")
+
+    assert [r["title"] for r in result["search_results"]] == [
+        "AI in healthcare",
+        "How is AI used in hospitals?",
+        "Who regulates medical AI?",
+    ]
+    assert result["sources_count"] == 3
+
+
+def test_research_questions_are_capped(research_agent):
+    """Test only a few distinct questions other than the topic are searched."""
+    analysis = "\n".join(
+        ["Topic?", "Topic?"] + [f"- Question {i}?" for i in range(1, 6)]
+    )
+
+    questions = research_agent._research_questions("topic?", analysis)
+
+    assert questions == ["Question 1?", "Question 2?", "Question 3?"]
+
+
+@patch("src.agents.researcher.DDGS")
+def test_research_reuses_results_for_normalized_topic(
+    mock_ddgs, research_agent, mock_llm
+):
+    """Test research is cached per topic, ignoring case and whitespace."""
+    mock_search = Mock()
+    mock_search.text.return_value = [{"title": "A", "body": "B", "href": "u"}]
+    mock_ddgs.return_value = mock_search
+    mock_llm.temperature = 0
+    mock_llm.invoke.return_value.content = "{}"
+
+    first = research_agent.research("Test Topic")
+    second = research_agent.research("  test   TOPIC ")
+
+    assert mock_search.text.call_count == 1
+    assert second == {**first, "topic": "  test   TOPIC "}
+
+
+@patch("src.agents.researcher.DDGS")
+def test_research_cache_is_isolated_from_callers(mock_ddgs, research_agent, mock_llm):
+    """Test mutating returned research does not change later cache hits."""
+    mock_search = Mock()
+    mock_search.text.return_value = [{"title": "A", "body": "B", "href": "u"}]
+    mock_ddgs.return_value = mock_search
+    mock_llm.temperature = 0
+    mock_llm.invoke.return_value.content = "{}"
+
+    first = research_agent.research("Test Topic")
+    first["search_results"].clear()
+    first["research_brief"]["key_statistics"] = ["changed"]
+    second = research_agent.research("Test Topic")
+    second["search_results"].append({"title": "Extra"})
+
+    third = research_agent.research("Test Topic")
+
+    assert mock_search.text.call_count == 1
+    assert third["search_results"] == [{"title": "A", "body": "B", "href": "u"}]
+    assert third["research_brief"]["key_statistics"] != ["changed"]
+
+
+@patch("src.agents.researcher.time.monotonic")
+@patch("src.agents.researcher.DDGS")
+def test_research_cache_expires(mock_ddgs, mock_monotonic, research_agent, mock_llm):
+    """Test cached research is refreshed once its TTL has passed."""
+    mock_search = Mock()
+    mock_search.text.return_value = [{"title": "A", "body": "B", "href": "u"}]
+    mock_ddgs.return_value = mock_search
+    mock_llm.temperature = 0
+    mock_llm.invoke.return_value.content = "{}"
+    mock_monotonic.return_value = 1000.0
+
+    research_agent.research("Test Topic")
+    mock_monotonic.return_value += RESEARCH_CACHE_TTL + 1
+    research_agent.research("Test Topic")
+
+    assert mock_search.text.call_count == 2
+
+
+@patch("src.agents.researcher.DDGS")
+def test_research_persists_results_to_disk_cache(mock_ddgs, mock_llm, tmp_path):
+    """Test research is reused across agents via the disk cache."""
+    mock_search = Mock()
+    mock_search.text.return_value = [{"title": "A", "body": "B", "href": "u"}]
+    mock_ddgs.return_value = mock_search
+    mock_llm.model_name = "gpt-test"
+    mock_llm.temperature = 0
+    mock_llm.invoke.return_value.content = "{}"
+    cache = DiskCache(str(tmp_path))
+
+    first = ResearchAgent(llm=mock_llm, cache=cache).research("Test Topic")
+    second = ResearchAgent(llm=mock_llm, cache=cache).research("test topic")
+
+    assert mock_search.text.call_count == 1
+    assert second == {**first, "topic": "test topic"}
+
+
+@patch("src.agents.researcher.DDGS")
+def test_research_is_not_reused_when_sampling(mock_ddgs, mock_llm, tmp_path):
+    """Test research from a sampling model is never served from a cache."""
+    mock_search = Mock()
+    mock_search.text.return_value = [{"title": "A", "body": "B", "href": "u"}]
+    mock_ddgs.return_value = mock_search
+    mock_llm.temperature = 0.7
+    mock_llm.invoke.return_value.content = "{}"
+    cache = DiskCache(str(tmp_path))
+    agent = ResearchAgent(llm=mock_llm, cache=cache)
+
+    agent.research("Test Topic")
+    agent.research("Test Topic")
+    ResearchAgent(llm=mock_llm, cache=cache).research("Test Topic")
+
+    # Search results have their own cache; the LLM work is redone every time
+    assert mock_llm.invoke.call_count == 3 * (1 + len(RESEARCH_BRIEF_FIELDS))
@@ -1,10 +1,19 @@
 """Tests for the WriterAgent."""
 
-from unittest.mock import Mock
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
 import pytest
 
-from src.agents.writer import WriterAgent
+from src.agents.writer import (
+    CONTENT_PREVIEW_LENGTH,
+    META_PREVIEW_LENGTH,
+    OUTLINE_SYSTEM_PROMPT,
+    PersonaView,
+    WriterAgent,
+    _article_system_template,
+)
 
 
 @pytest.fixture
@@ -66,6 +75,15 @@ def test_extract_title_with_whitespace(writer_agent):
     assert title == "Title With Spaces"
 
 
+def test_extract_title_skips_empty_and_indented_headings(writer_agent):
+    """Test _extract_title ignores empty headings and accepts indented ones."""
+    content = "Intro line\n# \n  # Indented Title\r\n\nContent."
+
+    title = writer_agent._extract_title(content)
+
+    assert title == "Indented Title"
+
+
 def test_build_persona_context_without_persona(writer_agent):
     """Test _build_persona_context returns empty string for None persona."""
     result = writer_agent._build_persona_context(None)
@@ -124,6 +142,70 @@ def test_build_persona_context_full(writer_agent):
     assert "Reader Time Available: 15 minutes" in result
 
 
+def test_format_research_brief(writer_agent):
+    """Test _format_research_brief renders each populated section in order."""
+    research_brief = {
+        "key_statistics": ["Stat 1", {"statistic": "Stat 2"}],
+        "expert_quotes": [{"quote": "Quote 1"}],
+        "case_studies": [],
+        "key_definitions": {"Term": "Definition"},
+        "counter_arguments": ["Counter 1"],
+    }
+
+    result = writer_agent._format_research_brief(research_brief)
+
+    assert result == (
+        "Key Statistics:\n- Stat 1\n- Stat 2"
+        "\n\nExpert Quotes:\n- Quote 1"
+        "\n\nKey Definitions:\n- Term: Definition"
+        "\n\nCounter Arguments:\n- Counter 1"
+    )
+
+
+def test_format_research_brief_without_statistics(writer_agent):
+    """Test _format_research_brief does not lead with a blank line."""
+    result = writer_agent._format_research_brief({"counter_arguments": ["Counter"]})
+
+    assert result == "Counter Arguments:\n- Counter"
+    assert writer_agent._format_research_brief({}) == ""
+
+
+def test_persona_view_from_dict():
+    """Test PersonaView flattens nested persona fields and tolerates bad ones."""
+    view = PersonaView.from_dict(
+        {
+            "persona_name": "Tech Lead",
+            "goals": {"primary_goal": "Learn best practices"},
+            "knowledge_state": "not a dict",
+            "content_preferences": {"tone": "professional"},
+        }
+    )
+
+    assert view == PersonaView(
+        persona_name="Tech Lead",
+        primary_goal="Learn best practices",
+        tone="professional",
+    )
+
+
+def test_build_persona_context_accepts_persona_view(writer_agent):
+    """Test _build_persona_context renders a PersonaView like its source dict."""
+    persona = {
+        "persona_name": "Tech Lead",
+        "pain_points": ["Time constraints"],
+        "reading_context": {"attention_span": "15 minutes"},
+    }
+
+    result = writer_agent._build_persona_context(
+        PersonaView.from_dict(persona), include_content_prefs=True
+    )
+
+    assert result == writer_agent._build_persona_context(
+        persona, include_content_prefs=True
+    )
+    assert "Reader Time Available: 15 minutes" in result
+
+
 def test_build_persona_context_with_non_string_pain_points(writer_agent):
     """Test _build_persona_context handles non-string pain points."""
     persona = {
@@ -217,6 +299,22 @@ def test_create_outline_with_partial_persona(writer_agent, mock_llm):
     assert mock_llm.invoke.called
 
 
+def test_create_outline_sends_messages_directly(writer_agent, mock_llm):
+    """Test the outline prompt is sent as plain messages with the persona."""
+    writer_agent.create_outline(
+        topic="Edge {Computing}",
+        research="Research",
+        persona={"persona_name": "Platform Engineer"},
+    )
+
+    system, human = mock_llm.invoke.call_args[0][0]
+    assert system.content == (
+        OUTLINE_SYSTEM_PROMPT + "\nTailor the structure to the target audience: "
+        "\nTarget Audience: Platform Engineer"
+    )
+    assert human.content == "Topic: Edge {Computing}\n\nResearch:\nResearch"
+
+
 def test_create_outline_with_empty_persona(writer_agent, mock_llm):
     """Test create_outline with an empty persona dict."""
     # Mock response
@@ -242,28 +340,22 @@ def test_create_outline_with_empty_persona(writer_agent, mock_llm):
 
 def test_write_article(writer_agent, mock_llm):
     """Test write_article creates article with sections."""
-    # Mock responses for outline, sections, meta, and tags
+    # Mock responses for outline, article, and metadata
     outline_response = Mock()
     outline_response.content = "## Section 1\nDescription\n\n## Section 2\nDescription"
 
-    section1_response = Mock()
-    section1_response.content = "Section 1 content"
-
-    section2_response = Mock()
-    section2_response.content = "Section 2 content"
+    article_response = Mock()
+    article_response.content = "# Test Title\n\nArticle content"
 
-    meta_response = Mock()
-    meta_response.content = "Article meta description"
-
-    tags_response = Mock()
-    tags_response.content = "tag1, tag2, tag3"
+    metadata_response = Mock()
+    metadata_response.content = (
+        '{"meta_description": "Article meta description", "tags": ["tag1", "tag2"]}'
+    )
 
     mock_llm.invoke.side_effect = [
         outline_response,
-        section1_response,
-        section2_response,
-        meta_response,
-        tags_response,
+        article_response,
+        metadata_response,
     ]
 
     research_data = {
@@ -288,6 +380,196 @@ def test_write_article(writer_agent, mock_llm):
 
     assert "content" in result
     assert "title" in result
-    assert "meta_description" in result
-    assert "tags" in result
+    assert result["meta_description"] == "Article meta description"
+    assert result["tags"] == ["tag1", "tag2"]
     assert result["word_count"] > 0
+    assert result["content_preview"] == result["content"][:1500]
+
+
+def test_generate_metadata_parses_json(writer_agent, mock_llm):
+    """Test the meta description and tags come back from one JSON response."""
+    mock_llm.invoke.return_value.content = (
+        '{"meta_description": " Meta ", "tags": ["a", " b ", ""'
+        ', "c", "d", "e", "f", "g", "h", "i"]}'
+    )
+
+    meta_description, tags = writer_agent._generate_metadata(
+        "Test Topic", "Content", "Research"
+    )
+
+    assert mock_llm.invoke.call_count == 1
+    assert meta_description == "Meta"
+    assert tags == ["a", "b", "c", "d", "e", "f", "g", "h"]
+
+
+def test_generate_metadata_splits_tag_string(writer_agent, mock_llm):
+    """Test tags returned as one delimited string are split and cleaned."""
+    mock_llm.invoke.return_value.content = (
+        '{"meta_description": "Meta", "tags": "tag1, tag2; #tag3\\n- tag4,,"}'
+    )
+
+    _, tags = writer_agent._generate_metadata("Test Topic", "Content", "")
+
+    assert tags == ["tag1", "tag2", "tag3", "tag4"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '```json\n{"meta_description": "Meta", "tags": ["a", "b"]}\n```',
+        'Here is the metadata:\n{"meta_description": "Meta", "tags": ["a", "b"]}',
+    ],
+)
+def test_generate_metadata_extracts_wrapped_json(writer_agent, mock_llm, content):
+    """Test JSON in a code fence or surrounded by prose is still parsed."""
+    mock_llm.invoke.return_value.content = content
+
+    assert writer_agent._generate_metadata("Test Topic", "Content", "") == (
+        "Meta",
+        ["a", "b"],
+    )
+
+
+def test_generate_metadata_uses_json_model(mock_llm):
+    """Test metadata is requested from the JSON-mode model when one is given."""
+    json_llm = Mock()
+    json_llm.invoke.return_value.content = '{"meta_description": "M", "tags": []}'
+    agent = WriterAgent(llm=mock_llm, json_llm=json_llm)
+
+    assert agent._generate_metadata("Test Topic", "Content", "") == ("M", [])
+    mock_llm.invoke.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["not valid JSON", '["tag1"]', '{"meta_description": 1, "tags": 2}'],
+)
+def test_generate_metadata_falls_back_on_bad_response(writer_agent, mock_llm, content):
+    """Test unusable metadata responses yield empty defaults."""
+    mock_llm.invoke.return_value.content = content
+
+    assert writer_agent._generate_metadata("Test Topic", "Content", "") == ("", [])
+
+
+def test_write_article_counts_words_across_whitespace(writer_agent, mock_llm):
+    """Test word_count treats any run of whitespace as one separator."""
+    mock_llm.stream.side_effect = lambda messages: iter(
+        [Mock(content="# Title\n\nOne  two\tthree\n")]
+    )
+
+    result = writer_agent.write_article("Test Topic", {"research_brief": {}})
+
+    assert result["word_count"] == 5
+
+
+def test_write_article_reuses_prompt_template_for_same_shape(writer_agent, mock_llm):
+    """Test articles with the same prompt shape share one template."""
+    system_messages = []
+
+    def stream(messages):
+        system_messages.append(messages[0])
+        yield Mock(content="# Title\n\nBody")
+
+    mock_llm.stream.side_effect = stream
+    _article_system_template.cache_clear()
+
+    for style, reader in (("casual", "Tech Lead"), ("formal", "Data Analyst")):
+        writer_agent.write_article(
+            "Test Topic",
+            {"research_brief": {}},
+            style=style,
+            persona={"persona_name": reader},
+        )
+
+    assert _article_system_template.cache_info().misses == 1
+    assert system_messages[0] is not system_messages[1]
+    assert system_messages[0].content.endswith(
+        "\nWriting Style: casual\nTarget Reader: Tech Lead"
+    )
+    assert system_messages[1].content.endswith(
+        "\nWriting Style: formal\nTarget Reader: Data Analyst"
+    )
+
+
+def test_write_article_starts_metadata_while_streaming(writer_agent, mock_llm):
+    """Test the metadata is requested before the article finishes."""
+    meta_started = threading.Event()
+    opening = "# Streamed Title\n\n" + "word " * META_PREVIEW_LENGTH
+
+    def respond(messages):
+        if "meta_description" in messages[0].content:
+            meta_started.set()
+            assert opening[:META_PREVIEW_LENGTH] in messages[-1].content
+            return Mock(content='{"meta_description": "Meta", "tags": ["tag1"]}')
+        return Mock(content="## Outline")
+
+    def stream(messages):
+        yield Mock(content=opening)
+        # The rest of the article only arrives once the metadata request is out
+        assert meta_started.wait(timeout=5)
+        yield Mock(content="closing paragraph")
+
+    mock_llm.invoke.side_effect = respond
+    mock_llm.stream.side_effect = stream
+
+    result = writer_agent.write_article("Test Topic", {"research_brief": {}})
+
+    assert result["content"] == opening + "closing paragraph"
+    assert result["title"] == "Streamed Title"
+    assert result["meta_description"] == "Meta"
+    assert result["tags"] == ["tag1"]
+
+
+def test_write_article_reports_preview_once_streamed(writer_agent, mock_llm):
+    """Test on_preview gets the opening before the article finishes."""
+    previews = []
+    opening = "# Title\n\n" + "word " * CONTENT_PREVIEW_LENGTH
+
+    def stream(messages):
+        yield Mock(content=opening)
+        # The rest of the article only arrives once the preview was reported
+        assert previews == [opening[:CONTENT_PREVIEW_LENGTH]]
+        yield Mock(content="closing paragraph")
+
+    mock_llm.stream.side_effect = stream
+
+    result = writer_agent.write_article(
+        "Test Topic", {"research_brief": {}}, on_preview=previews.append
+    )
+
+    assert previews == [result["content_preview"]]
+
+
+def test_write_article_reports_preview_of_short_article(writer_agent, mock_llm):
+    """Test on_preview still fires when the article is shorter than a preview."""
+    previews = []
+    mock_llm.invoke.return_value.content = "# Short"
+
+    writer_agent.write_article(
+        "Test Topic", {"research_brief": {}}, on_preview=previews.append
+    )
+
+    assert previews == ["# Short"]
+
+
+def test_write_article_shuts_down_executor_when_stream_fails(writer_agent, mock_llm):
+    """Test a stream that fails mid-article does not leave the executor running."""
+    executors = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    def stream(messages):
+        yield Mock(content="word " * META_PREVIEW_LENGTH)
+        raise ConnectionError("stream dropped")
+
+    mock_llm.stream.side_effect = stream
+
+    with patch("src.agents.writer.ThreadPoolExecutor", RecordingExecutor):
+        with pytest.raises(ConnectionError):
+            writer_agent.write_article("Test Topic", {"research_brief": {}})
+
+    assert len(executors) == 1
+    assert executors[0]._shutdown